@@ -1,7 +1,7 @@
 from nominal._utils.dataclass_tools import LazyField, update_dataclass
 from nominal._utils.deprecation_tools import deprecate_arguments, warn_on_deprecated_argument
 from nominal._utils.iterator_tools import batched
-from nominal._utils.streaming_tools import reader_writer
+from nominal._utils.streaming_tools import pipe_from_writer, reader_writer, write_gzip_members
 from nominal._utils.timing_tools import LogTiming
 
 __all__ = [
@@ -9,7 +9,9 @@ __all__ = [
     "deprecate_arguments",
     "LazyField",
     "LogTiming",
+    "pipe_from_writer",
     "reader_writer",
     "update_dataclass",
     "warn_on_deprecated_argument",
+    "write_gzip_members",
 ]
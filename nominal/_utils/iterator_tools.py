@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import threading
 from itertools import islice
-from typing import Iterable, TypeVar
+from typing import Callable, Generic, Iterable, Iterator, Sequence, TypeVar
 
 T = TypeVar("T")
+U = TypeVar("U")
+
+# Default number of calls `map_concurrently` makes at once
+DEFAULT_MAP_WORKERS = 16
 
 
 def batched(iterable: Iterable[T], n: int, *, strict: bool = False) -> Iterable[tuple[T, ...]]:
@@ -28,3 +35,130 @@ def batched(iterable: Iterable[T], n: int, *, strict: bool = False) -> Iterable[
         if strict and len(batch) != n:
             raise ValueError("batched(): incomplete batch")
         yield batch
+
+
+class _Lane(Generic[T]):
+    """Items produced by one source of `chain_concurrently`, buffered until the consumer reaches that source."""
+
+    def __init__(self) -> None:
+        self.items: collections.deque[T] = collections.deque()
+        self.done = False
+        self.error: BaseException | None = None
+
+
+class _ConcurrentChain(Generic[T]):
+    def __init__(self, sources: Sequence[Callable[[], Iterable[T]]], max_workers: int, max_buffered: int) -> None:
+        self._pending_sources = collections.deque(sources)
+        self._max_workers = max_workers
+        self._max_buffered = max_buffered
+        self._lanes: collections.deque[_Lane[T]] = collections.deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+
+    def _run(self, lane: _Lane[T], source: Callable[[], Iterable[T]]) -> None:
+        try:
+            for item in source():
+                with self._cond:
+                    while len(lane.items) >= self._max_buffered and not self._stopped:
+                        self._cond.wait()
+                    if self._stopped:
+                        return
+                    lane.items.append(item)
+                    self._cond.notify_all()
+        except BaseException as e:
+            lane.error = e
+        finally:
+            with self._cond:
+                lane.done = True
+                self._cond.notify_all()
+
+    def __iter__(self) -> Iterator[T]:
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="chain-concurrently"
+        )
+
+        def start_next() -> None:
+            if self._pending_sources:
+                lane: _Lane[T] = _Lane()
+                self._lanes.append(lane)
+                pool.submit(self._run, lane, self._pending_sources.popleft())
+
+        try:
+            for _ in range(self._max_workers):
+                start_next()
+            while self._lanes:
+                lane = self._lanes[0]
+                with self._cond:
+                    while not lane.items and not lane.done:
+                        self._cond.wait()
+                    if lane.items:
+                        item = lane.items.popleft()
+                        self._cond.notify_all()
+                    elif lane.error is not None:
+                        raise lane.error
+                    else:
+                        self._lanes.popleft()
+                        start_next()
+                        continue
+                yield item
+        finally:
+            with self._cond:
+                self._stopped = True
+                self._cond.notify_all()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def chain_concurrently(
+    sources: Sequence[Callable[[], Iterable[T]]], *, max_workers: int, max_buffered: int = 8
+) -> Iterator[T]:
+    """Like `itertools.chain`, but running up to `max_workers` of the sources concurrently.
+
+    Items are yielded in the same order as chaining the sources one after the other. Sources are started
+    in order as earlier ones finish, and each source that is ahead of the consumer buffers at most
+    `max_buffered` items before it pauses, which bounds memory use regardless of how much each source produces.
+
+    Args:
+        sources: Callables returning the iterables to chain; each is called on a worker thread.
+        max_workers: Maximum number of sources being iterated at once.
+        max_buffered: Maximum number of items buffered per source ahead of the consumer.
+
+    Returns:
+        An iterator over the items of every source, in order. If a source raises, the items it produced
+        before failing are yielded and then its exception is re-raised.
+
+    Raises:
+        ValueError: If max_workers or max_buffered is less than one.
+    """
+    if max_workers < 1 or max_buffered < 1:
+        raise ValueError("max_workers and max_buffered must be at least one")
+    return iter(_ConcurrentChain(sources, max_workers, max_buffered))
+
+
+def map_concurrently(
+    fn: Callable[[T], U], items: Sequence[T], *, max_workers: int = DEFAULT_MAP_WORKERS, thread_name_prefix: str = ""
+) -> list[U]:
+    """Like `map`, but calling `fn` on up to `max_workers` items at once on a pool of threads.
+
+    Intended for fanning out independent requests, e.g. fetching many resources from an API without a batch get.
+    A single item is mapped on the calling thread.
+
+    Args:
+        fn: Function to apply to each item; called on a worker thread.
+        items: Items to apply `fn` to.
+        max_workers: Maximum number of calls to `fn` in flight at once.
+        thread_name_prefix: Prefix for the names of the worker threads.
+
+    Returns:
+        The results of `fn`, in the same order as `items`. If any call raises, its exception is re-raised.
+
+    Raises:
+        ValueError: If max_workers is less than one.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least one")
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(items), max_workers), thread_name_prefix=thread_name_prefix
+    ) as pool:
+        return list(pool.map(fn, items))
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta
+
+
+class PollBackoff:
+    """Waits between polls of a long-running operation, backing off exponentially up to a limit.
+
+    The first wait is `interval`, and each wait after it is twice the previous one, up to `max_interval`. With
+    `jitter`, each wait is randomly shortened by up to half, so that many clients polling at once don't do so in
+    lockstep. Waits are cut short at `timeout`, after which `wait` reports that the caller should give up.
+
+    Examples:
+        >>> backoff = PollBackoff(timedelta(seconds=1), timedelta(seconds=30), timeout=timedelta(minutes=5))
+        >>> while not done():
+        ...     if not backoff.wait():
+        ...         raise TimeoutError("still not done after 5 minutes")
+    """
+
+    def __init__(
+        self,
+        interval: timedelta,
+        max_interval: timedelta,
+        *,
+        timeout: timedelta | None = None,
+        jitter: bool = False,
+    ):
+        """Start the timeout, if any, and reset the backoff to `interval`.
+
+        Args:
+            interval: First wait between polls.
+            max_interval: Longest wait between polls.
+            timeout: How long after construction to stop waiting; None waits indefinitely.
+            jitter: Whether to randomly shorten each wait by up to half.
+        """
+        self._wait = interval.total_seconds()
+        self._max_wait = max_interval.total_seconds()
+        self._deadline = None if timeout is None else time.monotonic() + timeout.total_seconds()
+        self._jitter = jitter
+
+    def wait(self) -> bool:
+        """Sleep until the next poll is due, then back off the wait after it.
+
+        Returns:
+            False, without sleeping, if the timeout has already elapsed; otherwise True once the wait is over.
+        """
+        sleep_for = random.uniform(self._wait / 2, self._wait) if self._jitter else self._wait
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            sleep_for = min(sleep_for, remaining)
+        time.sleep(sleep_for)
+        self._wait = min(self._wait * 2, self._max_wait)
+        return True
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import gzip
+import io
 import logging
 import os
+import threading
 from contextlib import contextmanager
-from typing import BinaryIO, Iterator
+from typing import BinaryIO, Callable, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -18,3 +23,100 @@ def reader_writer() -> Iterator[tuple[BinaryIO, BinaryIO]]:
     finally:
         w.close()
         r.close()
+
+
+class _WriterPipeReader(io.RawIOBase):
+    """Read end of a pipe that raises the writer's error, if any, in place of end-of-file."""
+
+    def __init__(self, raw: io.RawIOBase, errors: list[BaseException]) -> None:
+        """Read from `raw`, raising the first of `errors` once it is exhausted."""
+        super().__init__()
+        self._raw = raw
+        self._errors = errors
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        n = self._raw.readinto(buffer)
+        if not n and self._errors:
+            raise self._errors[0]
+        return n or 0
+
+    def close(self) -> None:
+        self._raw.close()
+        super().close()
+
+
+@contextmanager
+def pipe_from_writer(write: Callable[[BinaryIO], None]) -> Iterator[BinaryIO]:
+    """Run `write` on a background thread into a pipe, yielding a binary stream reading what it writes.
+
+    If `write` raises, reading the stream raises the same exception once everything written before it has been
+    read, so a consumer such as an upload fails rather than taking the truncated output to be complete. The
+    exception is also raised on exit, if the body did not raise.
+    """
+    rd, wd = os.pipe()
+    w = open(wd, "wb")
+    errors: list[BaseException] = []
+
+    def write_and_close() -> None:
+        try:
+            write(w)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            w.close()
+
+    reader = io.BufferedReader(_WriterPipeReader(open(rd, "rb", buffering=0), errors))
+    thread = threading.Thread(target=write_and_close, name="nominal-pipe-writer", daemon=True)
+    thread.start()
+    try:
+        yield reader
+    finally:
+        # closing the read end first unblocks a writer whose output is no longer being read
+        reader.close()
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def write_gzip_members(
+    chunks: Iterable[bytes], w: BinaryIO, *, max_workers: int | None = None, compresslevel: int = 9
+) -> None:
+    """Gzip each chunk as a separate member on a pool of threads, writing the members to `w` in order.
+
+    Concatenated gzip members decompress to the concatenation of their contents, so the output is a single valid
+    gzip file. zlib releases the GIL while compressing, so chunks are compressed in parallel with each other
+    and with producing the next chunks. At most `2 * max_workers` chunks are held at once.
+
+    If producing, compressing, or writing a chunk fails, the output ends after the last complete member; when
+    streaming to a consumer, use `pipe_from_writer` so that the failure reaches it.
+
+    Args:
+        chunks: Data to compress, in order.
+        w: Binary stream to write the compressed members to; it is left open.
+        max_workers: Maximum number of chunks compressed at once. Defaults to the number of CPUs.
+        compresslevel: zlib compression level, from 0 (none) to 9 (smallest).
+
+    Raises:
+        ValueError: If max_workers is less than one.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least one")
+
+    pending: collections.deque[concurrent.futures.Future[bytes]] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="nominal-gzip") as pool:
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(gzip.compress, chunk, compresslevel))
+                if len(pending) >= 2 * max_workers:
+                    w.write(pending.popleft().result())
+            while pending:
+                w.write(pending.popleft().result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
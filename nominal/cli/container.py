@@ -10,6 +10,7 @@ import click
 from nominal import ts
 from nominal.cli.util.format import emit_table, table_data_to_string
 from nominal.cli.util.global_decorators import client_options, global_options
+from nominal.core._utils.upload_cache import UploadCache
 from nominal.core.client import NominalClient
 from nominal.core.container_image import (
     REGISTERABLE_OUTPUT_FORMATS,
@@ -148,6 +149,7 @@ def unarchive(rid: str, client: NominalClient) -> None:
 
 _TIMESTAMP_TYPE_CHOICES = get_args(ts._LiteralAbsolute)
 _OUTPUT_FORMAT_CHOICES = tuple(sorted(fmt.name.lower() for fmt in REGISTERABLE_OUTPUT_FORMATS))
+_DEFAULT_UPLOAD_CACHE_PATH = pathlib.Path("~/.cache/nominal/container-image-uploads.json").expanduser()
 
 
 @extractor_cmd.command("register-image")
@@ -185,6 +187,14 @@ _OUTPUT_FORMAT_CHOICES = tuple(sorted(fmt.name.lower() for fmt in REGISTERABLE_O
     type=click.Choice(_OUTPUT_FORMAT_CHOICES, case_sensitive=False),
     help="file format the extractor writes  [default: parquet]",
 )
+@click.option(
+    "--upload-cache",
+    type=click.Path(dir_okay=False, resolve_path=True, path_type=pathlib.Path),
+    default=_DEFAULT_UPLOAD_CACHE_PATH,
+    show_default=True,
+    help="JSON file recording uploaded tarballs by content digest, so an unchanged image is not uploaded again",
+)
+@click.option("--no-upload-cache", is_flag=True, help="always upload the tarball, without consulting the upload cache")
 @click.option("--wait/--no-wait", default=True, show_default=True, help="wait until the image is READY")
 @client_options
 @global_options
@@ -196,6 +206,8 @@ def register_image(
     timestamp_column: str | None,
     timestamp_type: str | None,
     output_format: str | None,
+    upload_cache: pathlib.Path,
+    no_upload_cache: bool,
     wait: bool,
     client: NominalClient,
 ) -> None:
@@ -233,6 +245,7 @@ def register_image(
         default_timestamp_column=timestamp_column,
         default_timestamp_type=cast(ts._AnyTimestampType, timestamp_type),
         output_format=format_enum if format_enum is not None else FileOutputFormat.PARQUET,
+        upload_cache=None if no_upload_cache else UploadCache(upload_cache),
     )
     if wait:
         click.secho(f"Waiting for image {image.rid} ({image.tag}) to become READY...", fg="cyan", err=True)
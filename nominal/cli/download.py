@@ -5,9 +5,13 @@ exact-match queries → download to disk for users to open in matlab.
 from __future__ import annotations
 
 import abc
+import concurrent.futures
+import dataclasses
 import datetime
+import json
 import logging
 import pathlib
+import shutil
 import warnings
 from typing import Any, List, Mapping, Optional, Sequence
 
@@ -21,6 +25,7 @@ from rich.prompt import Confirm, IntPrompt, Prompt
 from rich.style import Style
 from rich.syntax import Syntax
 from rich.table import Column, Table
+from typing_extensions import Self
 
 from nominal.cli.util.global_decorators import client_options, global_options
 from nominal.core import Asset, Channel, Dataset, Event, NominalClient, Run
@@ -29,6 +34,9 @@ from nominal.thirdparty.polars.polars_export_handler import PolarsExportHandler
 
 logger = logging.getLogger(__name__)
 
+# Rows per row group when assembling a single-file Parquet download
+SINGLE_FILE_ROW_GROUP_SIZE = 1_000_000
+
 
 # --------------------------------------------------------------------------------------
 # UI helpers
@@ -69,6 +77,74 @@ def _normalize_duration_text(s: str) -> str:
     return " ".join(s.split())
 
 
+# --------------------------------------------------------------------------------------
+# Resumable download state
+# --------------------------------------------------------------------------------------
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompletedSlice:
+    """A time slice that was fully downloaded, and the index of the part file holding it (None if no data)."""
+
+    start_ns: int
+    end_ns: int
+    part_idx: int | None
+
+
+@dataclasses.dataclass
+class _DownloadManifest:
+    """Records which time slices of a download are on disk, so that re-running the same download resumes it."""
+
+    dataset_rid: str
+    channel_names: list[str]
+    tags: dict[str, str]
+    start_ns: int
+    end_ns: int
+    file_format: str
+    completed: list[_CompletedSlice] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> Self | None:
+        try:
+            raw = json.loads(path.read_text())
+            raw["completed"] = [_CompletedSlice(**completed) for completed in raw["completed"]]
+            return cls(**raw)
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError, KeyError) as ex:
+            logger.warning("Ignoring unreadable download manifest %s: %s", path, ex)
+            return None
+
+    def save(self, path: pathlib.Path) -> None:
+        # Write-then-rename so an interrupted save never leaves a truncated manifest behind
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(dataclasses.asdict(self), indent=2))
+        tmp_path.replace(path)
+
+    def is_same_download(self, other: _DownloadManifest) -> bool:
+        return dataclasses.replace(self, completed=[]) == dataclasses.replace(other, completed=[])
+
+    def remaining_ranges(self) -> list[tuple[int, int]]:
+        """Time ranges within [start, end) not yet covered by a completed slice."""
+        remaining = []
+        cursor = self.start_ns
+        for completed in sorted(self.completed, key=lambda c: c.start_ns):
+            if completed.start_ns > cursor:
+                remaining.append((cursor, completed.start_ns))
+            cursor = max(cursor, completed.end_ns)
+        if cursor < self.end_ns:
+            remaining.append((cursor, self.end_ns))
+        return remaining
+
+    def part_indices(self) -> list[int]:
+        """Indices of the recorded part files, in time order."""
+        return [
+            completed.part_idx
+            for completed in sorted(self.completed, key=lambda c: c.start_ns)
+            if completed.part_idx is not None
+        ]
+
+
 class DataDownloader(abc.ABC):
     def __init__(self, client: NominalClient, console: Console):
         """Base class for downloading data to disks from the Nominal API
@@ -404,7 +480,7 @@ class DataDownloader(abc.ABC):
                 style=Style(color="red"),
             )
 
-    def download(self, channels_per_request: int, points_per_file: int) -> None:
+    def download(self, channels_per_request: int, points_per_file: int, writer_threads: int = 2) -> None:
         # Select asset to download from
         asset = self._select_asset()
         if not asset:
@@ -456,21 +532,146 @@ class DataDownloader(abc.ABC):
             self._console.print("OK! Exiting...")
             return
 
-        # 7) Download
+        # 7) Download, resuming a previous interrupted download of the same data if there is one
         dataset_prefix = dataset.rid.split(".")[-1]
+        manifest_path = out_dir / f"{dataset_prefix}-download-manifest.json"
+        manifest = self._resume_or_start_manifest(
+            manifest_path,
+            _DownloadManifest(
+                dataset_rid=dataset.rid,
+                channel_names=sorted(channel.name for channel in channels),
+                tags=dict(scope_tags),
+                start_ns=int(start.timestamp() * 1e9),
+                end_ns=int(end.timestamp() * 1e9),
+                file_format=self.file_extension,
+            ),
+        )
+        parts_dir = self.parts_directory(out_dir, dataset_prefix)
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        if not self._remove_stale_parts(manifest, parts_dir, dataset_prefix):
+            self._console.print("OK! Exiting...")
+            return
+
         exporter = PolarsExportHandler(
             self._client, points_per_dataframe=points_per_file, channels_per_request=channels_per_request
         )
         with self._console.status("Downloading...", spinner="bouncingBar"):
-            for idx, df in enumerate(
-                exporter.export(
-                    channels, int(start.timestamp() * 1e9), int(end.timestamp() * 1e9), scope_tags, join_batches=True
-                )
+            self._download_slices(
+                exporter, channels, scope_tags, manifest, manifest_path, parts_dir, dataset_prefix, writer_threads
+            )
+
+        remaining = manifest.remaining_ranges()
+        if remaining:
+            self._console.print(
+                f"{len(remaining)} time range(s) failed to download. Re-run the same download to resume.",
+                style=Style(bold=True, color="red"),
+            )
+        else:
+            self.finalize(manifest.part_indices(), out_dir, dataset_prefix)
+            manifest_path.unlink()
+            self.print_instructions(out_dir, dataset_prefix)
+
+    def _resume_or_start_manifest(self, path: pathlib.Path, requested: _DownloadManifest) -> _DownloadManifest:
+        previous = _DownloadManifest.load(path)
+        if previous is not None:
+            if not previous.is_same_download(requested):
+                logger.warning("Found a manifest for a different download in the output directory, starting over")
+            elif Confirm.ask(
+                f"Found an interrupted download with {len(previous.completed)} completed time slice(s). Resume it?",
+                default=True,
+                show_default=True,
             ):
-                out_path = self.write_dataframe(df, idx, out_dir, dataset_prefix)
-                logger.debug("Wrote dataframe %d to %s", idx, out_path)
+                return previous
+
+        requested.save(path)
+        return requested
+
+    def _part_path(self, directory: pathlib.Path, prefix: str, part_idx: int) -> pathlib.Path:
+        return directory / f"{prefix}-part_{part_idx}.{self.file_extension}"
+
+    def _remove_stale_parts(self, manifest: _DownloadManifest, directory: pathlib.Path, prefix: str) -> bool:
+        """Remove part files not recorded in the manifest, which would otherwise be mixed into the download.
 
-        self.print_instructions(out_dir, dataset_prefix)
+        Returns False if the user declined to remove them.
+        """
+        recorded = {self._part_path(directory, prefix, idx) for idx in manifest.part_indices()}
+        stale = [path for path in directory.glob(f"{prefix}-part_*.{self.file_extension}") if path not in recorded]
+        if not stale:
+            return True
+        if not Confirm.ask(
+            f"Found {len(stale)} part file(s) from an earlier download in '{directory}'. Delete them?",
+            default=True,
+            show_default=True,
+        ):
+            return False
+        for path in stale:
+            path.unlink()
+        return True
+
+    def _download_slices(
+        self,
+        exporter: PolarsExportHandler,
+        channels: Sequence[Channel],
+        tags: Mapping[str, str],
+        manifest: _DownloadManifest,
+        manifest_path: pathlib.Path,
+        directory: pathlib.Path,
+        prefix: str,
+        writer_threads: int,
+    ) -> None:
+        """Export the ranges missing from the manifest, writing parts in the background as slices arrive.
+
+        Each slice is recorded in the manifest once its part file is fully written, so an interrupted
+        download can pick up where it left off. At most `writer_threads` slices wait on writes at a time,
+        which bounds how many exported dataframes are held in memory.
+        """
+        next_part_idx = max(manifest.part_indices(), default=-1) + 1
+        pending: dict[concurrent.futures.Future[pathlib.Path], _CompletedSlice] = {}
+
+        def record(completed: _CompletedSlice) -> None:
+            manifest.completed.append(completed)
+            manifest.save(manifest_path)
+
+        def drain(return_when: str) -> None:
+            done, _ = concurrent.futures.wait(pending, return_when=return_when)
+            for future in done:
+                completed = pending.pop(future)
+                ex = future.exception()
+                if ex is not None:
+                    logger.error("Failed to write part %s", completed.part_idx, exc_info=ex)
+                    continue
+                logger.debug("Wrote part %s to %s", completed.part_idx, future.result())
+                record(completed)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=writer_threads, thread_name_prefix="nominal-download-writer"
+        ) as pool:
+            try:
+                for range_start, range_end in manifest.remaining_ranges():
+                    for slice_start, slice_end, df in exporter.export_slices(channels, range_start, range_end, tags):
+                        if df.is_empty():
+                            record(_CompletedSlice(slice_start, slice_end, None))
+                            continue
+
+                        future = pool.submit(self.write_dataframe, df, next_part_idx, directory, prefix)
+                        pending[future] = _CompletedSlice(slice_start, slice_end, next_part_idx)
+                        next_part_idx += 1
+                        if len(pending) >= writer_threads:
+                            drain(concurrent.futures.FIRST_COMPLETED)
+            finally:
+                # Record everything that finished writing, even when interrupted, so a re-run can skip it
+                drain(concurrent.futures.ALL_COMPLETED)
+
+    def parts_directory(self, directory: pathlib.Path, prefix: str) -> pathlib.Path:
+        """Directory that part files are written into while downloading."""
+        return directory
+
+    def finalize(self, part_indices: Sequence[int], directory: pathlib.Path, prefix: str) -> None:
+        """Hook run once every slice is downloaded, with the part file indices in time order."""
+
+    @property
+    @abc.abstractmethod
+    def file_extension(self) -> str: ...
 
     @abc.abstractmethod
     def write_dataframe(
@@ -488,8 +689,12 @@ class DataDownloader(abc.ABC):
 
 
 class CsvDownloader(DataDownloader):
+    @property
+    def file_extension(self) -> str:
+        return "csv"
+
     def write_dataframe(self, df: pl.DataFrame, part_idx: int, directory: pathlib.Path, prefix: str) -> pathlib.Path:
-        out_path = directory / f"{prefix}-part_{part_idx}.csv"
+        out_path = self._part_path(directory, prefix, part_idx)
         df.write_csv(out_path)
         return out_path
 
@@ -528,12 +733,57 @@ nominal_data = sortrows( ...
 
 
 class ParquetDownloader(DataDownloader):
+    def __init__(self, client: NominalClient, console: Console, single_file: bool = False):
+        """Downloads data to parquet files
+
+        Args:
+            client: Nominal client for communicating with the API
+            console: Rich console for printing to
+            single_file: If True, stream all downloaded parts into a single parquet file (one or more row
+                groups per time slice) once the download completes, instead of leaving many part files.
+        """
+        super().__init__(client, console)
+        self._single_file = single_file
+
+    @property
+    def file_extension(self) -> str:
+        return "parquet"
+
     def write_dataframe(self, df: pl.DataFrame, part_idx: int, directory: pathlib.Path, prefix: str) -> pathlib.Path:
-        out_path = directory / f"{prefix}-part_{part_idx}.parquet"
+        out_path = self._part_path(directory, prefix, part_idx)
         df.write_parquet(out_path, compression="snappy")
         return out_path
 
+    def parts_directory(self, directory: pathlib.Path, prefix: str) -> pathlib.Path:
+        # Single-file downloads keep their (resumable) parts out of sight until they are assembled
+        return directory / f".{prefix}-parts" if self._single_file else directory
+
+    def finalize(self, part_indices: Sequence[int], directory: pathlib.Path, prefix: str) -> None:
+        if not self._single_file:
+            return
+
+        parts_dir = self.parts_directory(directory, prefix)
+        out_path = directory / f"{prefix}.parquet"
+        if part_indices:
+            with self._console.status(f"Writing {out_path}...", spinner="dots"):
+                # Slices may lack columns for channels without data in them; diagonal concat fills those with
+                # nulls, and the streaming sink never holds more than a few row groups in memory.
+                parts = [pl.scan_parquet(self._part_path(parts_dir, prefix, idx)) for idx in part_indices]
+                pl.concat(parts, how="diagonal_relaxed").sink_parquet(
+                    out_path, compression="snappy", row_group_size=SINGLE_FILE_ROW_GROUP_SIZE
+                )
+        else:
+            logger.warning("No data found in the requested time range")
+            pl.DataFrame().write_parquet(out_path)
+        shutil.rmtree(parts_dir)
+
     def print_instructions(self, directory: pathlib.Path, prefix: str) -> None:
+        if self._single_file:
+            code = f'''
+nominal_data = parquetread(fullfile("{str(directory)}", "{prefix}.parquet"));'''
+            self._print_code(code, "Load downloaded parquet data into MATLAB 2019b+", "matlab")
+            return
+
         new_code = f'''
 data_dir = fullfile( ...
     "{str(directory)}", ...
@@ -585,22 +835,49 @@ nominal_data = sortrows( ...
     help="Number of points to put in each written file.",
 )
 @click.option("--format", type=click.Choice(["csv", "parquet"]), default="parquet", show_default=True)
+@click.option(
+    "--writer-threads",
+    type=click.IntRange(min=1),
+    default=2,
+    show_default=True,
+    help="Number of files to write concurrently while downloading continues.",
+)
+@click.option(
+    "--single-file",
+    is_flag=True,
+    help="Combine all downloaded data into a single parquet file instead of many part files (parquet only).",
+)
 @client_options
 @global_options
 @click.pass_context
 def download_cmd(
-    ctx: click.Context, client: NominalClient, channels_per_request: int, points_per_file: int, format: str
+    ctx: click.Context,
+    client: NominalClient,
+    channels_per_request: int,
+    points_per_file: int,
+    format: str,
+    writer_threads: int,
+    single_file: bool,
 ) -> None:
-    """Browse assets, pick a dataset, filter channels by exact name, and download."""
+    """Browse assets, pick a dataset, filter channels by exact name, and download.
+
+    Progress is recorded in a manifest in the download directory: re-running an interrupted download with
+    the same dataset, channels, and time bounds resumes it.
+    """
+    if single_file and format != "parquet":
+        raise click.UsageError("--single-file is only supported with --format parquet")
+
     # Keeping logging and associated console alive for duration of the CLI
     console = Console()
     _listener = configure_rich_logging(console, ctx.obj["log_level"])
 
     match format:
         case "parquet":
-            ParquetDownloader(client, console).download(channels_per_request, points_per_file)
+            ParquetDownloader(client, console, single_file=single_file).download(
+                channels_per_request, points_per_file, writer_threads
+            )
         case "csv":
-            CsvDownloader(client, console).download(channels_per_request, points_per_file)
+            CsvDownloader(client, console).download(channels_per_request, points_per_file, writer_threads)
         case _:
             raise ValueError(f"Unknown format: {format}")
 
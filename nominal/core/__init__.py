@@ -3,6 +3,7 @@ from nominal.core._stream.write_stream import DataStream, LogStream, WriteStream
 from nominal.core._utils.api_tools import LinkDict
 from nominal.core._utils.networking import HeaderProvider
 from nominal.core._utils.query_tools import ArchiveStatusFilter
+from nominal.core._utils.upload_cache import UploadCache
 from nominal.core.asset import Asset
 from nominal.core.attachment import Attachment
 from nominal.core.bounds import Bounds
@@ -18,6 +19,7 @@ from nominal.core.container_image import (
     FileExtractionParameter,
     FileOutputFormat,
     TimestampMetadata,
+    poll_until_all_ready,
 )
 from nominal.core.containerized_extractor import ContainerizedExtractor
 from nominal.core.data_review import CheckViolation, DataReview, DataReviewBuilder
@@ -77,12 +79,14 @@ __all__ = [
     "LogStream",
     "Comment",
     "NominalClient",
+    "poll_until_all_ready",
     "Run",
     "SearchEventOriginType",
     "Secret",
     "TimestampMetadata",
     "Unit",
     "UnitLike",
+    "UploadCache",
     "User",
     "Video",
     "VideoDatasetFile",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import time
 from dataclasses import dataclass, field
+from datetime import timedelta
 from typing import Protocol, TypeVar
 
 from conjure_python_client import Service, ServiceConfiguration
@@ -30,6 +31,11 @@ from nominal_api import (
 from typing_extensions import Self
 
 from nominal._utils.dataclass_tools import LazyField
+from nominal.core._utils.channel_cache import (
+    DEFAULT_CHANNEL_CACHE_MAX_SIZE,
+    DEFAULT_CHANNEL_CACHE_TTL,
+    ChannelMetadataCache,
+)
 from nominal.core._utils.grpc_tools import GRPCStub, create_grpc_channel, translate_grpc_errors
 from nominal.core._utils.networking import (
     HeaderProvider,
@@ -141,6 +147,12 @@ class ClientsBunch:
         repr=False,
         compare=False,
     )
+    channel_metadata_cache: ChannelMetadataCache = field(
+        default_factory=ChannelMetadataCache,
+        repr=False,
+        compare=False,
+        kw_only=True,
+    )
 
     # Conjure services
     assets: scout_assets.AssetService
@@ -276,6 +288,8 @@ class ClientsBunch:
         workspace_rid: str | None,
         *,
         header_provider: HeaderProvider | None = None,
+        channel_cache_ttl: timedelta = DEFAULT_CHANNEL_CACHE_TTL,
+        channel_cache_max_size: int = DEFAULT_CHANNEL_CACHE_MAX_SIZE,
     ) -> Self:
         app_base_url = api_base_url_to_app_base_url(base_url)
 
@@ -306,6 +320,7 @@ class ClientsBunch:
             _user_agent=agent,
             _token=token,
             _service_config=cfg,
+            channel_metadata_cache=ChannelMetadataCache(ttl=channel_cache_ttl, max_size=channel_cache_max_size),
             # Conjure Service Stubs
             assets=client_factory(scout_assets.AssetService),
             attachment=client_factory(attachments_api.AttachmentService),
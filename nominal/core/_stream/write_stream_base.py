@@ -7,7 +7,7 @@ from typing import Any, Generic, Mapping, Sequence, Type, TypeVar
 
 from typing_extensions import Self
 
-from nominal.ts import IntegralNanosecondsUTC
+from nominal.ts import IntegralNanosecondsUTC, _to_nanoseconds_array
 
 StreamType = TypeVar("StreamType")
 
@@ -50,8 +50,8 @@ class WriteStreamBase(abc.ABC, Generic[StreamType]):
     ) -> None:
         """Add a sequence of messages to the queue to upload to Nominal.
 
-        Messages are added one-by-one (with timestamp normalization) and flushed
-        based on the batch conditions.
+        Timestamps are normalized in a single pass, then messages are added one-by-one
+        and flushed based on the batch conditions.
 
         Args:
             channel_name: Name of the channel to upload data for.
@@ -66,7 +66,7 @@ class WriteStreamBase(abc.ABC, Generic[StreamType]):
                 f"Received {len(timestamps)} timestamp(s) vs. {len(values)} value(s)."
             )
 
-        for timestamp, value in zip(timestamps, values):
+        for timestamp, value in zip(_to_nanoseconds_array(timestamps).tolist(), values):
             self.enqueue(channel_name, timestamp, value, tags)
 
     def enqueue_from_dict(
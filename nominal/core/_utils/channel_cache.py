@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Iterable
+
+from nominal_api import datasource_api, timeseries_channelmetadata_api
+
+DEFAULT_CHANNEL_CACHE_TTL = timedelta(seconds=60)
+DEFAULT_CHANNEL_CACHE_MAX_SIZE = 50_000
+
+_ChannelKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ChannelCacheStats:
+    """Point-in-time counters for a `ChannelMetadataCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ChannelMetadataCache:
+    """Thread-safe, size-bounded cache of channel metadata keyed by (datasource rid, channel name).
+
+    Entries expire `ttl` after they were stored, and the least recently used entries are evicted once more than
+    `max_size` are held. A `ttl` of zero disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: timedelta = DEFAULT_CHANNEL_CACHE_TTL,
+        max_size: int = DEFAULT_CHANNEL_CACHE_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            ttl: How long an entry is served after being stored.
+            max_size: Maximum number of channels held at once.
+            clock: Monotonic clock, in seconds, used to expire entries.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self._ttl_seconds = ttl.total_seconds()
+        self._max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            _ChannelKey, tuple[float, timeseries_channelmetadata_api.ChannelMetadata]
+        ] = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def ttl(self) -> timedelta:
+        """How long an entry is served after being stored."""
+        return timedelta(seconds=self._ttl_seconds)
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of channels held at once."""
+        return self._max_size
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are retained at all."""
+        return self._ttl_seconds > 0
+
+    @property
+    def stats(self) -> ChannelCacheStats:
+        """Current hit, miss, and eviction counts."""
+        with self._lock:
+            return ChannelCacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def get_many(
+        self, datasource_rid: str, names: Iterable[str]
+    ) -> tuple[dict[str, timeseries_channelmetadata_api.ChannelMetadata], list[str]]:
+        """Look up channels of a datasource.
+
+        Returns:
+            The cached metadata keyed by channel name, and the names that were not cached, in request order.
+        """
+        found: dict[str, timeseries_channelmetadata_api.ChannelMetadata] = {}
+        missing: list[str] = []
+        now = self._clock()
+        with self._lock:
+            for name in names:
+                key = (datasource_rid, name)
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    found[name] = entry[1]
+                    self._hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    missing.append(name)
+                    self._misses += 1
+        return found, missing
+
+    def put_many(self, channels: Iterable[timeseries_channelmetadata_api.ChannelMetadata]) -> None:
+        """Store (or refresh) the given channels."""
+        if not self.enabled:
+            return
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            for channel in channels:
+                key = (channel.channel_identifier.data_source_rid, channel.channel_identifier.channel_name)
+                self._entries[key] = (expires_at, channel)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def put_search_results(self, channels: Iterable[datasource_api.ChannelMetadata]) -> None:
+        """Store channels as returned by a datasource channel search."""
+        self.put_many(_from_search_result(channel) for channel in channels)
+
+    def invalidate(self, datasource_rid: str, names: Iterable[str] | None = None) -> None:
+        """Drop the given channels of a datasource, or all of its channels if `names` is None."""
+        with self._lock:
+            if names is None:
+                for key in [key for key in self._entries if key[0] == datasource_rid]:
+                    del self._entries[key]
+            else:
+                for name in names:
+                    self._entries.pop((datasource_rid, name), None)
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _from_search_result(channel: datasource_api.ChannelMetadata) -> timeseries_channelmetadata_api.ChannelMetadata:
+    return timeseries_channelmetadata_api.ChannelMetadata(
+        channel_identifier=timeseries_channelmetadata_api.ChannelIdentifier(
+            channel_name=channel.name, data_source_rid=channel.data_source
+        ),
+        data_type=channel.data_type,
+        description=channel.description,
+        unit=channel.unit.symbol if channel.unit else None,
+    )
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable, Protocol, Sequence, TypeVar, overload
+import collections
+import dataclasses
+import threading
+import time
+from typing import Any, Callable, Generator, Iterable, Iterator, Protocol, Sequence, TypeVar, overload
 
 from nominal_api import (
     authentication_api,
@@ -28,6 +32,9 @@ from nominal.protos.secrets.v1 import secrets_pb2, secrets_pb2_grpc
 
 DEFAULT_PAGE_SIZE = 100
 
+# Pages fetched ahead of the consumer by callers that read every page anyway (e.g. to build a list)
+DEFAULT_PREFETCH_PAGES = 2
+
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
 T_contra = TypeVar("T_contra", contravariant=True)
@@ -37,10 +44,14 @@ def search_events_paginated(
     client: event_pb2_grpc.EventServiceStub,
     query: event_pb2.SearchQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[event_pb2.Event]:
     def factory(page_token: str | None) -> event_pb2.SearchEventsRequest:
         return event_pb2.SearchEventsRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort=event_pb2.SortOptions(
                 field=event_pb2.START_TIME,
@@ -50,7 +61,7 @@ def search_events_paginated(
             next_page_token=page_token,
         )
 
-    for response in paginate_grpc(client.SearchEvents, request_factory=factory):
+    for response in paginate_grpc(client.SearchEvents, request_factory=factory, prefetch=prefetch, stats=stats):
         yield from response.results
 
 
@@ -58,10 +69,14 @@ def search_datasets_paginated(
     client: scout_catalog.CatalogService,
     auth_header: str,
     query: scout_catalog.SearchDatasetsQuery,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_catalog.EnrichedDataset]:
     def factory(page_token: str | None) -> scout_catalog.SearchDatasetsRequest:
         return scout_catalog.SearchDatasetsRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort_options=scout_catalog.SortOptions(
                 field=scout_catalog.SortField.INGEST_DATE,
@@ -70,7 +85,9 @@ def search_datasets_paginated(
             token=page_token,
         )
 
-    for response in paginate_rpc(client.search_datasets, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        client.search_datasets, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.results
 
 
@@ -79,11 +96,15 @@ def search_dataset_files_paginated(
     auth_header: str,
     dataset_rid: str,
     query: scout_catalog.SearchDatasetFilesQuery,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_catalog.DatasetFile]:
     def factory(page_token: str | None) -> scout_catalog.SearchDatasetFilesRequest:
         return scout_catalog.SearchDatasetFilesRequest(
             dataset_rid=dataset_rid,
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort_options=scout_catalog.DatasetFileSortOptions(
                 field=scout_catalog.DatasetFileSortField.UPLOADED_AT,
@@ -92,7 +113,9 @@ def search_dataset_files_paginated(
             token=page_token,
         )
 
-    for response in paginate_rpc(client.search_dataset_files, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        client.search_dataset_files, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.results
 
 
@@ -101,10 +124,14 @@ def search_assets_paginated(
     auth_header: str,
     query: scout_asset_api.SearchAssetsQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_asset_api.Asset]:
     def factory(page_token: str | None) -> scout_asset_api.SearchAssetsRequest:
         return scout_asset_api.SearchAssetsRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort=scout_asset_api.AssetSortOptions(
                 field=scout_asset_api.AssetSortField.CREATED_AT,
@@ -114,7 +141,9 @@ def search_assets_paginated(
             next_page_token=page_token,
         )
 
-    for response in paginate_rpc(client.search_assets, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        client.search_assets, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.results
 
 
@@ -122,10 +151,14 @@ def search_ingest_jobs_paginated(
     client: ingest_api.IngestJobService,
     auth_header: str,
     filter: ingest_api.IngestJobSearchFilter,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[ingest_api.IngestJob]:
     def factory(page_token: str | None) -> ingest_api.SearchIngestJobsRequest:
         return ingest_api.SearchIngestJobsRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             filter=filter,
             sort=ingest_api.IngestJobSortOptions(
                 is_descending=True,
@@ -134,7 +167,9 @@ def search_ingest_jobs_paginated(
             next_page_token=page_token,
         )
 
-    for response in paginate_rpc(client.search_ingest_jobs, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        client.search_ingest_jobs, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.ingest_jobs
 
 
@@ -144,6 +179,10 @@ def search_data_reviews_paginated(
     assets: Sequence[str] | None = None,
     runs: Sequence[str] | None = None,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_datareview_api.DataReview]:
     """Search for any data reviews present within a collection of runs and assets."""
 
@@ -153,40 +192,63 @@ def search_data_reviews_paginated(
             checklist_refs=[],
             run_rids=[] if runs is None else list(runs),
             archived_statuses=archive_status.to_api_archived_statuses(),
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             next_page_token=page_token,
         )
 
-    for response in paginate_rpc(datareview.find_data_reviews, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        datareview.find_data_reviews, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.data_reviews
 
 
 def list_streaming_checklists_paginated(
-    checklist_execution: scout_checklistexecution_api.ChecklistExecutionService, auth_header: str
+    checklist_execution: scout_checklistexecution_api.ChecklistExecutionService,
+    auth_header: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[str]:
     def factory(page_token: str | None) -> scout_checklistexecution_api.ListStreamingChecklistRequest:
         return scout_checklistexecution_api.ListStreamingChecklistRequest(
             workspaces=[],
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             page_token=page_token,
         )
 
-    for response in paginate_rpc(checklist_execution.list_streaming_checklist, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        checklist_execution.list_streaming_checklist,
+        auth_header,
+        request_factory=factory,
+        prefetch=prefetch,
+        stats=stats,
+    ):
         yield from response.checklists
 
 
 def list_streaming_checklists_for_asset_paginated(
-    checklist_execution: scout_checklistexecution_api.ChecklistExecutionService, auth_header: str, asset: str
+    checklist_execution: scout_checklistexecution_api.ChecklistExecutionService,
+    auth_header: str,
+    asset: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[str]:
     def factory(page_token: str | None) -> scout_checklistexecution_api.ListStreamingChecklistForAssetRequest:
         return scout_checklistexecution_api.ListStreamingChecklistForAssetRequest(
             asset_rid=asset,
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             page_token=page_token,
         )
 
     for response in paginate_rpc(
-        checklist_execution.list_streaming_checklist_for_asset, auth_header, request_factory=factory
+        checklist_execution.list_streaming_checklist_for_asset,
+        auth_header,
+        request_factory=factory,
+        prefetch=prefetch,
+        stats=stats,
     ):
         yield from response.checklists
 
@@ -196,16 +258,22 @@ def search_checklists_paginated(
     auth_header: str,
     query: scout_checks_api.ChecklistSearchQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_checks_api.VersionedChecklist]:
     def factory(page_token: str | None) -> scout_checks_api.SearchChecklistsRequest:
         return scout_checks_api.SearchChecklistsRequest(
             query=query,
             archived_statuses=archive_status.to_api_archived_statuses(),
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             next_page_token=page_token,
         )
 
-    for response in paginate_rpc(checklist.search, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        checklist.search, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.values
 
 
@@ -214,10 +282,14 @@ def search_runs_paginated(
     auth_header: str,
     query: scout_run_api.SearchQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_run_api.Run]:
     def factory(page_token: str | None) -> scout_run_api.SearchRunsRequest:
         return scout_run_api.SearchRunsRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort=scout_run_api.SortOptions(
                 field=scout_run_api.SortField.START_TIME,
@@ -227,7 +299,7 @@ def search_runs_paginated(
             next_page_token=page_token,
         )
 
-    for response in paginate_rpc(run.search_runs, auth_header, request_factory=factory):
+    for response in paginate_rpc(run.search_runs, auth_header, request_factory=factory, prefetch=prefetch, stats=stats):
         yield from response.results
 
 
@@ -235,11 +307,16 @@ def search_runs_by_asset_paginated(
     run: scout.RunService,
     auth_header: str,
     asset_rid: str,
+    *,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_run_api.Run]:
     def factory(page_token: str | None) -> scout_run_api.GetRunsByAssetRequest:
         return scout_run_api.GetRunsByAssetRequest(asset=asset_rid, next_page_token=page_token)
 
-    for response in paginate_rpc(run.get_runs_by_asset, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        run.get_runs_by_asset, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.results
 
 
@@ -247,17 +324,21 @@ def search_secrets_paginated(
     secrets: secrets_pb2_grpc.SecretServiceStub,
     query: secrets_pb2.SearchSecretsQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[secrets_pb2.Secret]:
     def factory(page_token: str | None) -> secrets_pb2.SearchSecretsRequest:
         return secrets_pb2.SearchSecretsRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort=secrets_pb2.SortOptions(field=secrets_pb2.SortField.CREATED_AT, is_descending=True),
             archived_statuses=archive_status.to_proto_archived_statuses(),
             token=page_token,
         )
 
-    for response in paginate_grpc(secrets.Search, request_factory=factory):
+    for response in paginate_grpc(secrets.Search, request_factory=factory, prefetch=prefetch, stats=stats):
         yield from response.results
 
 
@@ -266,17 +347,21 @@ def search_videos_paginated(
     auth_header: str,
     query: scout_video_api.SearchVideosQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_video_api.Video]:
     def factory(page_token: str | None) -> scout_video_api.SearchVideosRequest:
         return scout_video_api.SearchVideosRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             query=query,
             sort_options=scout_video_api.SortOptions(field=scout_video_api.SortField.CREATED_AT, is_descending=True),
             archived_statuses=archive_status.to_api_archived_statuses(),
             token=page_token,
         )
 
-    for response in paginate_rpc(videos.search, auth_header, request_factory=factory):
+    for response in paginate_rpc(videos.search, auth_header, request_factory=factory, prefetch=prefetch, stats=stats):
         yield from response.results
 
 
@@ -284,16 +369,22 @@ def search_users_paginated(
     authentication: authentication_api.AuthenticationServiceV2,
     auth_header: str,
     query: authentication_api.SearchUsersQuery,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[authentication_api.UserV2]:
     def factory(page_token: str | None) -> authentication_api.SearchUsersRequest:
         return authentication_api.SearchUsersRequest(
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             next_page_token=page_token,
             query=query,
             sort_by=authentication_api.SortBy(field=authentication_api.SortByField.EMAIL, is_descending=False),
         )
 
-    for response in paginate_rpc(authentication.search_users_v2, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        authentication.search_users_v2, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.results
 
 
@@ -301,6 +392,9 @@ def search_workbooks_paginated(
     workbook: scout.NotebookService,
     auth_header: str,
     query: scout_notebook_api.SearchNotebooksQuery,
+    *,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_notebook_api.NotebookMetadataWithRid]:
     """NOTE: relies upon the query correctly filtering out drafts / archived if not desired"""
 
@@ -313,7 +407,7 @@ def search_workbooks_paginated(
             next_page_token=page_token,
         )
 
-    for response in paginate_rpc(workbook.search, auth_header, request_factory=factory):
+    for response in paginate_rpc(workbook.search, auth_header, request_factory=factory, prefetch=prefetch, stats=stats):
         yield from response.results
 
 
@@ -321,11 +415,16 @@ def search_workbook_templates_paginated(
     template: scout.TemplateService,
     auth_header: str,
     query: scout_template_api.SearchTemplatesQuery,
+    *,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[scout_template_api.TemplateSummary]:
     def factory(page_token: str | None) -> scout_template_api.SearchTemplatesRequest:
         return scout_template_api.SearchTemplatesRequest(query=query, next_page_token=page_token)
 
-    for response in paginate_rpc(template.search_templates, auth_header, request_factory=factory):
+    for response in paginate_rpc(
+        template.search_templates, auth_header, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.results
 
 
@@ -334,6 +433,10 @@ def search_containerized_extractors_paginated(
     workspace_rid: str,
     include_archived: bool = False,
     file_extension: str | None = None,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[containerized_extractor_pb2.ContainerizedExtractor]:
     # The v2 request has no nested query/filter message (its search parameters are flat fields), so —
     # like `search_data_reviews_paginated` — the parameters are taken directly rather than as a query type.
@@ -342,11 +445,13 @@ def search_containerized_extractors_paginated(
             workspace_rid=workspace_rid,
             include_archived=include_archived,
             file_extension=file_extension,
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             next_page_token=page_token,
         )
 
-    for response in paginate_grpc(extractor_service.SearchContainerizedExtractors, request_factory=factory):
+    for response in paginate_grpc(
+        extractor_service.SearchContainerizedExtractors, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.extractors
 
 
@@ -354,16 +459,22 @@ def search_container_images_paginated(
     registry_service: registry_pb2_grpc.RegistryServiceStub,
     workspace_rid: str,
     search_filter: registry_pb2.SearchFilter | None,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[registry_pb2.ContainerImage]:
     def factory(page_token: str | None) -> registry_pb2.SearchImagesRequest:
         return registry_pb2.SearchImagesRequest(
             filter=search_filter,
             workspace_rid=workspace_rid,
-            page_size=DEFAULT_PAGE_SIZE,
+            page_size=page_size,
             next_page_token=page_token,
         )
 
-    for response in paginate_grpc(registry_service.SearchImages, request_factory=factory):
+    for response in paginate_grpc(
+        registry_service.SearchImages, request_factory=factory, prefetch=prefetch, stats=stats
+    ):
         yield from response.images
 
 
@@ -408,12 +519,137 @@ def _default_token_factory(response: _HasNextPageToken) -> str | None:
     return response.next_page_token
 
 
+@dataclasses.dataclass
+class PaginationStats:
+    """Timing of the pages fetched by `paginate_rpc` / `paginate_grpc`.
+
+    Pass an instance as `stats=` to have it filled in as pages are fetched. `fetch_seconds` is the time
+    spent in the RPCs themselves; `wait_seconds` is the time the consumer spent blocked waiting for a
+    page. Without prefetching the two are about equal; with it, `wait_seconds` shrinks by however much
+    fetching overlapped with the consumer's own work.
+    """
+
+    pages: int = 0
+    fetch_seconds: float = 0.0
+    max_fetch_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    @property
+    def mean_fetch_seconds(self) -> float:
+        return self.fetch_seconds / self.pages if self.pages else 0.0
+
+
+def _iter_pages(
+    fetch: Callable[[Any], Any],
+    token_factory: Callable[[Any], Any],
+    stats: PaginationStats | None,
+) -> Iterator[Any]:
+    token = None
+    while True:
+        start = time.perf_counter()
+        response = fetch(token)
+        if stats is not None:
+            elapsed = time.perf_counter() - start
+            stats.pages += 1
+            stats.fetch_seconds += elapsed
+            stats.max_fetch_seconds = max(stats.max_fetch_seconds, elapsed)
+        yield response
+        token = token_factory(response)
+        if token is None:
+            return
+
+
+def _read_ahead(pages: Iterator[T], lookahead: int) -> Generator[T, None, None]:
+    """Iterate `pages` on a background thread, keeping up to `lookahead` pages buffered ahead of the consumer.
+
+    Page N+1 can only be requested once page N's token is known, so the pages themselves are still fetched
+    one at a time -- but while the consumer works through one page, the next ones are already in flight.
+    """
+    buffer: collections.deque[T] = collections.deque()
+    cond = threading.Condition()
+    finished = False
+    stopped = False
+    error: BaseException | None = None
+
+    def fetch() -> None:
+        nonlocal finished, error
+        try:
+            while True:
+                with cond:
+                    while len(buffer) >= lookahead and not stopped:
+                        cond.wait()
+                    if stopped:
+                        return
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    return
+                with cond:
+                    buffer.append(page)
+                    cond.notify_all()
+        except BaseException as e:
+            error = e
+        finally:
+            with cond:
+                finished = True
+                cond.notify_all()
+
+    threading.Thread(target=fetch, name="nominal-page-prefetch", daemon=True).start()
+    try:
+        while True:
+            with cond:
+                while not buffer and not finished:
+                    cond.wait()
+                if buffer:
+                    page = buffer.popleft()
+                    cond.notify_all()
+                elif error is not None:
+                    raise error
+                else:
+                    return
+            yield page
+    finally:
+        # The consumer stopped early (or is done): let the fetcher exit after any request in flight
+        with cond:
+            stopped = True
+            cond.notify_all()
+
+
+def _paginate(
+    fetch: Callable[[Any], Any],
+    token_factory: Callable[[Any], Any],
+    prefetch: int,
+    stats: PaginationStats | None,
+) -> Iterator[Any]:
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be non-negative, got {prefetch}")
+
+    pages: Iterator[Any] = _iter_pages(fetch, token_factory, stats)
+    if prefetch:
+        pages = _read_ahead(pages, prefetch)
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                page = next(pages)
+            except StopIteration:
+                return
+            if stats is not None:
+                stats.wait_seconds += time.perf_counter() - start
+            yield page
+    finally:
+        if isinstance(pages, Generator):
+            pages.close()
+
+
 @overload
 def paginate_rpc(
     rpc: _PaginatedRpc[_RequestT, _DefaultResponseT],
     auth_header: str,
     *,
     request_factory: _RequestFactory[str, _RequestT],
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[_DefaultResponseT]: ...
 
 
@@ -424,6 +660,8 @@ def paginate_rpc(
     *,
     request_factory: _RequestFactory[_TokenT, _RequestT],
     token_factory: _TokenFactory[_ResponseT, _TokenT],
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[_ResponseT]: ...
 
 
@@ -434,15 +672,19 @@ def paginate_rpc(
     *,
     request_factory: _RequestFactory[Any, Any],
     token_factory: _TokenFactory[Any, Any] = _default_token_factory,
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[Any]:
-    next_page_token = None
-    while True:
-        request = request_factory(next_page_token)
-        response = rpc(auth_header, request)
-        yield response
-        next_page_token = token_factory(response)
-        if next_page_token is None:
-            break
+    """Yield successive responses from a paged conjure RPC, following page tokens.
+
+    `request_factory(token)` builds the request for each page (`None` for the first page), and
+    `token_factory(response)` extracts the next page's token, or `None` when there are no more pages.
+
+    With `prefetch > 0`, pages are fetched on a background thread up to `prefetch` pages ahead of the
+    consumer, so request latency overlaps with processing of the previous page. Only use it when the
+    caller reads every page: a consumer that stops early may have triggered up to `prefetch` extra requests.
+    """
+    return _paginate(lambda token: rpc(auth_header, request_factory(token)), token_factory, prefetch, stats)
 
 
 _GrpcRequestT = TypeVar("_GrpcRequestT")
@@ -452,18 +694,19 @@ def paginate_grpc(
     rpc: Callable[[_GrpcRequestT], Any],
     *,
     request_factory: Callable[[str | None], _GrpcRequestT],
+    prefetch: int = 0,
+    stats: PaginationStats | None = None,
 ) -> Iterable[Any]:
     """Yield successive responses from a v2 gRPC search RPC, following next_page_token cursors.
 
     The gRPC sibling of `paginate_rpc`: `request_factory(token)` builds a fresh request for each page
     (`None` for the first page), and `rpc` is called as `rpc(request)` (auth rides the channel).
     Stops when a response has an empty `next_page_token` (proto3's encoding of "no more pages").
+    `prefetch` and `stats` behave as in `paginate_rpc`.
     """
-    token: str | None = None
-    while True:
+
+    def fetch(token: str | None) -> Any:
         with translate_grpc_errors():
-            response = rpc(request_factory(token))
-        yield response
-        token = response.next_page_token or None
-        if token is None:
-            return
+            return rpc(request_factory(token))
+
+    return _paginate(fetch, lambda response: response.next_page_token or None, prefetch, stats)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+
+from nominal.core._types import PathLike
+
+_DIGEST_READ_SIZE = 8 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: pathlib.Path) -> str:
+    """Hex-encoded SHA-256 digest of a file's contents, read in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(_DIGEST_READ_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """Local record of uploaded files' object paths, keyed by the SHA-256 digest of their contents.
+
+    Lets a file that was already uploaded, e.g. a `docker save` tarball re-registered under a new tag, reuse the
+    existing object instead of being uploaded again. Entries are scoped to a deployment and workspace, and are
+    persisted as JSON at `path`, so the record persists across processes. The cache may be shared between threads.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        """Open (creating on first write) a cache persisted at `path`.
+
+        Args:
+            path: JSON file to persist cached object paths in.
+        """
+        self._path = pathlib.Path(path)
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, digest: str) -> str | None:
+        """The object path a file with the given digest was uploaded to within `scope`, if any."""
+        with self._lock:
+            return self._load().get(scope, {}).get(digest)
+
+    def put(self, scope: str, digest: str, object_path: str) -> None:
+        """Record that a file with the given digest was uploaded to `object_path` within `scope`."""
+        with self._lock:
+            entries = self._load()
+            entries.setdefault(scope, {})[digest] = object_path
+            self._save(entries)
+
+    def invalidate(self, scope: str, digest: str) -> None:
+        """Forget the object path recorded for the given digest within `scope`, e.g. once it no longer exists."""
+        with self._lock:
+            entries = self._load()
+            if entries.get(scope, {}).pop(digest, None) is not None:
+                self._save(entries)
+
+    def _save(self, entries: dict[str, dict[str, str]]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entries, indent=2, sort_keys=True))
+        tmp_path.replace(self._path)
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        try:
+            entries = json.loads(self._path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("ignoring unreadable upload cache at %s", self._path, exc_info=True)
+            return {}
+        return entries if isinstance(entries, dict) else {}
@@ -20,9 +20,10 @@ from nominal_api import (
 )
 from typing_extensions import Self, assert_never
 
-from nominal._utils.iterator_tools import batched
+from nominal._utils.iterator_tools import batched, chain_concurrently
 from nominal.core._clientsbunch import HasScoutParams
 from nominal.core._utils.api_tools import RefreshableConjureMixin, build_compute_tag_filter, create_api_tags
+from nominal.core._utils.channel_cache import ChannelMetadataCache
 from nominal.core._utils.pagination_tools import paginate_rpc
 from nominal.core.log import LogPoint, _log_filter_operator
 from nominal.core.unit import UnitLike, _build_unit_update
@@ -39,6 +40,12 @@ from nominal.ts import (
 
 logger = logging.getLogger(__name__)
 
+# Logs per page when searching logs; must be <= 500
+_LOG_PAGE_SIZE = 200
+
+# Sub-ranges per worker when searching logs in parallel, so a burst of logs in one sub-range doesn't stall the rest
+_LOG_PARTITIONS_PER_WORKER = 4
+
 
 class ChannelDataType(enum.Enum):
     DOUBLE = "DOUBLE"
@@ -106,6 +113,8 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
         def compute(self) -> scout_compute_api.ComputeService: ...
         @property
         def channel_metadata(self) -> timeseries_channelmetadata.ChannelMetadataService: ...
+        @property
+        def channel_metadata_cache(self) -> ChannelMetadataCache: ...
 
     class _NotProvided:
         """Sentinel class for detecting when a user has or has not provided a value during updates"""
@@ -146,6 +155,7 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
             unit_update=_build_unit_update(unit) if not isinstance(unit, self._NotProvided) else None,
         )
         updated_channel = self._clients.channel_metadata.update_channel_metadata(self._clients.auth_header, request)
+        self._clients.channel_metadata_cache.put_many([updated_channel])
         return self._refresh_from_api(updated_channel)
 
     @overload
@@ -156,6 +166,7 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
         regex_match: str,
         start: _InferrableTimestampType | None = None,
         end: _InferrableTimestampType | None = None,
+        parallelism: int = 1,
     ) -> Iterable[LogPoint]: ...
 
     @overload
@@ -166,6 +177,7 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
         insensitive_match: str,
         start: _InferrableTimestampType | None = None,
         end: _InferrableTimestampType | None = None,
+        parallelism: int = 1,
     ) -> Iterable[LogPoint]: ...
 
     @overload
@@ -175,6 +187,7 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
         tags: Mapping[str, str] | None = None,
         start: _InferrableTimestampType | None = None,
         end: _InferrableTimestampType | None = None,
+        parallelism: int = 1,
     ) -> Iterable[LogPoint]: ...
 
     def search_logs(
@@ -185,6 +198,7 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
         tags: Mapping[str, str] | None = None,
         start: _InferrableTimestampType | None = None,
         end: _InferrableTimestampType | None = None,
+        parallelism: int = 1,
     ) -> Iterable[LogPoint]:
         """Yields logpoints from the current channel that match the provided arguments
 
@@ -196,15 +210,42 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
             tags: Tags to filter logs from the channel with
             start: Timestamp to start yielding results from. If not present, searches starting from unix epoch
             end: Timestamp after which to stop yielding results from. If not present, searches until end of time.
+            parallelism: Number of sub-ranges of `[start, end)` to search concurrently. Logs are still yielded
+                in timestamp order. Values above 1 require both `start` and `end`.
         """
-        # Must be <= 500
-        PAGE_SIZE = 200
+        for timestamps, values in self._search_log_pages(
+            regex_match=regex_match,
+            insensitive_match=insensitive_match,
+            tags=tags,
+            start=start,
+            end=end,
+            parallelism=parallelism,
+        ):
+            for timestamp, log in zip(timestamps, values):
+                yield LogPoint._from_compute_api(log, timestamp)
 
+    def _search_log_pages(
+        self,
+        *,
+        regex_match: str | None,
+        insensitive_match: str | None,
+        tags: Mapping[str, str] | None,
+        start: _InferrableTimestampType | None,
+        end: _InferrableTimestampType | None,
+        parallelism: int,
+    ) -> Iterator[tuple[list[IntegralNanosecondsUTC], list[scout_compute_api.LogValue]]]:
+        """Yield pages of matching logs, as parallel lists of timestamps and values, in timestamp order.
+
+        With `parallelism > 1`, `[start, end)` is cut into `parallelism * _LOG_PARTITIONS_PER_WORKER` equal
+        sub-ranges which are paged concurrently, `parallelism` at a time, and chained back together in order.
+        The compute API offers no per-bucket log counts to balance the sub-ranges by, so they are instead cut
+        finer than the number of workers: a burst of logs then delays one small sub-range rather than a
+        quarter of the search.
+        """
         if self.data_type is not ChannelDataType.LOG:
             raise TypeError(f"Not searching channel {self.name} for logs-- not a log channel!")
-
-        api_start = (_SecondsNanos.from_flexible(start) if start else _MIN_TIMESTAMP).to_api()
-        api_end = (_SecondsNanos.from_flexible(end) if end else _MAX_TIMESTAMP).to_api()
+        if parallelism < 1:
+            raise ValueError(f"parallelism must be at least 1, got {parallelism}")
 
         filtered_series = scout_compute_api.LogSeries(
             filter=scout_compute_api.LogFilterSeries(
@@ -214,6 +255,42 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
         )
         compute_series = scout_compute_api.Series(log=filtered_series)
 
+        if parallelism == 1:
+            api_start = _SecondsNanos.from_flexible(start) if start else _MIN_TIMESTAMP
+            api_end = _SecondsNanos.from_flexible(end) if end else _MAX_TIMESTAMP
+            yield from self._page_logs(compute_series, api_start, api_end, exclusive_end=False)
+            return
+
+        if start is None or end is None:
+            raise ValueError("Searching logs with parallelism > 1 requires both `start` and `end`")
+        start_ns = _SecondsNanos.from_flexible(start).to_nanoseconds()
+        end_ns = _SecondsNanos.from_flexible(end).to_nanoseconds()
+        num_partitions = parallelism * _LOG_PARTITIONS_PER_WORKER
+        bounds = sorted({start_ns + (end_ns - start_ns) * i // num_partitions for i in range(num_partitions + 1)})
+        sources = [
+            functools.partial(
+                self._page_logs,
+                compute_series,
+                _SecondsNanos.from_nanoseconds(lower),
+                _SecondsNanos.from_nanoseconds(upper),
+                # every sub-range but the last excludes its end, which is the next sub-range's start
+                exclusive_end=upper != end_ns,
+            )
+            for lower, upper in zip(bounds, bounds[1:])
+        ]
+        yield from chain_concurrently(sources, max_workers=parallelism)
+
+    def _page_logs(
+        self,
+        compute_series: scout_compute_api.Series,
+        start: _SecondsNanos,
+        end: _SecondsNanos,
+        *,
+        exclusive_end: bool,
+    ) -> Iterator[tuple[list[IntegralNanosecondsUTC], list[scout_compute_api.LogValue]]]:
+        api_start, api_end = start.to_api(), end.to_api()
+        end_ns = end.to_nanoseconds()
+
         def request_factory(page_token: scout_compute_api.PageToken | None) -> scout_compute_api.ComputeNodeRequest:
             return scout_compute_api.ComputeNodeRequest(
                 context=scout_compute_api.Context(dataset_references={}, variables={}, function_variables={}),
@@ -225,7 +302,7 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
                         numeric_aggregations={},
                         summarization_strategy=scout_compute_api.SummarizationStrategy(
                             page=scout_compute_api.PageStrategy(
-                                page_info=scout_compute_api.PageInfo(page_size=PAGE_SIZE, page_token=page_token)
+                                page_info=scout_compute_api.PageInfo(page_size=_LOG_PAGE_SIZE, page_token=page_token)
                             )
                         ),
                     )
@@ -244,11 +321,15 @@ class Channel(RefreshableConjureMixin[timeseries_channelmetadata_api.ChannelMeta
             request_factory=request_factory,
             token_factory=token_factory,
         ):
-            if resp.paged_log:
-                for timestamp, log in zip(resp.paged_log.timestamps, resp.paged_log.values):
-                    yield LogPoint._from_compute_api(log, timestamp)
-            else:
+            if not resp.paged_log:
                 raise RuntimeError(f"Expected response type to be `paged_log`, received: `{resp.type}`")
+            timestamps = [_SecondsNanos.from_api(ts).to_nanoseconds() for ts in resp.paged_log.timestamps]
+            values = list(resp.paged_log.values)
+            if exclusive_end and timestamps and timestamps[-1] >= end_ns:
+                keep = [i for i, ts in enumerate(timestamps) if ts < end_ns]
+                timestamps = [timestamps[i] for i in keep]
+                values = [values[i] for i in keep]
+            yield timestamps, values
 
     def get_available_tags(
         self,
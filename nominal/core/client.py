@@ -39,12 +39,14 @@ from nominal.core._utils.api_tools import (
     construct_user_agent_string,
     rid_from_instance_or_string,
 )
+from nominal.core._utils.channel_cache import DEFAULT_CHANNEL_CACHE_MAX_SIZE, DEFAULT_CHANNEL_CACHE_TTL
 from nominal.core._utils.grpc_tools import translate_grpc_errors
 from nominal.core._utils.multipart import (
     upload_multipart_io,
 )
 from nominal.core._utils.networking import HeaderProvider, normalize_header_provider
 from nominal.core._utils.pagination_tools import (
+    DEFAULT_PREFETCH_PAGES,
     search_assets_paginated,
     search_checklists_paginated,
     search_datasets_paginated,
@@ -147,6 +149,8 @@ class NominalClient:
         trust_store_path: str | None = None,
         connect_timeout: timedelta | float = DEFAULT_CONNECT_TIMEOUT,
         extra_headers: HeaderProvider | Mapping[str, str] | None = None,
+        channel_cache_ttl: timedelta = DEFAULT_CHANNEL_CACHE_TTL,
+        channel_cache_max_size: int = DEFAULT_CHANNEL_CACHE_MAX_SIZE,
     ) -> Self:
         """Create a connection to the Nominal platform from a named profile in the Nominal config.
 
@@ -159,6 +163,11 @@ class NominalClient:
                 your corporate CA PEM if you are behind a TLS-inspecting proxy.
             connect_timeout: Request connection timeout.
             extra_headers: Extra request headers, either as a mapping or HeaderProvider.
+            channel_cache_ttl: How long channel metadata (e.g. data types and units) fetched by this client is
+                reused before being fetched again. Changes made through this client are seen immediately, but
+                changes made elsewhere, e.g. by another process or by ingest, may not be seen for this long.
+                `timedelta(0)` disables the cache.
+            channel_cache_max_size: Maximum number of channels whose metadata is cached at once.
         """
         config = NominalConfig.from_yaml()
         prof = config.get_profile(profile)
@@ -169,6 +178,8 @@ class NominalClient:
             trust_store_path=trust_store_path,
             connect_timeout=connect_timeout,
             extra_headers=extra_headers,
+            channel_cache_ttl=channel_cache_ttl,
+            channel_cache_max_size=channel_cache_max_size,
             _profile=profile,
         )
         return client
@@ -183,6 +194,8 @@ class NominalClient:
         trust_store_path: str | None = None,
         connect_timeout: timedelta | float = DEFAULT_CONNECT_TIMEOUT,
         extra_headers: HeaderProvider | Mapping[str, str] | None = None,
+        channel_cache_ttl: timedelta = DEFAULT_CHANNEL_CACHE_TTL,
+        channel_cache_max_size: int = DEFAULT_CHANNEL_CACHE_MAX_SIZE,
         _profile: str | None = None,
     ) -> Self:
         """Create a connection to the Nominal platform from a token.
@@ -199,6 +212,11 @@ class NominalClient:
                 your corporate CA PEM if you are behind a TLS-inspecting proxy.
             connect_timeout: Request connection timeout.
             extra_headers: Extra request headers, either as a mapping or HeaderProvider.
+            channel_cache_ttl: How long channel metadata (e.g. data types and units) fetched by this client is
+                reused before being fetched again. Changes made through this client are seen immediately, but
+                changes made elsewhere, e.g. by another process or by ingest, may not be seen for this long.
+                `timedelta(0)` disables the cache.
+            channel_cache_max_size: Maximum number of channels whose metadata is cached at once.
         """
         trust_store_path = certifi.where() if trust_store_path is None else trust_store_path
         timeout_seconds = connect_timeout.total_seconds() if isinstance(connect_timeout, timedelta) else connect_timeout
@@ -216,6 +234,8 @@ class NominalClient:
                 token,
                 workspace_rid,
                 header_provider=normalize_header_provider(extra_headers),
+                channel_cache_ttl=channel_cache_ttl,
+                channel_cache_max_size=channel_cache_max_size,
             ),
             _profile=_profile,
         )
@@ -230,6 +250,8 @@ class NominalClient:
         *,
         workspace_rid: str | None = None,
         extra_headers: HeaderProvider | Mapping[str, str] | None = None,
+        channel_cache_ttl: timedelta = DEFAULT_CHANNEL_CACHE_TTL,
+        channel_cache_max_size: int = DEFAULT_CHANNEL_CACHE_MAX_SIZE,
     ) -> Self:
         """Create a connection to the Nominal platform.
 
@@ -244,6 +266,9 @@ class NominalClient:
         workspace_rid: Optional workspace RID to pin the client to for operations that require a single
             workspace. If not provided, those operations resolve a default workspace client-side when needed.
         extra_headers: Extra request headers, either as a mapping or HeaderProvider.
+        channel_cache_ttl: How long channel metadata fetched by this client is reused before being fetched
+            again; `timedelta(0)` disables the cache. See `from_token`.
+        channel_cache_max_size: Maximum number of channels whose metadata is cached at once.
         """
         if token is None:
             token = _config.get_token(base_url)
@@ -254,6 +279,8 @@ class NominalClient:
             connect_timeout=connect_timeout,
             workspace_rid=workspace_rid,
             extra_headers=extra_headers,
+            channel_cache_ttl=channel_cache_ttl,
+            channel_cache_max_size=channel_cache_max_size,
         )
 
     def __repr__(self) -> str:
@@ -366,6 +393,7 @@ class NominalClient:
             self._clients.catalog,
             self._clients.auth_header,
             query,
+            prefetch=DEFAULT_PREFETCH_PAGES,
         ):
             yield Dataset._from_conjure(self._clients, raw_dataset)
 
@@ -8,7 +8,6 @@ carries identity and selects exactly one registered image as active.
 
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import Enum
@@ -17,6 +16,8 @@ from typing import Iterable, Protocol, Sequence
 from typing_extensions import Self, assert_never
 
 from nominal import ts
+from nominal._utils.iterator_tools import map_concurrently
+from nominal._utils.polling_tools import PollBackoff
 from nominal.core._clientsbunch import HasScoutParams
 from nominal.core._utils.api_tools import HasRid, RefreshableMixin
 from nominal.core._utils.grpc_tools import translate_grpc_errors
@@ -26,6 +27,9 @@ from nominal.core.exceptions import NominalContainerImageError
 from nominal.protos.registry.v2 import registry_pb2, registry_pb2_grpc
 from nominal.ts import IntegralNanosecondsUTC
 
+# Default longest wait between polls for an image's status
+DEFAULT_MAX_POLL_INTERVAL = timedelta(seconds=30)
+
 
 class FileOutputFormat(Enum):
     """File format a containerized extractor writes its output data in."""
@@ -284,13 +288,21 @@ class ContainerImage(HasRid, RefreshableMixin[registry_pb2.ContainerImage]):
                 registry_pb2.DeleteImageRequest(rid=self.rid, workspace_rid=self._workspace_rid)
             )
 
-    def poll_until_ready(self, interval: timedelta = timedelta(seconds=1)) -> Self:
+    def poll_until_ready(
+        self,
+        interval: timedelta = timedelta(seconds=1),
+        *,
+        max_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+        timeout: timedelta | None = None,
+    ) -> Self:
         """Block until this image has finished processing server-side, refreshing in place.
 
-        This method polls Nominal for the image's status on an interval.
+        This method polls Nominal for the image's status with exponential backoff; see `poll_until_all_ready`.
 
         Args:
-            interval: How often to poll for the image's status.
+            interval: How long to wait after the first poll.
+            max_interval: Longest wait between polls.
+            timeout: Give up after this long and raise `TimeoutError`; None waits indefinitely.
 
         Returns:
             This instance, once its status is `ContainerImageStatus.READY`.
@@ -298,22 +310,10 @@ class ContainerImage(HasRid, RefreshableMixin[registry_pb2.ContainerImage]):
         Raises:
             NominalContainerImageError: If the image reaches a state from which it cannot become
                 READY (FAILED, or a status this SDK doesn't recognize).
+            TimeoutError: If the image is still PENDING after `timeout`.
         """
-        while True:
-            self.refresh()
-            match self.status:
-                case ContainerImageStatus.READY:
-                    return self
-                case ContainerImageStatus.PENDING:
-                    pass
-                case ContainerImageStatus.FAILED | ContainerImageStatus.UNSPECIFIED:
-                    raise NominalContainerImageError(
-                        f"Container image {self.rid!r} (tag {self.tag!r}) cannot become READY: "
-                        f"status is {self.status.name}."
-                    )
-                case _:
-                    assert_never(self.status)
-            time.sleep(interval.total_seconds())
+        poll_until_all_ready([self], interval, max_interval=max_interval, timeout=timeout)
+        return self
 
     @classmethod
     def _from_proto(cls, clients: _Clients, workspace_rid: str, msg: registry_pb2.ContainerImage) -> Self:
@@ -337,6 +337,56 @@ class ContainerImage(HasRid, RefreshableMixin[registry_pb2.ContainerImage]):
         )
 
 
+def poll_until_all_ready(
+    images: Sequence[ContainerImage],
+    interval: timedelta = timedelta(seconds=1),
+    *,
+    max_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+    timeout: timedelta | None = None,
+) -> Sequence[ContainerImage]:
+    """Block until the images have all finished processing server-side, refreshing each in place.
+
+    Every image still PENDING is refreshed together on each poll. The wait after the first poll is `interval`, and it
+    doubles after each poll that finds images still PENDING, up to `max_interval`. Each wait is randomly shortened by
+    up to half, so that many clients waiting on images at once don't poll the registry in lockstep.
+
+    Args:
+        images: Images to wait for.
+        interval: How long to wait after the first poll.
+        max_interval: Longest wait between polls.
+        timeout: Give up after this long and raise `TimeoutError`; None waits indefinitely.
+
+    Returns:
+        The images, in the same order, once all of their statuses are `ContainerImageStatus.READY`.
+
+    Raises:
+        NominalContainerImageError: If any image reaches a state from which it cannot become READY
+            (FAILED, or a status this SDK doesn't recognize).
+        TimeoutError: If any image is still PENDING after `timeout`.
+    """
+    backoff = PollBackoff(interval, max_interval, timeout=timeout, jitter=True)
+    pending = list(images)
+    while True:
+        # The API has no batch get, so the images are refreshed one request each
+        map_concurrently(lambda image: image.refresh(), pending, thread_name_prefix="nominal-container-image")
+        for image in pending:
+            match image.status:
+                case ContainerImageStatus.READY | ContainerImageStatus.PENDING:
+                    pass
+                case ContainerImageStatus.FAILED | ContainerImageStatus.UNSPECIFIED:
+                    raise NominalContainerImageError(
+                        f"Container image {image.rid!r} (tag {image.tag!r}) cannot become READY: "
+                        f"status is {image.status.name}."
+                    )
+                case _:
+                    assert_never(image.status)
+        pending = [image for image in pending if image.status is ContainerImageStatus.PENDING]
+        if not pending:
+            return images
+        if not backoff.wait():
+            raise TimeoutError(f"{len(pending)} of {len(images)} container images were still PENDING after {timeout}")
+
+
 def _get_container_image(clients: ContainerImage._Clients, rid: str) -> ContainerImage:
     ws = clients.resolve_default_workspace_rid()
     with translate_grpc_errors():
@@ -8,7 +8,9 @@ exactly one of which is active.
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
+from datetime import timedelta
 from pathlib import Path
 from typing import Iterable, Protocol, Sequence
 
@@ -20,6 +22,7 @@ from nominal.core._utils.api_tools import HasRid, RefreshableGrpcMixin, rid_from
 from nominal.core._utils.grpc_tools import translate_grpc_errors
 from nominal.core._utils.multipart import upload_multipart_file
 from nominal.core._utils.pagination_tools import search_containerized_extractors_paginated
+from nominal.core._utils.upload_cache import UploadCache, file_sha256
 from nominal.core.container_image import (
     REGISTERABLE_OUTPUT_FORMATS,
     ContainerImage,
@@ -30,11 +33,13 @@ from nominal.core.container_image import (
     TimestampMetadata,
     _search_container_images,
 )
-from nominal.core.exceptions import NominalContainerImageError
+from nominal.core.exceptions import NominalAlreadyExistsError, NominalContainerImageError, NominalError
 from nominal.protos.ingest.v2 import containerized_extractor_pb2, containerized_extractor_pb2_grpc
 from nominal.protos.registry.v2 import registry_pb2
 from nominal.ts import IntegralNanosecondsUTC
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extractor_pb2.ContainerizedExtractor]):
@@ -109,13 +114,17 @@ class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extracto
         """Unarchive this extractor, making it available for searching and ingesting once more."""
         self.update(is_archived=False)
 
-    def set_active_image(self, image: ContainerImage | str, *, poll_until_ready: bool = True) -> Self:
+    def set_active_image(
+        self, image: ContainerImage | str, *, poll_until_ready: bool = True, timeout: timedelta | None = None
+    ) -> Self:
         """Select the container image this extractor runs when ingesting.
 
         Args:
             image: Image (or RID of one) to activate. Must be registered against this extractor.
             poll_until_ready: If true, block until the image has finished processing before activating
                 it. If false, raise immediately if the image is not READY.
+            timeout: When polling, give up after this long and raise `TimeoutError`; None waits
+                indefinitely.
 
         Returns:
             This instance, refreshed with the newly activated image.
@@ -123,6 +132,7 @@ class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extracto
         Raises:
             NominalContainerImageError: If the image is not READY (or, when polling, reaches a state
                 from which it cannot become READY).
+            TimeoutError: If, when polling, the image is still PENDING after `timeout`.
         """
         if isinstance(image, str):
             with translate_grpc_errors():
@@ -134,7 +144,8 @@ class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extracto
             image.refresh()
 
         if poll_until_ready:
-            image.poll_until_ready()
+            if image.status is not ContainerImageStatus.READY:
+                image.poll_until_ready(timeout=timeout)
         elif image.status is not ContainerImageStatus.READY:
             raise NominalContainerImageError(
                 f"Cannot activate container image {image.rid!r} (tag {image.tag!r}): status is "
@@ -153,6 +164,7 @@ class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extracto
         default_timestamp_type: ts._AnyTimestampType,
         output_format: FileOutputFormat = FileOutputFormat.PARQUET,
         parameters: Sequence[FileExtractionParameter] = (),
+        upload_cache: UploadCache | None = None,
     ) -> ContainerImage:
         """Upload a `docker save` tarball and register it as a container image for this extractor.
 
@@ -177,6 +189,11 @@ class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extracto
                 `REGISTERABLE_OUTPUT_FORMATS` — the backend cannot currently ingest the others, so
                 registering an image with one would produce an extractor whose ingests always fail.
             parameters: Scalar parameters passed to the extractor.
+            upload_cache: If provided, the tarball's content digest is looked up in this cache, and a tarball
+                already uploaded to this workspace (e.g. the same image under another tag, or for another
+                extractor) is registered from its existing object instead of being uploaded again. New
+                uploads are recorded in the cache. If registering from a previous upload fails, e.g. because
+                the object has since expired, its entry is removed and the tarball is uploaded again.
 
         Returns:
             The newly registered image. Current backends push the image to the registry within this
@@ -196,29 +213,60 @@ class ContainerizedExtractor(HasRid, RefreshableGrpcMixin[containerized_extracto
                 f"extraction ingest; an image registered with it could never ingest data successfully. "
                 f"Supported formats: {supported}."
             )
-        s3_path = upload_multipart_file(
+        timestamp_metadata = TimestampMetadata(
+            series_name=default_timestamp_column, timestamp_type=default_timestamp_type
+        )
+
+        def create_image(s3_path: str) -> ContainerImage:
+            request = registry_pb2.CreateImageRequest(
+                workspace_rid=self._workspace_rid,
+                tag=tag,
+                object_path=s3_path,
+                extractor_rid=self.rid,
+                inputs=[i._to_proto() for i in inputs],
+                parameters=[p._to_proto() for p in parameters],
+                file_output_format=output_format._to_proto(),
+                default_timestamp_metadata=timestamp_metadata._to_proto(),
+            )
+            with translate_grpc_errors():
+                response = self._clients.registry.CreateImage(request)
+            return ContainerImage._from_proto(self._clients, self._workspace_rid, response.image)
+
+        tarball = Path(tarball)
+        if upload_cache is None:
+            return create_image(self._upload(tarball))
+
+        scope = f"{self._clients.app_base_url}/{self._workspace_rid}"
+        digest = file_sha256(tarball)
+        cached_s3_path = upload_cache.get(scope, digest)
+        if cached_s3_path is not None:
+            logger.info("reusing previous upload of %s (sha256:%s) at %s", tarball, digest, cached_s3_path)
+            try:
+                return create_image(cached_s3_path)
+            except NominalAlreadyExistsError:
+                raise
+            except NominalError:
+                # the previously uploaded object may have expired or been deleted since
+                logger.warning(
+                    "failed to register %s from its previous upload at %s, uploading it again",
+                    tarball,
+                    cached_s3_path,
+                    exc_info=True,
+                )
+                upload_cache.invalidate(scope, digest)
+
+        s3_path = self._upload(tarball)
+        upload_cache.put(scope, digest, s3_path)
+        return create_image(s3_path)
+
+    def _upload(self, tarball: Path) -> str:
+        return upload_multipart_file(
             self._clients.auth_header,
             self._workspace_rid,
-            Path(tarball),
+            tarball,
             self._clients.upload,
             header_provider=self._clients.header_provider,
         )
-        timestamp_metadata = TimestampMetadata(
-            series_name=default_timestamp_column, timestamp_type=default_timestamp_type
-        )
-        request = registry_pb2.CreateImageRequest(
-            workspace_rid=self._workspace_rid,
-            tag=tag,
-            object_path=s3_path,
-            extractor_rid=self.rid,
-            inputs=[i._to_proto() for i in inputs],
-            parameters=[p._to_proto() for p in parameters],
-            file_output_format=output_format._to_proto(),
-            default_timestamp_metadata=timestamp_metadata._to_proto(),
-        )
-        with translate_grpc_errors():
-            response = self._clients.registry.CreateImage(request)
-        return ContainerImage._from_proto(self._clients, self._workspace_rid, response.image)
 
     def search_container_images(
         self, *, tag: str | None = None, status: ContainerImageStatus | None = None
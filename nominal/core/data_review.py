@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from datetime import timedelta
-from time import sleep
-from typing import TYPE_CHECKING, Iterable, Protocol, Sequence
+from typing import TYPE_CHECKING, Iterable, Iterator, Protocol, Sequence
 
 from nominal_api import (
     scout,
@@ -15,6 +15,8 @@ from nominal_api import (
 )
 from typing_extensions import Self
 
+from nominal._utils.iterator_tools import batched, chain_concurrently, map_concurrently
+from nominal._utils.polling_tools import PollBackoff
 from nominal.core._checklist_types import Priority, _conjure_priority_to_priority
 from nominal.core._clientsbunch import HasScoutParams
 from nominal.core._utils.api_tools import HasRid, rid_from_instance_or_string
@@ -30,6 +32,10 @@ if TYPE_CHECKING:
     from nominal.core.checklist import Checklist
     from nominal.core.run import Run
 
+# Default number of events resolved per request, and requests in flight, when iterating a data review's events
+DEFAULT_EVENT_BATCH_SIZE = 500
+DEFAULT_EVENT_PARALLELISM = 4
+
 
 @dataclass(frozen=True)
 class DataReview(HasRid):
@@ -82,6 +88,23 @@ class DataReview(HasRid):
 
     def get_events(self) -> Sequence[Event]:
         """Retrieves the list of events for the data review."""
+        return list(self.iter_events())
+
+    def iter_events(
+        self, *, batch_size: int = DEFAULT_EVENT_BATCH_SIZE, parallelism: int = DEFAULT_EVENT_PARALLELISM
+    ) -> Iterator[Event]:
+        """Iterates over the events for the data review, resolving them in batches as they are consumed.
+
+        Up to `parallelism` batches are requested at once, so memory use and the time until the first event is
+        yielded do not grow with the number of events.
+
+        Args:
+            batch_size: Number of events to resolve per request.
+            parallelism: Maximum number of batches requested, or buffered ahead of the consumer, at once.
+
+        Yields:
+            The data review's events, in the order the checks generated them.
+        """
         data_review_response = self._clients.datareview.get(self._clients.auth_header, self.rid).check_evaluations
         all_event_rids = [
             event_rid
@@ -89,10 +112,11 @@ class DataReview(HasRid):
             if check.state._generated_alerts
             for event_rid in check.state._generated_alerts.event_rids
         ]
-        return [
-            Event._from_proto(self._clients, data_review_event)
-            for data_review_event in _get_events(self._clients, all_event_rids)
+        sources = [
+            functools.partial(_get_events, self._clients, batch) for batch in batched(all_event_rids, batch_size)
         ]
+        for data_review_event in chain_concurrently(sources, max_workers=parallelism, max_buffered=batch_size):
+            yield Event._from_proto(self._clients, data_review_event)
 
     def reload(self) -> DataReview:
         """Reloads the data review from the server."""
@@ -100,13 +124,18 @@ class DataReview(HasRid):
             self._clients, self._clients.datareview.get(self._clients.auth_header, self.rid)
         )
 
-    def poll_for_completion(self, interval: timedelta = timedelta(seconds=2)) -> DataReview:
-        """Polls the data review until it is completed."""
-        review = self
-        while not review.completed:
-            sleep(interval.total_seconds())
-            review = review.reload()
-        return review
+    def poll_for_completion(
+        self,
+        interval: timedelta = timedelta(seconds=2),
+        *,
+        max_interval: timedelta = timedelta(seconds=30),
+        timeout: timedelta | None = None,
+    ) -> DataReview:
+        """Polls the data review until it is completed.
+
+        See `poll_until_completed` for a description of the arguments.
+        """
+        return poll_until_completed([self], interval, max_interval=max_interval, timeout=timeout)[0]
 
     def archive(self) -> None:
         """Archive this data review.
@@ -231,10 +260,14 @@ class DataReviewBuilder:
         )
         response = self._clients.datareview.batch_initiate(self._clients.auth_header, request)
 
-        data_reviews = [
-            DataReview._from_conjure(self._clients, self._clients.datareview.get(self._clients.auth_header, rid))
-            for rid in response.rids
-        ]
+        # The API has no batch get, so the reviews are fetched one request each
+        data_reviews = map_concurrently(
+            lambda rid: DataReview._from_conjure(
+                self._clients, self._clients.datareview.get(self._clients.auth_header, rid)
+            ),
+            response.rids,
+            thread_name_prefix="nominal-data-review",
+        )
         if wait_for_completion:
             return poll_until_completed(data_reviews)
         else:
@@ -242,9 +275,42 @@ class DataReviewBuilder:
 
 
 def poll_until_completed(
-    data_reviews: Sequence[DataReview], interval: timedelta = timedelta(seconds=2)
+    data_reviews: Sequence[DataReview],
+    interval: timedelta = timedelta(seconds=2),
+    *,
+    max_interval: timedelta = timedelta(seconds=30),
+    timeout: timedelta | None = None,
 ) -> Sequence[DataReview]:
-    return [review.poll_for_completion(interval) for review in data_reviews]
+    """Polls the data reviews until they have all completed.
+
+    Every review still running is reloaded together on each poll. The wait before the first poll is `interval`,
+    and it doubles after each poll that finds reviews still running, up to `max_interval`.
+
+    Args:
+        data_reviews: Data reviews to wait for.
+        interval: How long to wait before polling for the first time.
+        max_interval: Longest wait between polls.
+        timeout: Give up after this long and raise `TimeoutError`; None waits indefinitely.
+
+    Returns:
+        The completed data reviews, in the same order as `data_reviews`.
+
+    Raises:
+        TimeoutError: if any data review is still running after `timeout`.
+    """
+    backoff = PollBackoff(interval, max_interval, timeout=timeout)
+    reviews = list(data_reviews)
+    while running := [idx for idx, review in enumerate(reviews) if not review.completed]:
+        if not backoff.wait():
+            raise TimeoutError(f"{len(running)} of {len(reviews)} data reviews were still running after {timeout}")
+        reloaded = map_concurrently(
+            lambda review: review.reload(),
+            [reviews[idx] for idx in running],
+            thread_name_prefix="nominal-data-review",
+        )
+        for idx, review in zip(running, reloaded):
+            reviews[idx] = review
+    return reviews
 
 
 def _iter_search_data_reviews(
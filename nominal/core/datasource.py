@@ -116,6 +116,9 @@ class DataSource(HasRid):
     ) -> Iterable[Channel]:
         """Look up the metadata for all matching channels associated with this datasource
 
+        Channel metadata is cached per client for a short time (see `ChannelMetadataCache`), so repeated lookups
+        of the same channels only reach the API for channels that are not already cached.
+
         Args:
         ----
             names: List of channel names to look up metadata for.
@@ -126,9 +129,14 @@ class DataSource(HasRid):
 
         """
         if not names:
-            names = [channel.name for channel in self.search_channels()]
+            # search results carry the full channel metadata (and fill the cache), so there's nothing to re-fetch
+            yield from self.search_channels()
+            return
 
-        for batch_channel_names in batched(names, _DEFAULT_CHANNEL_BATCH_SIZE):
+        names = list(names)
+        cache = self._clients.channel_metadata_cache
+        found, missing = cache.get_many(self.rid, names)
+        for batch_channel_names in batched(missing, _DEFAULT_CHANNEL_BATCH_SIZE):
             requests = [
                 timeseries_channelmetadata_api.GetChannelMetadataRequest(
                     channel_identifier=timeseries_channelmetadata_api.ChannelIdentifier(
@@ -142,7 +150,10 @@ class DataSource(HasRid):
             response = self._clients.channel_metadata.batch_get_channel_metadata(
                 self._clients.auth_header, batch_request
             )
-            yield from (Channel._from_channel_metadata_api(self._clients, channel) for channel in response.responses)
+            cache.put_many(response.responses)
+            found.update((channel.channel_identifier.channel_name, channel) for channel in response.responses)
+
+        yield from (Channel._from_channel_metadata_api(self._clients, found[name]) for name in names if name in found)
 
     @overload
     def get_write_stream(
@@ -240,6 +251,7 @@ class DataSource(HasRid):
                 prefix=None,
             )
             response = self._clients.datasource.search_channels(self._clients.auth_header, query)
+            self._clients.channel_metadata_cache.put_search_results(response.results)
             for channel_metadata in response.results:
                 # If user provided a set of datatypes to filter on, ensure the channel has the right type
                 # TODO (drake): move this into the backend
@@ -311,6 +323,7 @@ class DataSource(HasRid):
         # Set units in database using batch update
         batch_request = timeseries_channelmetadata_api.BatchUpdateChannelMetadataRequest(requests=update_requests)
         self._clients.channel_metadata.batch_update_channel_metadata(self._clients.auth_header, batch_request)
+        self._clients.channel_metadata_cache.invalidate(self.rid, channels_to_units)
 
     def set_channel_prefix_tree(self, delimiter: str = ".") -> None:
         """Index channels hierarchically by a given delimiter.
@@ -413,6 +426,7 @@ class DataSource(HasRid):
                 self._clients.series_metadata.batch_create_or_update(self._clients.auth_header, batch_request)
             else:
                 self._clients.series_metadata.batch_create(self._clients.auth_header, batch_request)
+        self._clients.channel_metadata_cache.invalidate(self.rid, [req.name for req in channels])
         created = {ch.name: ch for ch in self.get_channels(names=[req.name for req in channels])}
         return BatchAddChannelsResult(
             channels=list(created.values()),
@@ -12,7 +12,7 @@ from nominal.core._event_types import EventType as EventType  # noqa: PLC0414
 from nominal.core._event_types import SearchEventOriginType as SearchEventOriginType  # noqa: PLC0414
 from nominal.core._utils.api_tools import HasRid, RefreshableGrpcMixin, rid_from_instance_or_string
 from nominal.core._utils.grpc_tools import translate_grpc_errors
-from nominal.core._utils.pagination_tools import search_events_paginated
+from nominal.core._utils.pagination_tools import DEFAULT_PREFETCH_PAGES, search_events_paginated
 from nominal.core._utils.query_tools import ArchiveStatusFilter, AssetMatch, create_search_events_query
 from nominal.core.exceptions import NominalNotFoundError
 from nominal.protos.event.v2 import event_pb2, event_pb2_grpc
@@ -218,7 +218,7 @@ def _iter_search_events(
     query: event_pb2.SearchQuery,
     archive_status: ArchiveStatusFilter = ArchiveStatusFilter.NOT_ARCHIVED,
 ) -> Iterable[Event]:
-    for e in search_events_paginated(clients.event, query, archive_status):
+    for e in search_events_paginated(clients.event, query, archive_status, prefetch=DEFAULT_PREFETCH_PAGES):
         yield Event._from_proto(clients, e)
 
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from types import MappingProxyType
 from typing import Iterable, Mapping
 
-from nominal_api import api, datasource, scout_compute_api, storage_writer_api
+from nominal_api import datasource, scout_compute_api, storage_writer_api
 from typing_extensions import Self
 
 from nominal._utils import batched
@@ -45,9 +45,9 @@ class LogPoint:
         )
 
     @classmethod
-    def _from_compute_api(cls, point: scout_compute_api.LogValue, timestamp: api.Timestamp) -> Self:
+    def _from_compute_api(cls, point: scout_compute_api.LogValue, timestamp: IntegralNanosecondsUTC) -> Self:
         return cls(
-            timestamp=_SecondsNanos.from_api(timestamp).to_nanoseconds(),
+            timestamp=timestamp,
             message=point.message,
             args=point.args,
         )
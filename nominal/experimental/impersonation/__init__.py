@@ -17,5 +17,7 @@ def as_user(client: NominalClient, user_rid: str) -> NominalClient:
         trust_store_path=security.trust_store_path if security is not None else None,
         connect_timeout=client._clients._service_config.connect_timeout,
         extra_headers={ON_BEHALF_OF_USER_RID_HEADER: user_rid},
+        channel_cache_ttl=client._clients.channel_metadata_cache.ttl,
+        channel_cache_max_size=client._clients.channel_metadata_cache.max_size,
         _profile=client._profile,
     )
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
+import collections
 import datetime
 import logging
+import threading
+import time
 from types import TracebackType
-from typing import Mapping, Type
+from typing import Literal, Mapping, Type
 
+from nominal.core._stream.write_stream import WriteStream
 from nominal.core.dataset import Dataset
-from nominal.core.log import LogPoint
+
+DropPolicy = Literal["block", "drop_newest", "drop_oldest"]
+"""What `emit` does when the hand-off buffer is full.
+
+- "block": wait for the background worker to make room (lossless, may stall the logging thread)
+- "drop_newest": discard the record being emitted
+- "drop_oldest": evict the oldest buffered record to make room for the new one
+"""
+
+_IDLE_POLL_INTERVAL = 0.05  # how long the worker naps when the buffer is empty
+_BLOCK_POLL_INTERVAL = 0.001  # how long a blocked `emit` naps before re-checking for room
+_WORKER_BATCH_SIZE = 1_000  # records drained per pass before re-checking for shutdown
 
 
 class NominalLogHandler(logging.Handler):
     """A custom logging handler that batches log records and sends them to Nominal in a background thread.
 
+    `emit` only appends the raw `LogRecord` to a bounded buffer — no formatting, no serialization and no
+    handler lock on the logging thread. A background worker drains the buffer, formats each record and
+    feeds the dataset's log stream, which batches and uploads them. Because formatting is deferred, a
+    message whose `%`-args are mutated right after the logging call may render the mutated value.
+
     NOTE: to log custom args from a `logger.log(...)` statement, you can pass args as a dictionary via `extras`
           Example:
             logger.info("infotainment logs", extra={"nominal_args": {"country": "america", "count": 1234}})
@@ -25,6 +45,8 @@ class NominalLogHandler(logging.Handler):
         max_batch_size: int = 50_000,
         flush_interval: datetime.timedelta = datetime.timedelta(seconds=1),
         default_args: Mapping[str, str] | None = None,
+        buffer_size: int = 100_000,
+        drop_policy: DropPolicy = "block",
     ):
         """Initializes the handler.
 
@@ -34,39 +56,181 @@ class NominalLogHandler(logging.Handler):
             max_batch_size: The maximum number of records to hold in the queue before flushing.
             flush_interval: The maximum time to wait before flushing the queue.
             default_args: Default key-value pairs to use as arg in all log messages
+            buffer_size: Maximum number of records waiting for the background worker.
+            drop_policy: What to do with new records when the buffer is full. See `DropPolicy`.
         """
         super().__init__()
+        if buffer_size <= 0:
+            raise ValueError(f"buffer_size must be positive, got {buffer_size}")
         self._log_stream = dataset.get_log_stream(
             batch_size=max_batch_size,
             max_wait=flush_interval,
         )
         self._log_channel = log_channel
         self._default_args = default_args or {}
+        self._buffer_size = buffer_size
+        self._drop_policy = drop_policy
+        # deque appends and pops are atomic, so producers and the worker never share a lock. With
+        # "drop_oldest" the deque evicts by itself; the other policies check the length first, which
+        # may overshoot the bound by at most one record per concurrent producer.
+        self._buffer: collections.deque[logging.LogRecord] = collections.deque(
+            maxlen=buffer_size if drop_policy == "drop_oldest" else None
+        )
+        # Only the overflow path touches this lock, never a successful hand-off.
+        self._dropped_lock = threading.Lock()
+        self._dropped = 0
+        self._stopping = threading.Event()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        # Guards handing the log stream's close to the worker when `close` times out while it is still shipping.
+        self._exit_lock = threading.Lock()
+        self._worker_exited = False
+        self._close_stream_on_exit = False
+        self._worker = threading.Thread(target=self._run_worker, name="nominal-log-handler", daemon=True)
+        self._worker.start()
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of records discarded because the buffer was full or the handler was closed."""
+        with self._dropped_lock:
+            return self._dropped
+
+    def _drop(self) -> None:
+        with self._dropped_lock:
+            self._dropped += 1
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter and emit `record` without taking the handler lock: the buffer hand-off is thread-safe."""
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return bool(rv)
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Puts a log record into the queue"""
-        if not self.filter(record):
+        """Hand a log record off to the background worker"""
+        if self._stopping.is_set():
+            self._drop()
             return
 
-        extra_data = getattr(record, "nominal_args") if hasattr(record, "nominal_args") else {}
-        args = {
-            "level": record.levelname,
-            "filename": record.filename,
-            "function": record.funcName,
-            "line": str(record.lineno),
-            **self._default_args,
-            **{str(k): str(v) for k, v in extra_data.items()},
-        }
-        log_entry = LogPoint(int(record.created * 1e9), message=self.format(record), args=args)
+        if self._drop_policy == "drop_oldest":
+            if len(self._buffer) >= self._buffer_size:
+                self._drop()
+        elif len(self._buffer) >= self._buffer_size:
+            if self._drop_policy == "drop_newest":
+                self._drop()
+                return
+            while len(self._buffer) >= self._buffer_size and not self._stopping.is_set():
+                self._wakeup.set()
+                time.sleep(_BLOCK_POLL_INTERVAL)
+
+        self._buffer.append(record)
+
+    def _run_worker(self) -> None:
+        try:
+            self._drain_buffer()
+        finally:
+            with self._exit_lock:
+                self._worker_exited = True
+                close_stream = self._close_stream_on_exit
+            if close_stream:
+                self._close_stream(wait=False)
+
+    def _drain_buffer(self) -> None:
+        while True:
+            if not self._buffer:
+                self._idle.set()
+                if self._stopping.is_set():
+                    return
+                self._wakeup.wait(_IDLE_POLL_INTERVAL)
+                self._wakeup.clear()
+                continue
+
+            # Cleared before popping so `flush` never sees an empty buffer and an idle worker while a
+            # popped record is still being formatted.
+            self._idle.clear()
+            for _ in range(_WORKER_BATCH_SIZE):
+                try:
+                    record = self._buffer.popleft()
+                except IndexError:
+                    break
+                self._ship(record)
 
+    def _ship(self, record: logging.LogRecord) -> None:
         try:
-            self._log_stream.enqueue(self._log_channel, log_entry.timestamp, log_entry.message, log_entry.args)
+            extra_data = getattr(record, "nominal_args") if hasattr(record, "nominal_args") else {}
+            args = {
+                "level": record.levelname,
+                "filename": record.filename,
+                "function": record.funcName,
+                "line": str(record.lineno),
+                **self._default_args,
+                **{str(k): str(v) for k, v in extra_data.items()},
+            }
+            self._log_stream.enqueue(self._log_channel, int(record.created * 1e9), self.format(record), args)
         except Exception:
             self.handleError(record)
 
-    def close(self) -> None:
-        """Shutoff log handler from sending logs to Nominal"""
-        self._log_stream.close()
+    def _wait_for_worker(self, deadline: float | None) -> bool:
+        """Wait until every record handed off so far has reached the log stream."""
+        while True:
+            # Order matters: the worker clears `_idle` before popping, so an empty buffer followed by a
+            # set `_idle` means everything popped before the buffer emptied has been shipped.
+            if not self._buffer and self._idle.is_set():
+                return True
+            if not self._worker.is_alive():
+                return False
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._wakeup.set()
+            self._idle.wait(_IDLE_POLL_INTERVAL if remaining is None else min(remaining, _IDLE_POLL_INTERVAL))
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Deliver every record emitted so far, waiting at most `timeout` seconds (None waits indefinitely)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._wait_for_worker(deadline):
+            return
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+        if isinstance(self._log_stream, WriteStream):
+            self._log_stream.flush(wait=True, timeout=remaining)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Shutoff log handler from sending logs to Nominal
+
+        Buffered records are shipped before the log stream is closed. Without a `timeout`, the stream's close waits
+        for all of its uploads to finish. With one, records still in the buffer when it expires are dropped, and
+        the stream is closed without waiting for uploads still in progress; if the worker is still shipping a
+        record at that point, the stream is closed once it finishes instead.
+        """
+        if self._stopping.is_set():
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._wait_for_worker(deadline)
+        self._stopping.set()
+        self._wakeup.set()
+        self._worker.join(None if deadline is None else max(deadline - time.monotonic(), 0.0))
+        while self._buffer:
+            self._buffer.popleft()
+            self._drop()
+        with self._exit_lock:
+            # never close the stream while the worker may still enqueue into it
+            worker_exited = self._worker_exited
+            self._close_stream_on_exit = not worker_exited
+        if worker_exited:
+            if deadline is None:
+                self._close_stream(wait=True)
+            else:
+                if isinstance(self._log_stream, WriteStream):
+                    self._log_stream.flush(wait=True, timeout=max(deadline - time.monotonic(), 0.0))
+                self._close_stream(wait=False)
+        super().close()
+
+    def _close_stream(self, wait: bool) -> None:
+        if isinstance(self._log_stream, WriteStream):
+            self._log_stream.close(wait=wait)
+        else:
+            self._log_stream.close()
 
     def __exit__(
         self, exc_type: Type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
@@ -108,6 +272,8 @@ def install_nominal_log_handler(
     level: int = logging.INFO,
     logger: logging.Logger | None = None,
     default_args: Mapping[str, str] | None = None,
+    buffer_size: int = 100_000,
+    drop_policy: DropPolicy = "block",
 ) -> NominalLogHandler:
     """Install and configure a NominalLogHandler on the provided logger instance.
 
@@ -117,6 +283,8 @@ def install_nominal_log_handler(
         level: Minimum log level to send to Nominal
         logger: Logger instance to attach the log handler to. Attaches to the root logger by default
         default_args: Key-value arguments to apply to all log messages by default
+        buffer_size: Maximum number of records waiting to be formatted and shipped in the background
+        drop_policy: What to do with new records when the buffer is full. See `DropPolicy`.
 
     Returns:
         Attached NominalLogHandler
@@ -124,7 +292,13 @@ def install_nominal_log_handler(
     if logger is None:
         logger = logging.getLogger()
 
-    handler = NominalLogHandler(dataset, log_channel=log_channel, default_args=default_args)
+    handler = NominalLogHandler(
+        dataset,
+        log_channel=log_channel,
+        default_args=default_args,
+        buffer_size=buffer_size,
+        drop_policy=drop_policy,
+    )
     handler.setLevel(level)
     # Logs from urllib3 while uploading logs result in an infinite loop of producing logs
     # while uploading logs to Nominal. They are typically pretty spammy logs anyways, so
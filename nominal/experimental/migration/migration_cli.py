@@ -18,9 +18,19 @@ from nominal.experimental.migration.config.migration_data_config import AssetInc
 from nominal.experimental.migration.config.migration_resources import AssetResources, MigrationResources
 from nominal.experimental.migration.migration_decorators import migration_client_options
 from nominal.experimental.migration.migration_runner import MigrationRunner
-from nominal.experimental.migration.migration_summary import build_summary, load_migration_block
+from nominal.experimental.migration.migration_summary import (
+    build_summary,
+    load_migration_block,
+    render_request_rate_table,
+)
 from nominal.experimental.migration.migrator.context import DestinationClientResolver
 from nominal.experimental.migration.parallel_migration_runner import run_parallel_migration
+from nominal.experimental.migration.request_pacing import (
+    DEFAULT_MAX_CONCURRENCY,
+    DESTINATION_TENANT,
+    SOURCE_TENANT,
+    MigrationRequestPacer,
+)
 from nominal.experimental.migration.resource_type import ResourceType
 from nominal.experimental.migration.utils.video_file_utils import DEFAULT_INGEST_POLL_TIMEOUT
 from nominal.protos.sandbox.v1 import sandbox_workspace_pb2
@@ -256,17 +266,28 @@ def get_source_user_rid(source_resource: Any) -> str | None:
 def build_destination_client_resolver(
     destination_client: NominalClient,
     impersonation_config: ImpersonationConfig | None,
+    request_pacer: MigrationRequestPacer | None = None,
 ) -> DestinationClientResolver | None:
     if impersonation_config is None or not impersonation_config.enabled:
         return None
-    return ImpersonatingDestinationClientResolver(destination_client, impersonation_config)
+    return ImpersonatingDestinationClientResolver(destination_client, impersonation_config, request_pacer)
 
 
 class ImpersonatingDestinationClientResolver:
-    def __init__(self, destination_client: NominalClient, impersonation_config: ImpersonationConfig) -> None:
-        """Create a destination client resolver backed by impersonated client caching."""
+    def __init__(
+        self,
+        destination_client: NominalClient,
+        impersonation_config: ImpersonationConfig,
+        request_pacer: MigrationRequestPacer | None = None,
+    ) -> None:
+        """Create a destination client resolver backed by impersonated client caching.
+
+        Impersonated clients are installed on `request_pacer`, if given, so their traffic shares the
+        destination tenant's request lane and counters.
+        """
         self._destination_client = destination_client
         self._impersonation_config = impersonation_config
+        self._request_pacer = request_pacer
         self._impersonated_clients_by_user_rid: dict[str, NominalClient] = {}
         self._lock = threading.Lock()
 
@@ -300,9 +321,10 @@ class ImpersonatingDestinationClientResolver:
                     source_user_rid,
                     destination_user_rid,
                 )
-                self._impersonated_clients_by_user_rid[destination_user_rid] = as_user(
-                    self._destination_client, destination_user_rid
-                )
+                impersonated_client = as_user(self._destination_client, destination_user_rid)
+                if self._request_pacer is not None:
+                    self._request_pacer.install(impersonated_client, DESTINATION_TENANT)
+                self._impersonated_clients_by_user_rid[destination_user_rid] = impersonated_client
 
         logger.debug(
             "Using impersonated destination client for %s (rid: %s): source user %s -> destination user %s.",
@@ -502,6 +524,31 @@ def migrate_cmd() -> None:
     type=click.IntRange(min=1),
     help="Maximum number of top-level asset/template migrations to run concurrently.",
 )
+@click.option(
+    "--adaptive-concurrency",
+    "adaptive_concurrency",
+    is_flag=True,
+    default=False,
+    help=(
+        "Admit requests to both tenants through one shared lane that widens while responses are healthy "
+        "and narrows on throttling (429/503) or sustained latency spikes, up to --max-request-concurrency "
+        "concurrent requests."
+    ),
+)
+@click.option(
+    "--max-request-concurrency",
+    "max_request_concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --adaptive-concurrency, the most requests to both tenants combined that may be in flight at once.",
+)
+@click.option(
+    "--summary-output",
+    "summary_output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="File to append the per-tenant request-rate summary to, e.g. $GITHUB_STEP_SUMMARY.",
+)
 @click.option(
     "--video-ingest-timeout-seconds",
     default=int(DEFAULT_INGEST_POLL_TIMEOUT.total_seconds()),
@@ -524,10 +571,18 @@ def copy(
     config_path: Path,
     migration_state_path: Path | None,
     max_workers: int,
+    adaptive_concurrency: bool,
+    max_request_concurrency: int,
+    summary_output_path: Path | None,
     video_ingest_timeout_seconds: int,
     dry_run: bool,
 ) -> None:
     source_client, target_client = clients
+    # Always installed for the per-tenant request metrics; only --adaptive-concurrency adds the shared
+    # request lane, otherwise requests are neither limited nor delayed.
+    request_pacer = MigrationRequestPacer(max_request_concurrency, adaptive=adaptive_concurrency)
+    request_pacer.install(source_client, SOURCE_TENANT)
+    request_pacer.install(target_client, DESTINATION_TENANT)
     logger.info("Loading migration config from: %s", config_path)
     (
         name,
@@ -559,7 +614,7 @@ def copy(
         len(migration_resources.source_standalone_templates),
         len(migration_resources.source_standalone_checklists),
     )
-    destination_client_resolver = build_destination_client_resolver(target_client, impersonation_config)
+    destination_client_resolver = build_destination_client_resolver(target_client, impersonation_config, request_pacer)
     if destination_client_resolver is not None:
         logger.info("Destination impersonation is enabled for this migration config.")
 
@@ -581,12 +636,23 @@ def copy(
             timedelta(seconds=video_ingest_timeout_seconds) if video_ingest_timeout_seconds > 0 else None
         ),
     )
-    run_parallel_migration(runner, max_workers=max_workers)
+    try:
+        run_parallel_migration(runner, max_workers=max_workers)
+    finally:
+        _report_request_rates(request_pacer, summary_output_path)
 
     if set_to_demo_workbook and not dry_run:
         _update_demo_workbooks(target_client, runner)
 
 
+def _report_request_rates(request_pacer: MigrationRequestPacer, summary_output_path: Path | None) -> None:
+    rendered = render_request_rate_table(request_pacer.stats(), request_pacer.peak_concurrency_limit)
+    logger.info("Request rates for this migration:\n%s", rendered)
+    if summary_output_path is not None:
+        with summary_output_path.open("a", encoding="utf-8") as f:
+            f.write(rendered + "\n")
+
+
 def _categorize_workbooks(workbooks: Sequence[Workbook]) -> tuple[set[str], set[str]]:
     single: set[str] = set()
     multi: set[str] = set()
@@ -9,6 +9,9 @@ Three modes, all fully offline (no profiles, no tokens, no network):
   (see :mod:`nominal.experimental.migration.dry_run`).
 * from a migration-state JSON — counts old->new RID mappings by resource type to report what a
   real (non-dry-run) migration actually created.
+
+A live ``nom migrate copy`` additionally reports its per-tenant request rates with
+:func:`render_request_rate_table`.
 """
 
 from __future__ import annotations
@@ -16,13 +19,14 @@ from __future__ import annotations
 import json
 from collections import Counter
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 import click
 import yaml
 
 from nominal.experimental.migration.dry_run import dry_run_create_pattern
 from nominal.experimental.migration.migration_state import MigrationState
+from nominal.experimental.migration.request_pacing import TenantRequestStats
 from nominal.experimental.migration.resource_type import format_resource_label
 
 
@@ -50,6 +54,25 @@ def render_summary_table(title: str, counts: Mapping[str, int]) -> str:
     return "\n".join(lines) + "\n"
 
 
+def render_request_rate_table(stats: Sequence[TenantRequestStats], peak_concurrency: int | None = None) -> str:
+    """Render per-tenant request counters from a live migration as a markdown table."""
+    lines = ["## Migration requests by tenant", ""]
+    if peak_concurrency is not None:
+        lines += [f"Peak request concurrency: {peak_concurrency}", ""]
+    lines += [
+        "| Tenant | Requests | Requests/s | Throttled | Errors | Mean latency (s) |",
+        "| --- | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    if not stats:
+        lines.append("| _(none)_ | 0 | 0.00 | 0 | 0 | 0.000 |")
+    for s in stats:
+        lines.append(
+            f"| {s.tenant} | {s.requests} | {s.requests_per_second:.2f} | {s.throttled} | {s.errors} "
+            f"| {s.mean_latency_seconds:.3f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
 def summarize_config(path: Path) -> tuple[str, dict[str, int]]:
     """Static counts from a config YAML, without contacting any tenant."""
     with path.open("r", encoding="utf-8") as f:
@@ -0,0 +1,349 @@
+"""Adaptive request pacing for migrations: one AIMD lane shared by both tenants.
+
+A migration drives two tenants at once — reads from the source, writes to the destination — and
+the right amount of parallelism depends on both servers' admission budgets, which the user cannot
+know up front. Instead of a static worker count, every conjure request either client sends is
+admitted through one lane whose width is steered by an additive-increase/multiplicative-decrease
+controller:
+
+- each healthy response widens the lane by ``1 / limit`` (so roughly one extra slot per full
+  window of successes);
+- a throttle (429/503, or the transport's retry ladder running out) or a sustained latency
+  blow-up halves it, at most once per cooldown so one burst of refusals is one decrease.
+
+Throttles also bump the ingest uploader's shared damper (`_GlobalBackoff`), so a stormed lane
+spaces out new admissions as well as narrowing. Per-tenant request counters ride along on the
+same hook and feed the request-rate table logged at the end of ``nom migrate copy``; without
+``--adaptive-concurrency`` only the counters are installed, and requests are not limited or delayed.
+
+Only conjure (HTTP) services are paced; gRPC stubs share a channel that is built before the
+pacer exists, and S3 part uploads go through their own sessions, not the Nominal API.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping
+
+import requests
+from conjure_python_client import Service
+from requests.adapters import BaseAdapter
+
+from nominal.core.client import NominalClient
+from nominal.experimental.ingest._upload_pacing import _GlobalBackoff, _is_throttle_error
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TENANT = "source"
+DESTINATION_TENANT = "destination"
+
+DEFAULT_INITIAL_CONCURRENCY = 2
+DEFAULT_MAX_CONCURRENCY = 16
+
+_DECREASE_FACTOR = 0.5
+_DECREASE_COOLDOWN_S = 1.0  # one storm of refusals is one decrease, not one per in-flight request
+# Smoothed latency this many times the observed floor counts as overload. Deliberately loose:
+# migration traffic mixes cheap lookups with large writes, so only a sustained blow-up should bite.
+_LATENCY_TOLERANCE = 4.0
+_LATENCY_SMOOTHING = 0.2
+_BASELINE_DRIFT = 0.01  # lets the latency floor creep up if the server is persistently slower
+
+
+@dataclass(frozen=True)
+class TenantRequestStats:
+    """Request counters for one tenant over the life of a migration."""
+
+    tenant: str
+    requests: int
+    throttled: int
+    errors: int
+    elapsed_seconds: float
+    mean_latency_seconds: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class _TenantCounters:
+    def __init__(self, tenant: str) -> None:
+        self._tenant = tenant
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._throttled = 0
+        self._errors = 0
+        self._total_latency = 0.0
+        self._first_started: float | None = None
+        self._last_finished: float | None = None
+
+    def record(self, *, started: float, finished: float, throttled: bool, failed: bool) -> None:
+        with self._lock:
+            self._requests += 1
+            self._throttled += int(throttled)
+            self._errors += int(failed)
+            self._total_latency += finished - started
+            if self._first_started is None or started < self._first_started:
+                self._first_started = started
+            if self._last_finished is None or finished > self._last_finished:
+                self._last_finished = finished
+
+    def snapshot(self) -> TenantRequestStats:
+        with self._lock:
+            elapsed = 0.0
+            if self._first_started is not None and self._last_finished is not None:
+                elapsed = self._last_finished - self._first_started
+            return TenantRequestStats(
+                tenant=self._tenant,
+                requests=self._requests,
+                throttled=self._throttled,
+                errors=self._errors,
+                elapsed_seconds=elapsed,
+                mean_latency_seconds=self._total_latency / self._requests if self._requests else 0.0,
+            )
+
+
+class _AIMDLimiter:
+    """A concurrency lane whose width follows an AIMD controller.
+
+    `acquire` blocks while ``in_flight >= floor(limit)``; `release` feeds the outcome of the
+    request back into the controller. A request that failed for a reason other than throttling
+    carries no signal about load and leaves the limit alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        initial_concurrency: int,
+        min_concurrency: int = 1,
+        backoff: _GlobalBackoff | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float], float] | None = None,
+    ) -> None:
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"expected 1 <= min_concurrency <= max_concurrency, got {min_concurrency} and {max_concurrency}"
+            )
+        self._min = float(min_concurrency)
+        self._max = float(max_concurrency)
+        self._limit = float(max(min_concurrency, min(initial_concurrency, max_concurrency)))
+        self._backoff = backoff if backoff is not None else _GlobalBackoff()
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter if jitter is not None else (lambda delay: random.uniform(0.0, delay))
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._peak_limit = self._limit
+        self._last_decrease = float("-inf")
+        self._baseline_latency: float | None = None
+        self._smoothed_latency: float | None = None
+
+    @property
+    def limit(self) -> int:
+        with self._cond:
+            return int(self._limit)
+
+    @property
+    def peak_limit(self) -> int:
+        with self._cond:
+            return int(self._peak_limit)
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return self._in_flight
+
+    def acquire(self) -> None:
+        # Damper sleep happens before admission: a backing-off thread must never hold a slot.
+        delay = self._backoff.current
+        if delay > 0.0:
+            self._sleep(self._jitter(delay))
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, *, latency_seconds: float | None, throttled: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self._backoff.on_throttle()
+                self._decrease()
+            elif latency_seconds is not None:
+                self._backoff.on_success()
+                if self._observe_latency(latency_seconds):
+                    self._decrease()
+                else:
+                    self._limit = min(self._max, self._limit + 1.0 / self._limit)
+                    self._peak_limit = max(self._peak_limit, self._limit)
+            self._cond.notify_all()
+
+    def _observe_latency(self, latency: float) -> bool:
+        """Fold one sample into the latency model; True if the lane now looks overloaded."""
+        if self._baseline_latency is None or self._smoothed_latency is None:
+            self._baseline_latency = self._smoothed_latency = latency
+            return False
+        self._baseline_latency = min(
+            latency, self._baseline_latency + _BASELINE_DRIFT * (latency - self._baseline_latency)
+        )
+        self._smoothed_latency += _LATENCY_SMOOTHING * (latency - self._smoothed_latency)
+        return self._smoothed_latency > _LATENCY_TOLERANCE * self._baseline_latency
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease < _DECREASE_COOLDOWN_S:
+            return
+        self._last_decrease = now
+        previous = self._limit
+        self._limit = max(self._min, self._limit * _DECREASE_FACTOR)
+        logger.debug("migration request lane narrowed from %d to %d", int(previous), int(self._limit))
+
+
+class _PacedAdapter(BaseAdapter):
+    """Transport adapter that counts every request, admitting it through the shared lane if there is one."""
+
+    def __init__(
+        self,
+        inner: BaseAdapter,
+        limiter: _AIMDLimiter | None,
+        counters: _TenantCounters,
+        clock: Callable[[], float],
+    ) -> None:
+        super().__init__()
+        self._inner = inner
+        self._limiter = limiter
+        self._counters = counters
+        self._clock = clock
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        if self._limiter is not None:
+            self._limiter.acquire()
+        started = self._clock()
+        # Interrupts (KeyboardInterrupt, SystemExit, ...) say nothing about the server: they free their
+        # slot without being counted or fed back into the lane.
+        latency: float | None = None
+        throttled = False
+        try:
+            response = self._inner.send(
+                request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+            )
+        except Exception as exc:
+            throttled = _is_throttle_error(exc)
+            self._counters.record(started=started, finished=self._clock(), throttled=throttled, failed=not throttled)
+            raise
+        else:
+            finished = self._clock()
+            latency = finished - started
+            throttled = response.status_code in (429, 503)
+            self._counters.record(
+                started=started,
+                finished=finished,
+                throttled=throttled,
+                failed=not throttled and response.status_code >= 500,
+            )
+        finally:
+            if self._limiter is not None:
+                self._limiter.release(latency_seconds=latency, throttled=throttled)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def _conjure_services(client: NominalClient) -> Iterator[Service]:
+    for f in dataclasses.fields(client._clients):
+        value: Any = getattr(client._clients, f.name)
+        if isinstance(value, Service):
+            yield value
+
+
+class MigrationRequestPacer:
+    """Routes both tenants' conjure traffic through one adaptive concurrency lane, counting requests per tenant.
+
+    Install it on every client the migration talks through — including impersonated destination
+    clients, which share the destination tenant's counters — before any migration work starts.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        adaptive: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float], float] | None = None,
+    ) -> None:
+        """Create a pacer.
+
+        Args:
+            max_concurrency: Ceiling on concurrent requests across both tenants. Independent of how many
+                migrations run at once, since each migration may have several requests in flight.
+            initial_concurrency: Lane width before any feedback has been observed.
+            adaptive: If False, there is no lane: requests are neither limited nor delayed, and the
+                pacer only collects request metrics.
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function used by the throttle damper, injectable for tests.
+            jitter: Maps the damper's delay to an actual sleep, injectable for tests.
+        """
+        self._clock = clock
+        self._limiter = (
+            _AIMDLimiter(
+                max_concurrency=max_concurrency,
+                initial_concurrency=initial_concurrency,
+                clock=clock,
+                sleep=sleep,
+                jitter=jitter,
+            )
+            if adaptive
+            else None
+        )
+        self._lock = threading.Lock()
+        self._counters: dict[str, _TenantCounters] = {}
+
+    @property
+    def concurrency_limit(self) -> int | None:
+        """The lane's current width, or None if requests are not limited."""
+        return None if self._limiter is None else self._limiter.limit
+
+    @property
+    def peak_concurrency_limit(self) -> int | None:
+        """The widest the lane has been so far, or None if requests are not limited."""
+        return None if self._limiter is None else self._limiter.peak_limit
+
+    def install(self, client: NominalClient, tenant: str) -> NominalClient:
+        """Count (and, if adaptive, pace) every conjure service of `client`, attributing its requests to `tenant`.
+
+        Installing twice on the same client is a no-op.
+
+        Returns:
+            The same client, for chaining.
+        """
+        with self._lock:
+            counters = self._counters.setdefault(tenant, _TenantCounters(tenant))
+        for service in _conjure_services(client):
+            session = service._requests_session
+            for prefix, adapter in list(session.adapters.items()):
+                if not isinstance(adapter, _PacedAdapter):
+                    session.mount(prefix, _PacedAdapter(adapter, self._limiter, counters, self._clock))
+        return client
+
+    def stats(self) -> list[TenantRequestStats]:
+        """Per-tenant request counters, ordered by tenant name."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+        return [c.snapshot() for _, c in counters]
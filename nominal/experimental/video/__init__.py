@@ -12,7 +12,7 @@ try:
         StreamOptions,
     )
 
-    from nominal.experimental.video._video_stream import VideoStream  # noqa: F401
+    from nominal.experimental.video._video_stream import FrameStats, VideoStream  # noqa: F401
 except ImportError as e:
     # If the error mentions nominal_video itself, the package is not installed.
     # Otherwise, nominal_video is installed but failed to load (e.g. GStreamer is missing).
@@ -30,6 +30,7 @@ __all__ = [
     "Codec",
     "Crop",
     "FlipMode",
+    "FrameStats",
     "ImageFormat",
     "ReconnectOptions",
     "Src",
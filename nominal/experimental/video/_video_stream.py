@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import collections
 import logging
+import threading
 import urllib.parse
 import warnings
 from dataclasses import dataclass, field
@@ -11,6 +13,7 @@ from typing import TYPE_CHECKING, Mapping, Type
 from conjure_python_client import ConjureHTTPError
 from nominal_api import scout_video_api
 from nominal_video import Sink, Src, Stream, StreamOptions
+from typing_extensions import Buffer
 
 from nominal.core.exceptions import (
     LegacyVideoDeprecationWarning,
@@ -26,6 +29,27 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class FrameStats:
+    """Counts of frames pushed through `VideoStream.send_frame` over the lifetime of a stream.
+
+    Attributes:
+        accepted: Frames handed to the pipeline and accepted by it.
+        dropped: Frames discarded because a buffer was full: evicted from the frame queue to make room for
+            a newer frame, or rejected by the pipeline's own buffer.
+        late: Frames discarded from the frame queue because their timestamp was not after the previous frame's.
+    """
+
+    accepted: int
+    dropped: int
+    late: int
+
+
+def _frame_bytes(frame: bytes | memoryview) -> bytes:
+    # The pipeline bindings only take `bytes`; this is the one copy of a non-bytes frame.
+    return frame if isinstance(frame, bytes) else bytes(frame)
+
+
 @dataclass
 class VideoStream:
     """A live video stream from any source to a video channel on a Nominal dataset via WHIP.
@@ -63,19 +87,41 @@ class VideoStream:
             stream.close()
 
         # Push frames manually from your own source.
-        # frame_bytes must be raw RGB bytes: width * height * 3 bytes per frame.
+        # Frames are raw RGB: width * height * 3 bytes, as bytes or any buffer (e.g. a NumPy array).
         # Use Src.app(width, height, format=ImageFormat.Bgr) if your source is BGR (e.g. OpenCV).
         with VideoStream.create(video, Src.app(1280, 720)) as stream:
             while capturing:
-                frame_bytes: bytes = capture_rgb_frame()  # 1280 * 720 * 3 bytes
-                stream.send_frame(frame_bytes, timestamp_ns=time.time_ns())
+                frame = capture_rgb_frame()  # uint8 array of shape (720, 1280, 3)
+                stream.send_frame(frame, timestamp_ns=time.time_ns())
+
+        # Queue up to 8 frames and push them from a background thread, dropping the oldest when full,
+        # so a slow pipeline never stalls the capture loop. Frames must not be modified once sent.
+        with VideoStream.create(video, Src.app(1280, 720), max_queued_frames=8) as stream:
+            while capturing:
+                stream.send_frame(camera.read_new_frame(), timestamp_ns=time.time_ns())
+            print(stream.frame_stats)
     """
 
     rid: str
     src: Src
     options: StreamOptions | None
     whip_sink: Sink = field(repr=False)
+    max_queued_frames: int | None = None
     _stream: Stream | None = field(default=None, init=False, repr=False)
+    _frames: collections.deque[tuple[bytes | memoryview, IntegralNanosecondsUTC | None]] = field(
+        default_factory=collections.deque, init=False, repr=False
+    )
+    _frames_cond: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+    _pusher: threading.Thread | None = field(default=None, init=False, repr=False)
+    _stopping: bool = field(default=False, init=False, repr=False)
+    _last_timestamp_ns: IntegralNanosecondsUTC | None = field(default=None, init=False, repr=False)
+    _accepted: int = field(default=0, init=False, repr=False)
+    _dropped: int = field(default=0, init=False, repr=False)
+    _late: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_queued_frames is not None and self.max_queued_frames < 1:
+            raise ValueError(f"max_queued_frames must be at least 1, got {self.max_queued_frames}")
 
     @classmethod
     def create(
@@ -86,6 +132,7 @@ class VideoStream:
         *,
         channel: str | None = None,
         tags: Mapping[str, str] | None = None,
+        max_queued_frames: int | None = None,
     ) -> VideoStream:
         """Create a VideoStream for a video channel on a dataset.
 
@@ -109,12 +156,17 @@ class VideoStream:
             channel: Name of the video channel on the dataset to stream to. Required when streaming to a
                 dataset; unused when streaming to a legacy `Video`.
             tags: Tags identifying the channel's series. Defaults to none.
+            max_queued_frames: If set, ``send_frame()`` queues frames (up to this many) and returns
+                immediately; a background thread pushes them into the pipeline. When the queue is full the
+                oldest frame is dropped, and a frame whose timestamp is not after the previous frame's is
+                dropped as late. If None (the default), frames are pushed on the caller's thread as given.
 
         Returns:
             A configured VideoStream, ready to open.
 
         Raises:
-            ValueError: `channel` was omitted for a dataset target, or supplied for a `Video` target.
+            ValueError: `channel` was omitted for a dataset target, or supplied for a `Video` target, or
+                `max_queued_frames` is less than 1.
             NominalVideoStreamError: Nominal rejected the request for a WHIP endpoint.
         """
         resp = cls._request_whip_stream(target, channel=channel, tags=tags)
@@ -138,7 +190,7 @@ class VideoStream:
                 stun_url = resp.ice_servers[0].urls[0].replace("stun:", "stun://", 1)
 
         whip_sink = Sink.whip(endpoint=endpoint, token=token, stun_server=stun_url)
-        return cls(rid=target.rid, src=src, options=options, whip_sink=whip_sink)
+        return cls(rid=target.rid, src=src, options=options, whip_sink=whip_sink, max_queued_frames=max_queued_frames)
 
     @staticmethod
     def _request_whip_stream(
@@ -199,15 +251,37 @@ class VideoStream:
         except Exception as e:
             self._stream = None
             raise NominalVideoStreamError("failed to start video stream") from e
+        # the source's clock may start over after a restart
+        self._last_timestamp_ns = None
+        if self.max_queued_frames is not None:
+            with self._frames_cond:
+                self._frames.clear()
+                self._stopping = False
+            self._pusher = threading.Thread(
+                target=self._push_queued_frames, args=(self._stream,), name="nominal-video-frames", daemon=True
+            )
+            self._pusher.start()
 
     def close(self) -> None:
         """Stop the pipeline and release all resources. Idempotent — safe to call multiple times.
 
-        After close(), open() can be called again to restart with the same WHIP endpoint.
+        Frames still queued (see ``max_queued_frames``) are pushed into the pipeline before it stops; frames
+        sent once close() has started are rejected. After close(), open() can be called again to restart with
+        the same WHIP endpoint.
         """
+        if self._pusher is not None:
+            with self._frames_cond:
+                self._stopping = True
+                self._frames_cond.notify()
+            self._pusher.join()
+            self._pusher = None
+            with self._frames_cond:
+                # release any caller buffers still referenced; nothing is pushed once the pusher has exited
+                self._frames.clear()
         if self._stream is not None:
             self._stream.close()
             self._stream = None
+        self._last_timestamp_ns = None
 
     def run(self, timeout: timedelta | float | None = None) -> None:
         """Block until the stream ends, errors, or Ctrl+C is pressed.
@@ -241,24 +315,78 @@ class VideoStream:
         self.close()
         self.open()
 
-    def send_frame(self, data: bytes, timestamp_ns: IntegralNanosecondsUTC | None = None) -> bool:
+    @property
+    def frame_stats(self) -> FrameStats:
+        """Counts of accepted, dropped and late frames sent with ``send_frame()`` so far."""
+        with self._frames_cond:
+            return FrameStats(accepted=self._accepted, dropped=self._dropped, late=self._late)
+
+    def send_frame(self, data: Buffer, timestamp_ns: IntegralNanosecondsUTC | None = None) -> bool:
         """Push a raw video frame into the pipeline. Only valid when using ``Src.app()``.
 
+        Any object supporting the buffer protocol is accepted — ``bytes``, a NumPy array, a ``memoryview``.
+        The pipeline bindings only take ``bytes``, so a frame that is not already ``bytes`` is always copied
+        once, as ``.tobytes()`` would. When ``max_queued_frames`` is set, that copy is made when the frame is
+        pushed rather than when it is sent, so the caller must not modify the frame afterwards.
+
         Args:
-            data: Raw frame bytes. Format must match the format passed to ``Src.app()``
+            data: Raw frame data. Format must match the format passed to ``Src.app()``
                 (default is RGB — width * height * 3 bytes).
             timestamp_ns: Absolute timestamp in nanoseconds (Unix epoch). If None,
-                the pipeline assigns a timestamp automatically.
+                the pipeline assigns a timestamp automatically. When ``max_queued_frames`` is set, a frame
+                whose timestamp is not after the previous frame's (since the stream was opened) is dropped and
+                counted as late.
 
         Returns:
-            True if the frame was accepted, False if the internal buffer is full.
+            True if the frame was accepted (or queued), False if it was late or the internal buffer is full.
 
         Raises:
-            NominalVideoStreamNotOpenError: if the stream is not open.
+            NominalVideoStreamNotOpenError: if the stream is not open, or is being closed.
+            TypeError: if ``data`` does not support the buffer protocol.
         """
-        if self._stream is None:
+        stream = self._stream
+        if stream is None:
             raise NominalVideoStreamNotOpenError()
-        return bool(self._stream.send_frame(data, timestamp_ns))
+        frame = data if isinstance(data, bytes) else memoryview(data)
+        if self.max_queued_frames is None:
+            return self._push(stream, frame, timestamp_ns)
+        with self._frames_cond:
+            if self._stopping:
+                # the pusher may already have drained the queue and exited
+                raise NominalVideoStreamNotOpenError()
+            if timestamp_ns is not None:
+                if self._last_timestamp_ns is not None and timestamp_ns <= self._last_timestamp_ns:
+                    self._late += 1
+                    return False
+                self._last_timestamp_ns = timestamp_ns
+            if len(self._frames) >= self.max_queued_frames:
+                self._frames.popleft()
+                self._dropped += 1
+            self._frames.append((frame, timestamp_ns))
+            self._frames_cond.notify()
+            return True
+
+    def _push(self, stream: Stream, frame: bytes | memoryview, timestamp_ns: IntegralNanosecondsUTC | None) -> bool:
+        accepted = bool(stream.send_frame(_frame_bytes(frame), timestamp_ns))
+        with self._frames_cond:
+            if accepted:
+                self._accepted += 1
+            else:
+                self._dropped += 1
+        return accepted
+
+    def _push_queued_frames(self, stream: Stream) -> None:
+        while True:
+            with self._frames_cond:
+                while not self._frames and not self._stopping:
+                    self._frames_cond.wait()
+                if not self._frames:
+                    return
+                frame, timestamp_ns = self._frames.popleft()
+            try:
+                self._push(stream, frame, timestamp_ns)
+            except Exception:
+                logger.exception("Failed to push queued video frame")
 
     def __enter__(self) -> VideoStream:
         """Enter context manager, opening the pipeline."""
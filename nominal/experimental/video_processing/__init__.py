@@ -9,12 +9,24 @@ from nominal.experimental.video_processing.resolution import (
     VideoResolution,
     scale_factor_from_resolution,
 )
-from nominal.experimental.video_processing.video_conversion import frame_count, has_audio_track, normalize_video
+from nominal.experimental.video_processing.video_conversion import (
+    EncoderStats,
+    frame_count,
+    has_audio_track,
+    normalize_and_upload_video,
+    normalize_video,
+    parse_encoder_stats,
+    split_at_keyframes,
+)
 
 __all__ = [
+    "EncoderStats",
     "frame_count",
     "has_audio_track",
+    "normalize_and_upload_video",
     "normalize_video",
+    "parse_encoder_stats",
+    "split_at_keyframes",
     "VideoResolution",
     "STANDARD_DEFINITION",
     "HIGH_DEFINITION",
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import bisect
+import collections
+import concurrent.futures
+import io
 import logging
 import pathlib
+import re
 import shlex
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO, Any, BinaryIO, Mapping, Sequence, cast
 
 import ffmpeg
 
 from nominal.core._types import PathLike
+from nominal.core._utils.multipart import path_upload_name
+from nominal.core.dataset import Dataset
+from nominal.core.filetype import FileTypes
+from nominal.core.video_dataset_file import VideoDatasetFile
 from nominal.experimental.video_processing.resolution import (
     AnyResolutionType,
     scale_factor_from_resolution,
 )
+from nominal.ts import IntegralNanosecondsUTC
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +35,44 @@ DEFAULT_AUDIO_CODEC = "aac"
 DEFAULT_PIXEL_FORMAT = "yuv420p"
 DEFAULT_KEY_FRAME_INTERVAL_SEC = 2
 
+# Fragmented MP4 can be written to a non-seekable pipe: the moov atom is written up front (empty) and
+# every keyframe starts a new self-contained fragment, so nothing needs to be patched after the fact.
+_FRAGMENTED_MP4_MOVFLAGS = "frag_keyframe+empty_moov+default_base_moof"
+# ffmpeg prints these per-stream totals at the end of a run at `-loglevel verbose`.
+_FRAMES_DECODED_PATTERN = re.compile(r"Input stream #\d+:\d+ \(video\):.*?(\d+) frames decoded")
+_FRAMES_ENCODED_PATTERN = re.compile(r"Output stream #\d+:\d+ \(video\): (\d+) frames encoded")
+_STDERR_TAIL_LINES = 20
+
+
+def _normalized_output_kwargs(
+    key_frame_interval: int | None,
+    resolution: AnyResolutionType | None,
+) -> dict[str, str | None]:
+    """Build the ffmpeg output options shared by every normalization path."""
+    # Determine if input video has an audio track. If it doesn't, add in an empty audio track
+    # to allow for seamless play of this video content alongside content with audio tracks.
+    # While the backend will do this for you automatically, it dramatically faster to do it here
+    # than in the backend since we are already re-encoding video.
+    output_kwargs: dict[str, str | None] = dict(
+        acodec=DEFAULT_AUDIO_CODEC,
+        vcodec=DEFAULT_VIDEO_CODEC,
+        force_key_frames="source",
+        pix_fmt=DEFAULT_PIXEL_FORMAT,
+    )
+
+    # If user has opted out of forcing key-frames, keep key frames at the same timestamps as
+    # present in the initial video.
+    if key_frame_interval is None:
+        output_kwargs["force_key_frames"] = "source"
+    else:
+        output_kwargs["force_key_frames"] = f"expr:gte(t,n_forced*{key_frame_interval})"
+
+    # If user specified an output resolution, add respective video filters
+    if resolution is not None:
+        output_kwargs["vf"] = scale_factor_from_resolution(resolution)
+
+    return output_kwargs
+
 
 def normalize_video(
     input_path: PathLike,
@@ -72,27 +126,7 @@ def normalize_video(
         else:
             raise FileExistsError(f"Cannot convert {input_path} to {output_path}: output path already exists!")
 
-    # Determine if input video has an audio track. If it doesn't, add in an empty audio track
-    # to allow for seamless play of this video content alongside content with audio tracks.
-    # While the backend will do this for you automatically, it dramatically faster to do it here
-    # than in the backend since we are already re-encoding video.
-    output_kwargs: dict[str, str | None] = dict(
-        acodec=DEFAULT_AUDIO_CODEC,
-        vcodec=DEFAULT_VIDEO_CODEC,
-        force_key_frames="source",
-        pix_fmt=DEFAULT_PIXEL_FORMAT,
-    )
-
-    # If user has opted out of forcing key-frames, keep key frames at the same timestamps as
-    # present in the initial video.
-    if key_frame_interval is None:
-        output_kwargs["force_key_frames"] = "source"
-    else:
-        output_kwargs["force_key_frames"] = f"expr:gte(t,n_forced*{key_frame_interval})"
-
-    # If user specified an output resolution, add respective video filters
-    if resolution is not None:
-        output_kwargs["vf"] = scale_factor_from_resolution(resolution)
+    output_kwargs = _normalized_output_kwargs(key_frame_interval, resolution)
 
     input_kwargs = {}
     if num_threads is not None:
@@ -117,6 +151,285 @@ def normalize_video(
         )
 
 
+@dataclass(frozen=True)
+class EncoderStats:
+    """Video frame totals reported by ffmpeg itself at the end of an encode.
+
+    Either field is None if ffmpeg did not report it (e.g. an older ffmpeg, or a failed run).
+    """
+
+    frames_decoded: int | None
+    frames_encoded: int | None
+
+    def __add__(self, other: EncoderStats) -> EncoderStats:
+        """Combine the totals of two encodes, e.g. parallel segments of one video."""
+
+        def _sum(a: int | None, b: int | None) -> int | None:
+            return None if a is None or b is None else a + b
+
+        return EncoderStats(
+            frames_decoded=_sum(self.frames_decoded, other.frames_decoded),
+            frames_encoded=_sum(self.frames_encoded, other.frames_encoded),
+        )
+
+
+def parse_encoder_stats(stderr_lines: Sequence[str]) -> EncoderStats:
+    """Extract frame totals from ffmpeg's verbose end-of-run stream summary."""
+    frames_decoded: int | None = None
+    frames_encoded: int | None = None
+    for line in stderr_lines:
+        if frames_decoded is None and (match := _FRAMES_DECODED_PATTERN.search(line)):
+            frames_decoded = int(match.group(1))
+        elif frames_encoded is None and (match := _FRAMES_ENCODED_PATTERN.search(line)):
+            frames_encoded = int(match.group(1))
+    return EncoderStats(frames_decoded=frames_decoded, frames_encoded=frames_encoded)
+
+
+class _StderrCollector:
+    """Drains an ffmpeg process's stderr on a background thread so the process never blocks on it.
+
+    Keeps only the stream summary lines (for `EncoderStats`) and a short tail (for error messages).
+    """
+
+    def __init__(self, stderr: IO[bytes]) -> None:
+        self._stderr = stderr
+        self._summary_lines: list[str] = []
+        self._tail: collections.deque[str] = collections.deque(maxlen=_STDERR_TAIL_LINES)
+        self._thread = threading.Thread(target=self._drain, name="ffmpeg-stderr", daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        with self._stderr:
+            for raw_line in self._stderr:
+                line = raw_line.decode("utf-8", errors="replace").rstrip()
+                self._tail.append(line)
+                if "frames decoded" in line or "frames encoded" in line:
+                    self._summary_lines.append(line)
+
+    def result(self) -> tuple[EncoderStats, str]:
+        self._thread.join()
+        return parse_encoder_stats(self._summary_lines), "\n".join(self._tail)
+
+
+class _FfmpegOutputPipe(io.BufferedIOBase):
+    """Read-only view of an ffmpeg process's stdout that fails at EOF if ffmpeg failed.
+
+    The multipart uploader only learns that the stream ended when a read returns no bytes; raising
+    there instead makes it abort the upload, so a truncated encode never reaches ingestion.
+    """
+
+    def __init__(self, process: subprocess.Popen[bytes], stderr: _StderrCollector) -> None:
+        super().__init__()
+        assert process.stdout is not None
+        self._process = process
+        self._stdout = process.stdout
+        self._stderr = stderr
+        self.stats: EncoderStats | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        data = self._stdout.read(-1 if size is None else size)
+        if not data and self.stats is None:
+            returncode = self._process.wait()
+            stats, tail = self._stderr.result()
+            if returncode != 0:
+                raise RuntimeError(f"ffmpeg exited with status {returncode}:\n{tail}")
+            self.stats = stats
+        return data
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stdout.close()
+            if self._process.poll() is None:
+                # closed before EOF (e.g. the upload failed): don't leave ffmpeg running
+                self._process.kill()
+                self._process.wait()
+        super().close()
+
+
+def _run_to_pipe(stream: Any) -> _FfmpegOutputPipe:
+    logger.info("Running command: '%s'", shlex.join(stream.compile()))
+    process = stream.run_async(pipe_stdout=True, pipe_stderr=True)
+    return _FfmpegOutputPipe(process, _StderrCollector(process.stderr))
+
+
+def _keyframe_times(input_path: pathlib.Path) -> tuple[list[float], float]:
+    """Presentation times (seconds) of the first video stream's keyframes, and the container duration."""
+    probe_resp = ffmpeg.probe(
+        str(input_path),
+        v="error",
+        select_streams="v:0",
+        skip_frame="nokey",
+        show_entries="frame=pts_time,best_effort_timestamp_time",
+    )
+    times = []
+    for frame in probe_resp.get("frames", []):
+        pts = frame.get("pts_time", frame.get("best_effort_timestamp_time"))
+        if pts not in (None, "N/A"):
+            times.append(float(pts))
+    return sorted(times), float(probe_resp["format"]["duration"])
+
+
+def split_at_keyframes(keyframe_times: Sequence[float], duration: float, num_segments: int) -> list[float]:
+    """Pick segment start times at keyframes, dividing `duration` into roughly equal parts.
+
+    Cutting on input keyframes means each segment's decoder starts on a keyframe, so no frame is
+    decoded twice or lost at a boundary. Returns the start time of every segment (the first is
+    always 0.0); fewer than `num_segments` starts are returned if there are too few keyframes.
+    """
+    starts = [0.0]
+    for i in range(1, num_segments):
+        target = duration * i / num_segments
+        idx = bisect.bisect_left(keyframe_times, target)
+        candidates = [keyframe_times[j] for j in (idx - 1, idx) if 0 <= j < len(keyframe_times)]
+        if not candidates:
+            continue
+        best = min(candidates, key=lambda t: abs(t - target))
+        if best > starts[-1]:
+            starts.append(best)
+    return starts
+
+
+def _encode_segment(
+    input_path: pathlib.Path,
+    output_path: pathlib.Path,
+    start: float,
+    end: float | None,
+    output_kwargs: Mapping[str, str | None],
+    num_threads: int | None,
+) -> EncoderStats:
+    input_kwargs: dict[str, str] = {"ss": str(start)}
+    if num_threads is not None:
+        input_kwargs["threads"] = str(num_threads)
+    segment_kwargs: dict[str, str | None] = {**output_kwargs, "loglevel": "verbose"}
+    if end is not None:
+        segment_kwargs["t"] = str(end - start)
+    stream = ffmpeg.input(str(input_path), **input_kwargs).output(str(output_path), **segment_kwargs)
+    logger.info("Running command: '%s'", shlex.join(stream.compile()))
+    try:
+        _, err = stream.run(capture_stdout=True, capture_stderr=True)
+    except ffmpeg.Error as ex:
+        raise RuntimeError(f"ffmpeg failed to encode segment starting at {start}s:\n{ex.stderr.decode()}") from ex
+    return parse_encoder_stats(err.decode("utf-8", errors="replace").splitlines())
+
+
+def normalize_and_upload_video(
+    input_path: PathLike,
+    dataset: Dataset,
+    *,
+    channel: str,
+    start: datetime | IntegralNanosecondsUTC,
+    file_name: str | None = None,
+    tags: Mapping[str, str] | None = None,
+    overwrite_overlapping: bool = False,
+    key_frame_interval: int | None = DEFAULT_KEY_FRAME_INTERVAL_SEC,
+    resolution: AnyResolutionType | None = None,
+    num_threads: int | None = None,
+    num_segments: int = 1,
+) -> VideoDatasetFile:
+    """Normalize a video like `normalize_video` while uploading it to a dataset, without a local output file.
+
+    ffmpeg writes fragmented MP4 to a pipe that feeds the multipart uploader directly, so encoding and
+    uploading overlap and the re-encoded video never touches disk. Frame counts are taken from ffmpeg's own
+    end-of-run statistics rather than from separate `ffprobe` passes over the input and output.
+
+    If `num_segments` is greater than one, the input is cut at keyframes into that many segments which are
+    encoded in parallel into a temporary directory, then concatenated (without re-encoding) into the upload
+    stream. This trades some temporary disk space for using every core on long inputs.
+
+    Args:
+        input_path: Path to video file on local filesystem.
+        dataset: Dataset to add the video to.
+        channel: Name of the video channel within the dataset.
+        start: Starting timestamp of the video in absolute UTC time.
+        file_name: Name to upload the file under. Defaults to the input's name.
+        tags: key-value pairs to apply as tags to all data uniformly in the file.
+        overwrite_overlapping: If True, segments from other files on this channel that overlap with the
+            newly added file will be deleted before inserting the new segments.
+        key_frame_interval: Number of seconds between keyframes allowed in the output video. See `normalize_video`.
+        resolution: If provided, re-scale the video to the provided resolution
+        num_threads: If provided, the number of CPU cores to tell ffmpeg to use, split evenly across segments.
+        num_segments: Number of segments to encode in parallel. Defaults to a single streaming encode.
+
+    Returns:
+        Reference to the created (still-ingesting) video dataset file.
+
+    Raises:
+        RuntimeError: ffmpeg failed. The multipart upload is aborted and nothing is ingested.
+
+    NOTE: this requires that you have installed ffmpeg on your system with support for H264.
+    """
+    input_path = pathlib.Path(input_path)
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input path {input_path} does not exist")
+    if num_segments < 1:
+        raise ValueError(f"num_segments must be at least 1, got {num_segments}")
+    if file_name is None:
+        file_name = path_upload_name(input_path, FileTypes.MP4)
+
+    output_kwargs = _normalized_output_kwargs(key_frame_interval, resolution)
+    pipe_kwargs: dict[str, str | None] = dict(format="mp4", movflags=_FRAGMENTED_MP4_MOVFLAGS)
+
+    with tempfile.TemporaryDirectory(prefix="nominal-video-") as tmp_dir:
+        segment_stats: EncoderStats | None = None
+        if num_segments == 1:
+            input_kwargs = {} if num_threads is None else {"threads": str(num_threads)}
+            stream = ffmpeg.input(str(input_path), **input_kwargs).output(
+                "pipe:1", **output_kwargs, **pipe_kwargs, loglevel="verbose"
+            )
+        else:
+            keyframes, duration = _keyframe_times(input_path)
+            starts = split_at_keyframes(keyframes, duration, num_segments)
+            ends: list[float | None] = [*starts[1:], None]
+            threads_per_segment = None if num_threads is None else max(1, num_threads // len(starts))
+            segment_paths = [pathlib.Path(tmp_dir) / f"segment-{i:04d}.mkv" for i in range(len(starts))]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(starts)) as pool:
+                futures = [
+                    pool.submit(
+                        _encode_segment, input_path, path, seg_start, seg_end, output_kwargs, threads_per_segment
+                    )
+                    for path, seg_start, seg_end in zip(segment_paths, starts, ends)
+                ]
+                totals = sum((f.result() for f in futures), EncoderStats(0, 0))
+            # Input seeking decodes from the nearest preceding keyframe and the decoder may read a little
+            # past each segment's end, so summed decode counts overstate the input; keep encoded only.
+            segment_stats = EncoderStats(frames_decoded=None, frames_encoded=totals.frames_encoded)
+            logger.info("Encoded %s frames across %d segments", totals.frames_encoded, len(starts))
+
+            concat_list = pathlib.Path(tmp_dir) / "segments.txt"
+            concat_list.write_text("".join(f"file '{path}'\n" for path in segment_paths))
+            stream = ffmpeg.input(str(concat_list), format="concat", safe=0).output(
+                "pipe:1", c="copy", **pipe_kwargs, loglevel="verbose"
+            )
+
+        pipe = _run_to_pipe(stream)
+        try:
+            video_file = dataset.add_video_from_io(
+                cast(BinaryIO, pipe),
+                file_name,
+                channel=channel,
+                start=start,
+                file_type=FileTypes.MP4,
+                tags=tags,
+                overwrite_overlapping=overwrite_overlapping,
+            )
+        finally:
+            pipe.close()
+
+    stats = segment_stats if segment_stats is not None else pipe.stats
+    if stats is not None and stats.frames_decoded is not None and stats.frames_encoded is not None:
+        if stats.frames_decoded != stats.frames_encoded:
+            logger.warning(
+                "H264 re-encoded video from '%s' has differing frames from original (%d vs. %d)",
+                input_path,
+                stats.frames_encoded,
+                stats.frames_decoded,
+            )
+    return video_file
+
+
 def frame_count(video_path: pathlib.Path) -> int:
     """Given a path to a video file, return the number of frames present in the video.
 
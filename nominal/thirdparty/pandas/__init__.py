@@ -2,6 +2,7 @@ from nominal.thirdparty.pandas._pandas import (
     channel_to_dataframe_decimated,
     channel_to_series,
     datasource_to_dataframe,
+    iter_datasource_dataframes,
     upload_dataframe,
     upload_dataframe_to_dataset,
 )
@@ -10,6 +11,7 @@ __all__ = [
     "channel_to_dataframe_decimated",
     "channel_to_series",
     "datasource_to_dataframe",
+    "iter_datasource_dataframes",
     "upload_dataframe",
     "upload_dataframe_to_dataset",
 ]
@@ -1,25 +1,40 @@
 from __future__ import annotations
 
 import concurrent.futures
+import gzip
 import logging
-from datetime import datetime
-from threading import Thread
-from typing import Any, BinaryIO, Mapping, Sequence, cast
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, Literal, Mapping, Sequence, cast
 
+import numpy as np
 from nominal_api.api import Timestamp
 
 import pandas as pd
 from nominal import ts
-from nominal._utils import batched, reader_writer
-from nominal.core.channel import Channel
+from nominal._utils import batched, pipe_from_writer, write_gzip_members
+from nominal.core.channel import Channel, ChannelDataType
 from nominal.core.client import NominalClient
 from nominal.core.dataset import Dataset
 from nominal.core.dataset_file import DatasetFile
 from nominal.core.datasource import DataSource, _construct_export_request
 from nominal.core.filetype import FileTypes
 
+if TYPE_CHECKING:
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
+UploadFileFormat = Literal["csv", "parquet"]
+
+# Rows converted and written at a time, and so per Parquet row group, when uploading in Parquet format
+_PARQUET_ROW_GROUP_SIZE = 100_000
+
+# Oldest polars able to stream a Parquet file to a file object in row groups, as Parquet uploads do
+_PARQUET_MIN_POLARS_VERSION = (1, 27)
+
+# Cells formatted and compressed at a time, as one gzip member, when uploading in CSV format
+_CSV_BLOCK_CELLS = 1_000_000
+
 
 def upload_dataframe_to_dataset(
     dataset: Dataset,
@@ -31,8 +46,9 @@ def upload_dataframe_to_dataset(
     file_name: str | None = None,
     tag_columns: Mapping[str, str] | None = None,
     tags: Mapping[str, str] | None = None,
+    file_format: UploadFileFormat = "csv",
 ) -> DatasetFile:
-    """Upload a pandas dataframe to an existing dataset as if it were a gzipped-CSV file
+    """Upload a pandas dataframe to an existing dataset as if it were a gzipped-CSV or Parquet file
 
     Args:
         dataset: Dataset to upload the dataframe to
@@ -44,35 +60,52 @@ def upload_dataframe_to_dataset(
             If not provided, defaults to using the dataset's name
         tag_columns: Mapping of column names => tag keys to use for their respective rows.
         tags: Mapping of key-value pairs to apply uniformly as tags to all data within the dataframe.
-    """
+        file_format: Format to upload the dataframe in. "parquet" avoids formatting (and then parsing) every
+            value as text, which is usually much faster for numeric data. The dataframe is converted and
+            written in batches of rows, so only one batch is held in memory in addition to the dataframe.
+            Columns must be numpy-backed (or pyarrow must be installed), and a datetime `timestamp_column`
+            is uploaded as nanoseconds since the unix epoch, with naive datetimes taken to be in UTC, so
+            `timestamp_type` must then be `ts.EPOCH_NANOSECONDS`. Requires polars 1.27 or newer.
 
-    # TODO (drake): convert to parquet if/when parquet added as library dependency
-    def write_and_close(df: pd.DataFrame, w: BinaryIO) -> None:
-        df.to_csv(w, compression="gzip")
-        w.close()
+    Raises:
+        ImportError: if uploading in Parquet format with an older version of polars.
+        ValueError: if uploading a datetime `timestamp_column` in Parquet format with another `timestamp_type`.
+    """
+    file_type = FileTypes.CSV_GZ
+    if file_format == "parquet":
+        _check_parquet_support()
+        file_type = FileTypes.PARQUET
+        if pd.api.types.is_datetime64_any_dtype(_get_column(df, timestamp_column)) and (
+            ts._to_typed_timestamp_type(timestamp_type) != ts.EPOCH_NANOSECONDS
+        ):
+            raise ValueError(
+                f"datetime timestamp column {timestamp_column!r} is uploaded as nanoseconds since the unix epoch in "
+                f"Parquet format, so timestamp_type must be ts.EPOCH_NANOSECONDS, not {timestamp_type!r}"
+            )
 
-    with reader_writer() as (reader, writer):
-        # Write the dataframe to .csv.gz and upload in background thread
-        t = Thread(target=write_and_close, args=(df, writer))
-        t.start()
+    def write(w: BinaryIO) -> None:
+        if file_format == "parquet":
+            _write_parquet(df, w, timestamp_column)
+        else:
+            write_gzip_members(_iter_csv_blocks(df), w)
 
+    # Write the dataframe to .csv.gz or .parquet in a background thread while uploading it; a failure to write
+    # fails the upload, so no incomplete file is ingested
+    with pipe_from_writer(write) as reader:
         dataset_file = dataset.add_from_io(
             reader,
             timestamp_column=timestamp_column,
             timestamp_type=timestamp_type,
-            file_type=FileTypes.CSV_GZ,
+            file_type=file_type,
             file_name=file_name,
             tag_columns=tag_columns,
             tags=tags,
         )
 
-        # Await data upload to complete
-        t.join()
-
-        if wait_until_complete:
-            dataset_file.poll_until_ingestion_completed()
+    if wait_until_complete:
+        dataset_file.poll_until_ingestion_completed()
 
-        return dataset_file
+    return dataset_file
 
 
 def upload_dataframe(
@@ -89,6 +122,7 @@ def upload_dataframe(
     properties: Mapping[str, str] | None = None,
     tag_columns: Mapping[str, str] | None = None,
     tags: Mapping[str, str] | None = None,
+    file_format: UploadFileFormat = "csv",
 ) -> Dataset:
     """Create a dataset in the Nominal platform from a pandas.DataFrame.
 
@@ -105,6 +139,7 @@ def upload_dataframe(
         properties: String key-value pairs to apply to the created dataset
         tag_columns: Mapping of column name => tag key to apply to the respective rows of data
         tags: Mapping of key-value pairs to apply uniformly as tags to all data within the dataframe.
+        file_format: Format to upload the dataframe in, see `upload_dataframe_to_dataset`.
 
     Returns:
         Created dataset
@@ -126,11 +161,91 @@ def upload_dataframe(
         file_name=name,
         tag_columns=tag_columns,
         tags=tags,
+        file_format=file_format,
     )
 
     return dataset
 
 
+def _get_column(df: pd.DataFrame, name: str) -> pd.Series[Any]:
+    """Get a column of the dataframe, or a level of its index, as the dataframe would be uploaded"""
+    if name in df.columns:
+        return df[name]
+    elif name in df.index.names:
+        return df.index.get_level_values(name).to_series()
+    raise ValueError(f"timestamp column {name!r} not found in dataframe")
+
+
+def _iter_csv_blocks(df: pd.DataFrame) -> Iterator[bytes]:
+    """Format the dataframe as CSV in blocks of rows, which together form the same file as `df.to_csv()`"""
+    block_rows = max(1, _CSV_BLOCK_CELLS // max(1, len(df.columns)))
+    for start in range(0, max(1, len(df)), block_rows):
+        yield df.iloc[start : start + block_rows].to_csv(header=start == 0).encode()
+
+
+def _check_parquet_support() -> None:
+    """Raise if the installed polars cannot stream Parquet uploads, which rely on its (unstable) IO plugin API"""
+    import polars as pl
+
+    version = tuple(int(part) for part in pl.__version__.split(".")[:2] if part.isdigit())
+    if version < _PARQUET_MIN_POLARS_VERSION:
+        raise ImportError(
+            f"Uploading dataframes in Parquet format requires polars>=1.27, but polars {pl.__version__} is installed. "
+            "Upgrade polars, or upload with file_format='csv'."
+        )
+
+
+def _write_parquet(df: pd.DataFrame, w: BinaryIO, timestamp_column: str) -> None:
+    """Stream the dataframe to `w` as a Parquet file, one row group at a time"""
+    from polars.io.plugins import register_io_source
+
+    def batches(
+        with_columns: list[str] | None, predicate: pl.Expr | None, n_rows: int | None, batch_size: int | None
+    ) -> Iterator[pl.DataFrame]:
+        # honor the projection, filter, and row limit polars pushes down into the source
+        remaining = len(df) if n_rows is None else n_rows
+        for start in range(0, len(df), _PARQUET_ROW_GROUP_SIZE):
+            if remaining <= 0:
+                return
+            batch = _to_polars(df.iloc[start : start + _PARQUET_ROW_GROUP_SIZE], timestamp_column)
+            if with_columns is not None:
+                batch = batch.select(with_columns)
+            if predicate is not None:
+                batch = batch.filter(predicate)
+            batch = batch.head(remaining)
+            remaining -= len(batch)
+            yield batch
+
+    schema = _to_polars(df.iloc[:0], timestamp_column).schema
+    register_io_source(batches, schema=schema).sink_parquet(w, row_group_size=_PARQUET_ROW_GROUP_SIZE)
+
+
+def _to_polars(df: pd.DataFrame, timestamp_column: str) -> pl.DataFrame:
+    """Convert rows of a dataframe to polars, including any named index as CSV uploads do"""
+    import polars as pl
+
+    if any(name is not None for name in df.index.names):
+        df = df.reset_index()
+
+    columns: list[pl.Series] = []
+    for name, values in df.items():
+        if name == timestamp_column and pd.api.types.is_datetime64_any_dtype(values):
+            column = pl.Series(ts._to_nanoseconds_array(values))
+        elif isinstance(values.dtype, pd.DatetimeTZDtype):
+            # converting time zone aware columns otherwise requires pyarrow
+            naive = values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+            column = pl.Series(naive).dt.replace_time_zone("UTC")
+        elif values.dtype == object:
+            # as in CSV uploads, objects are uploaded as strings (which otherwise requires pyarrow if any are missing)
+            strings = values.astype(str).to_numpy(dtype=object)
+            strings[values.isna().to_numpy()] = None
+            column = pl.Series(strings.tolist(), dtype=pl.String)
+        else:
+            column = pl.from_pandas(values)
+        columns.append(column.alias(str(name)))
+    return pl.DataFrame(columns)
+
+
 def channel_to_series(
     channel: Channel,
     start: datetime | ts.IntegralNanosecondsUTC | None = None,
@@ -166,12 +281,64 @@ def channel_to_series(
         enable_gzip=enable_gzip,
         tags=tags,
     )
-    df = pd.read_csv(
-        body, parse_dates=["timestamp"], index_col="timestamp", compression="gzip" if enable_gzip else "infer"
+    df = _read_export_csv(
+        body, [channel], "timestamp", enable_gzip=enable_gzip, absolute_timestamps=relative_to is None
     )
     return df[channel.name]
 
 
+def _read_export_csv(
+    body: BinaryIO,
+    channels: Sequence[Channel],
+    timestamp_column: str,
+    *,
+    enable_gzip: bool,
+    absolute_timestamps: bool,
+) -> pd.DataFrame:
+    """Read exported channel data into a dataframe indexed by timestamp.
+
+    The CSV is parsed by polars, with each channel's column typed by the channel's data type where it is known,
+    and absolute (ISO 8601) timestamps converted to nanoseconds in bulk rather than one by one. Columns of untyped
+    channels are inferred from all of their values, like pandas, rather than from the first rows only.
+    """
+    import polars as pl
+
+    schema: dict[str, pl.DataType] = {}
+    if absolute_timestamps:
+        schema[timestamp_column] = pl.String()
+    for channel in channels:
+        match channel.data_type:
+            case ChannelDataType.DOUBLE:
+                schema[channel.name] = pl.Float64()
+            case ChannelDataType.INT:
+                schema[channel.name] = pl.Int64()
+            case ChannelDataType.STRING:
+                schema[channel.name] = pl.String()
+
+    with gzip.GzipFile(fileobj=body, mode="rb") if enable_gzip else body as source:
+        pl_df = pl.read_csv(source.read(), schema_overrides=schema, infer_schema_length=None, raise_if_empty=False)
+    if timestamp_column not in pl_df.columns:
+        return pd.DataFrame(index=pd.Index([], name=timestamp_column))
+
+    columns: dict[str, Any] = {}
+    for name, column in pl_df.drop(timestamp_column).to_dict().items():
+        # match pandas, which reads an entirely empty column as floats
+        values = column.cast(pl.Float64) if column.dtype == pl.String and column.null_count() == len(column) else column
+        array = values.to_numpy()
+        if values.dtype == pl.String and values.null_count():
+            # match pandas, which reads missing strings as NaN
+            array[values.is_null().to_numpy()] = float("nan")
+        columns[name] = array
+
+    timestamps = pl_df[timestamp_column]
+    index: pd.Index[Any]
+    if absolute_timestamps:
+        index = pd.to_datetime(ts._to_nanoseconds_array(timestamps), unit="ns", utc=True)
+    else:
+        index = pd.Index(timestamps.to_numpy())
+    return pd.DataFrame(columns, index=index.rename(timestamp_column))
+
+
 def channel_to_dataframe_decimated(
     channel: Channel,
     start: str | datetime | ts.IntegralNanosecondsUTC,
@@ -201,30 +368,28 @@ def channel_to_dataframe_decimated(
     # when there are less than 1000 points, the result is numeric
     # TODO(alkasm): why should this return differently shaped dataframes?
     if result.numeric is not None:
-        df = pd.DataFrame(
-            result.numeric.values,
-            columns=["value"],
-            index=[_to_pandas_timestamp(timestamp) for timestamp in result.numeric.timestamps],
-        )
-        df.index.name = "timestamp"
-        return df
+        return pd.DataFrame({"value": result.numeric.values}, index=_to_datetime_index(result.numeric.timestamps))
 
     if result.bucketed_numeric is None:
         raise ValueError("Unexpected response from compute service, bucketed_numeric should not be None")
-    df = pd.DataFrame(
-        [
-            (bucket.min, bucket.max, bucket.mean, bucket.count, bucket.variance)
-            for bucket in result.bucketed_numeric.buckets
-        ],
-        columns=["min", "max", "mean", "count", "variance"],
-        index=[_to_pandas_timestamp(timestamp) for timestamp in result.bucketed_numeric.timestamps],
+    bucketed = result.bucketed_numeric.buckets
+    return pd.DataFrame(
+        {
+            "min": [bucket.min for bucket in bucketed],
+            "max": [bucket.max for bucket in bucketed],
+            "mean": [bucket.mean for bucket in bucketed],
+            "count": [bucket.count for bucket in bucketed],
+            "variance": [bucket.variance for bucket in bucketed],
+        },
+        index=_to_datetime_index(result.bucketed_numeric.timestamps),
     )
-    df.index.name = "timestamp"
-    return df
 
 
-def _to_pandas_timestamp(timestamp: Timestamp) -> pd.Timestamp:
-    return pd.Timestamp(timestamp.seconds, unit="s", tz="UTC") + pd.Timedelta(timestamp.nanos, unit="ns")
+def _to_datetime_index(timestamps: Sequence[Timestamp]) -> pd.DatetimeIndex:
+    """Convert API timestamps to a UTC index named "timestamp", in bulk"""
+    seconds = np.fromiter((timestamp.seconds for timestamp in timestamps), dtype=np.int64, count=len(timestamps))
+    nanos = np.fromiter((timestamp.nanos for timestamp in timestamps), dtype=np.int64, count=len(timestamps))
+    return pd.to_datetime(seconds * 1_000_000_000 + nanos, unit="ns", utc=True).rename("timestamp")
 
 
 def _to_pandas_unit(unit: ts._LiteralTimeUnit) -> str:
@@ -322,9 +487,139 @@ def datasource_to_dataframe(
     start_time = ts._SecondsNanos.from_flexible(start).to_api() if start else ts._MIN_TIMESTAMP.to_api()
     end_time = ts._SecondsNanos.from_flexible(end).to_api() if end else ts._MAX_TIMESTAMP.to_api()
 
-    # Get all channels from the datasource
+    channels = _resolve_channels(datasource, channels, channel_exact_match, channel_fuzzy_search_text)
+    if not channels:
+        logger.warning("Requested data for no columns: returning empty dataframe")
+        return pd.DataFrame({_EXPORTED_TIMESTAMP_COL_NAME: []}).set_index(_EXPORTED_TIMESTAMP_COL_NAME)
+
+    exporter = _ChannelBatchExporter(
+        datasource,
+        channels,
+        tags=tags,
+        enable_gzip=enable_gzip,
+        relative_to=relative_to,
+        relative_resolution=relative_resolution,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
+        df_futures = exporter.submit(pool, start_time, end_time, channel_batch_size)
+        all_dataframes = exporter.collect(df_futures)
+
+    if not all_dataframes:
+        logger.warning(f"No data found for export from datasource {datasource.rid}")
+        all_column_names = [_EXPORTED_TIMESTAMP_COL_NAME] + [ch.name for ch in channels]
+        return pd.DataFrame({col: [] for col in all_column_names}).set_index(_EXPORTED_TIMESTAMP_COL_NAME)
+
+    return exporter.join(all_dataframes)
+
+
+def iter_datasource_dataframes(
+    datasource: DataSource,
+    start: str | datetime | ts.IntegralNanosecondsUTC,
+    end: str | datetime | ts.IntegralNanosecondsUTC,
+    slice_duration: timedelta,
+    *,
+    channel_exact_match: Sequence[str] | None = None,
+    channel_fuzzy_search_text: str | None = None,
+    channels: Sequence[Channel] | None = None,
+    tags: Mapping[str, str] | None = None,
+    enable_gzip: bool = True,
+    num_workers: int = 1,
+    channel_batch_size: int = 20,
+    relative_to: datetime | ts.IntegralNanosecondsUTC | None = None,
+    relative_resolution: ts._LiteralTimeUnit = "nanoseconds",
+    max_frame_bytes: int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Download a datasource to a sequence of pandas dataframes, each covering a successive slice of time.
+
+    This is a memory-bounded alternative to `datasource_to_dataframe`: rather than joining every channel's data
+    for the whole time range at once, `[start, end)` is cut into slices and the channels of each slice are
+    downloaded, joined, and yielded before moving on. The next slice is downloaded while the caller processes
+    the current one, so at most two slices are held in memory at a time.
+
+    Args:
+    ----
+        datasource: The datasource to download data from
+        start: Start of the time range to download
+        end: End of the time range to download (exclusive)
+        slice_duration: Width of each time slice. Narrower slices use less memory at the cost of more requests.
+        channel_exact_match: Filter the returned channels to those whose names match all provided strings
+            (case insensitive).
+        channel_fuzzy_search_text: Filters the returned channels to those whose names fuzzily match the provided
+            string.
+        channels: List of channels to fetch data for. If provided, supercedes search parameters of
+            `channel_exact_match` and `channel_fuzzy_search_text`.
+        tags: Dictionary of tags to filter channels by
+        enable_gzip: If true, use gzip when exporting data from Nominal.
+        num_workers: Number of export requests to make in parallel.
+        channel_batch_size: Number of channels to request at a time per worker thread.
+        relative_to: If provided, return timestamps relative to the given epoch time
+        relative_resolution: If providing timestamps in relative time, the resolution to use
+        max_frame_bytes: If provided, a target for how much memory each slice's dataframe takes up: whenever a
+            slice's dataframe is larger than this, the slices after it are narrowed in proportion. This is a target
+            rather than a limit, as a slice's size is only known once it has downloaded, so any slice (including
+            the first) may still exceed it, e.g. where the data gets denser.
+
+    Yields:
+    ------
+        Pandas dataframes, in time order, whose index is the timestamp of the data and whose columns are the
+        selected channels. Slices without data are skipped, and columns for channels with no data in a given
+        slice are omitted from that slice's dataframe.
+    """
+    start_ns = ts._SecondsNanos.from_flexible(start).to_nanoseconds()
+    end_ns = ts._SecondsNanos.from_flexible(end).to_nanoseconds()
+    slice_ns = int(slice_duration.total_seconds() * 1e9)
+    if slice_ns <= 0:
+        raise ValueError(f"slice_duration must be positive, got {slice_duration}")
+
+    channels = _resolve_channels(datasource, channels, channel_exact_match, channel_fuzzy_search_text)
+    if not channels:
+        logger.warning("Requested data for no columns: nothing to download")
+        return
+
+    exporter = _ChannelBatchExporter(
+        datasource,
+        channels,
+        tags=tags,
+        enable_gzip=enable_gzip,
+        relative_to=relative_to,
+        relative_resolution=relative_resolution,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
+
+        def submit_slice(
+            slice_start: int,
+        ) -> tuple[int, dict[concurrent.futures.Future[pd.DataFrame], tuple[Channel, ...]]]:
+            slice_end = min(slice_start + slice_ns, end_ns)
+            start_time = ts._SecondsNanos.from_nanoseconds(slice_start).to_api()
+            end_time = ts._SecondsNanos.from_nanoseconds(slice_end).to_api()
+            return slice_end, exporter.submit(pool, start_time, end_time, channel_batch_size)
+
+        pending = submit_slice(start_ns) if start_ns < end_ns else None
+        while pending is not None:
+            slice_end, futures = pending
+            frames = [frame for frame in exporter.collect(futures) if not frame.empty]
+            df = exporter.join(frames) if frames else None
+            del frames
+            if df is not None and max_frame_bytes is not None:
+                frame_bytes = int(df.memory_usage(index=True).sum())
+                if frame_bytes > max_frame_bytes:
+                    slice_ns = max(1, slice_ns * max_frame_bytes // frame_bytes)
+                    logger.info("Slice used %d bytes, narrowing later slices to %dns", frame_bytes, slice_ns)
+
+            # start downloading the next slice, at its adjusted width, while the caller processes this one
+            pending = submit_slice(slice_end) if slice_end < end_ns else None
+            if df is not None:
+                yield df
+
+
+def _resolve_channels(
+    datasource: DataSource,
+    channels: Sequence[Channel] | None,
+    channel_exact_match: Sequence[str] | None,
+    channel_fuzzy_search_text: str | None,
+) -> Sequence[Channel]:
     if channels is None:
-        channels = list(
+        return list(
             datasource.search_channels(
                 exact_match=channel_exact_match or (),
                 fuzzy_search_text=channel_fuzzy_search_text or "",
@@ -335,79 +630,112 @@ def datasource_to_dataframe(
             "'channel_exact_match' and 'channel_fuzzy_search_text' are ignored when a list of channels "
             "are provided to 'datasource_to_dataframe'."
         )
+    return channels
+
+
+class _ChannelBatchExporter:
+    """Exports batches of a datasource's channels to pandas, and joins the batches back together on time."""
+
+    def __init__(
+        self,
+        datasource: DataSource,
+        channels: Sequence[Channel],
+        *,
+        tags: Mapping[str, str] | None,
+        enable_gzip: bool,
+        relative_to: datetime | ts.IntegralNanosecondsUTC | None,
+        relative_resolution: ts._LiteralTimeUnit,
+    ) -> None:
+        self._datasource = datasource
+        self._channels = channels
+        self._tags = tags
+        self._enable_gzip = enable_gzip
+        self._relative_to = relative_to
+        self._timestamp_type = ts._to_export_timestamp_type(relative_to, relative_resolution)
+        # Warn about renamed channels
+        self._renamed_timestamp_col = _get_renamed_timestamp_column(list(channels))
+
+    def submit(
+        self,
+        pool: concurrent.futures.Executor,
+        start_time: Timestamp,
+        end_time: Timestamp,
+        channel_batch_size: int,
+    ) -> dict[concurrent.futures.Future[pd.DataFrame], tuple[Channel, ...]]:
+        """Start exporting every channel between the given times, `channel_batch_size` channels per request."""
+        return {
+            pool.submit(self._export_channel_batch, channel_batch, start_time, end_time): channel_batch
+            for channel_batch in batched(self._channels, channel_batch_size)
+        }
 
-    if not channels:
-        logger.warning("Requested data for no columns: returning empty dataframe")
-        return pd.DataFrame({_EXPORTED_TIMESTAMP_COL_NAME: []}).set_index(_EXPORTED_TIMESTAMP_COL_NAME)
+    def collect(
+        self, df_futures: Mapping[concurrent.futures.Future[pd.DataFrame], tuple[Channel, ...]]
+    ) -> list[pd.DataFrame]:
+        """Wait for the given exports, returning the dataframes of those that succeeded."""
+        all_dataframes = []
+        for df_future in concurrent.futures.as_completed(df_futures):
+            channel_batch = df_futures[df_future]
+
+            ex = df_future.exception()
+            if ex is not None:
+                logger.error(
+                    "Failed exporting data for channels %s from datasource %s",
+                    [ch.name for ch in channel_batch],
+                    self._datasource.rid,
+                    exc_info=ex,
+                )
+                continue
+            else:
+                all_dataframes.append(df_future.result())
+        return all_dataframes
+
+    def join(self, dataframes: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        """Outer-join the dataframes of separate channel batches on their timestamps."""
+        try:
+            result_df = pd.concat(dataframes, axis=1, join="outer", sort=True)
+        except Exception as ex:
+            raise RuntimeError(
+                "Failed to join dataframe chunks-- ensure you have properly specified the tags for your datascope"
+            ) from ex
 
-    # Warn about renamed channels
-    renamed_timestamp_col = _get_renamed_timestamp_column(list(channels))
+        if self._renamed_timestamp_col is not None:
+            result_df.index = result_df.index.rename(_EXPORTED_TIMESTAMP_COL_NAME)
 
-    def _export_channel_batch(channel_batch: tuple[Channel, ...]) -> pd.DataFrame:
+        return result_df
+
+    def _export_channel_batch(
+        self, channel_batch: tuple[Channel, ...], start_time: Timestamp, end_time: Timestamp
+    ) -> pd.DataFrame:
         export_request = _construct_export_request(
             channel_batch,
             start_time,
             end_time,
-            tags=tags,
-            enable_gzip=enable_gzip,
-            timestamp_type=ts._to_export_timestamp_type(relative_to, relative_resolution),
+            tags=self._tags,
+            enable_gzip=self._enable_gzip,
+            timestamp_type=self._timestamp_type,
         )
         export_response = cast(
             BinaryIO,
-            datasource._clients.dataexport.export_channel_data(datasource._clients.auth_header, export_request),
+            self._datasource._clients.dataexport.export_channel_data(
+                self._datasource._clients.auth_header, export_request
+            ),
+        )
+        batch_df = _read_export_csv(
+            export_response,
+            channel_batch,
+            self._renamed_timestamp_col,
+            enable_gzip=self._enable_gzip,
+            absolute_timestamps=self._relative_to is None,
         )
-        batch_df = pd.DataFrame(pd.read_csv(export_response, compression="gzip" if enable_gzip else "infer"))
         if batch_df.empty:
             channel_names = [ch.name for ch in channel_batch]
             logger.warning(
                 "No data found for export for channels %s from datasource %s",
                 channel_names,
-                datasource.rid,
+                self._datasource.rid,
             )
             return pd.DataFrame({col: [] for col in channel_names + [_EXPORTED_TIMESTAMP_COL_NAME]}).set_index(
                 _EXPORTED_TIMESTAMP_COL_NAME
             )
         else:
-            if relative_to is None:
-                batch_df[renamed_timestamp_col] = pd.to_datetime(batch_df[renamed_timestamp_col], format="ISO8601")
-
-            return batch_df.set_index(renamed_timestamp_col)
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
-        df_futures = {
-            pool.submit(_export_channel_batch, channel_batch): channel_batch
-            for channel_batch in batched(channels, channel_batch_size)
-        }
-
-        all_dataframes = []
-        for df_future in concurrent.futures.as_completed(df_futures):
-            channel_batch = df_futures[df_future]
-
-            ex = df_future.exception()
-            if ex is not None:
-                logger.error(
-                    "Failed exporting data for channels %s from datasource %s",
-                    [ch.name for ch in channel_batch],
-                    datasource.rid,
-                    exc_info=ex,
-                )
-                continue
-            else:
-                all_dataframes.append(df_future.result())
-
-    if not all_dataframes:
-        logger.warning(f"No data found for export from datasource {datasource.rid}")
-        all_column_names = [_EXPORTED_TIMESTAMP_COL_NAME] + [ch.name for ch in channels]
-        return pd.DataFrame({col: [] for col in all_column_names}).set_index(_EXPORTED_TIMESTAMP_COL_NAME)
-
-    try:
-        result_df = pd.concat(all_dataframes, axis=1, join="outer", sort=True)
-    except Exception as ex:
-        raise RuntimeError(
-            "Failed to join dataframe chunks-- ensure you have properly specified the tags for your datascope"
-        ) from ex
-
-    if renamed_timestamp_col is not None:
-        result_df.index = result_df.index.rename(_EXPORTED_TIMESTAMP_COL_NAME)
-
-    return result_df
+            return batch_df
@@ -0,0 +1,244 @@
+import dataclasses
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from typing import Callable, Iterable, Mapping, Sequence
+
+import polars as pl
+from nominal.core._types import PathLike
+from nominal.ts import IntegralNanosecondsUTC
+
+# Default upper bound on the total size of cached exports on disk
+DEFAULT_MAX_CACHE_BYTES = 10 * 1024**3
+
+# Default age data must reach before it is cached, so that data still being ingested is always re-fetched
+DEFAULT_MIN_CACHE_AGE = datetime.timedelta(hours=1)
+
+_SEGMENT_SUFFIX = ".parquet"
+
+logger = logging.getLogger(__name__)
+
+_Interval = tuple[IntegralNanosecondsUTC, IntegralNanosecondsUTC]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Segment:
+    """One cached file, holding a single channel's data for `[start, end)`."""
+
+    start: IntegralNanosecondsUTC
+    end: IntegralNanosecondsUTC
+    path: pathlib.Path
+
+
+class ExportCache:
+    """Size-bounded on-disk cache of exported channel data, for re-running exports over historical ranges.
+
+    Each channel's data is stored as Parquet files, each covering a range of time, under a directory per
+    (datasource, channel, tags, export options). A request is served from whichever files lie within its range,
+    and only the remaining gaps are exported and then cached. Data newer than `min_age` is never cached, since it
+    may still be changing. Once the cache grows beyond `max_bytes`, the least recently used files are removed.
+
+    Pass an instance to `PolarsExportHandler` to use it. The cache may be shared between handlers and threads,
+    and its directory persists across processes.
+    """
+
+    def __init__(
+        self,
+        directory: PathLike,
+        *,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        min_age: datetime.timedelta = DEFAULT_MIN_CACHE_AGE,
+    ) -> None:
+        """Open (creating if needed) a cache rooted at `directory`.
+
+        Args:
+            directory: Directory to store cached data in.
+            max_bytes: Upper bound on the total size of cached files.
+            min_age: Only data older than this is cached.
+        """
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._min_age = min_age
+        self._lock = threading.Lock()
+        # path -> (size in bytes, last access time); modification times double as access times across processes
+        self._files: dict[pathlib.Path, tuple[int, float]] = {}
+        for path in self._directory.glob(f"*/*{_SEGMENT_SUFFIX}"):
+            stat = path.stat()
+            self._files[path] = (stat.st_size, stat.st_mtime)
+        self._total_bytes = sum(size for size, _ in self._files.values())
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached files."""
+        with self._lock:
+            return self._total_bytes
+
+    def is_cacheable(self, end: IntegralNanosecondsUTC) -> bool:
+        """Whether data up to `end` is old enough to be cached."""
+        cutoff = time.time_ns() - int(self._min_age.total_seconds() * 1e9)
+        return end <= cutoff
+
+    def clear(self) -> None:
+        """Remove every cached file."""
+        with self._lock:
+            for path in self._files:
+                path.unlink(missing_ok=True)
+            self._files.clear()
+            self._total_bytes = 0
+
+    def load(
+        self,
+        *,
+        datasource_rid: str,
+        channel_names: Sequence[str],
+        tags: Mapping[str, str],
+        options: str,
+        start: IntegralNanosecondsUTC,
+        end: IntegralNanosecondsUTC,
+        time_column: str,
+        fetch: Callable[[IntegralNanosecondsUTC, IntegralNanosecondsUTC], pl.DataFrame],
+    ) -> list[pl.DataFrame]:
+        """Load the given channels' data for `[start, end)`, exporting and caching whatever isn't cached yet.
+
+        Args:
+            datasource_rid: Datasource the channels belong to.
+            channel_names: Channels to load.
+            tags: Tags the channels' data is filtered by.
+            options: Any other export options that affect the exported data, e.g. the timestamp format.
+            start: Start of the range to load.
+            end: End of the range to load, exclusive.
+            time_column: Name of the timestamp column in exported data.
+            fetch: Exports all of the channels for a sub-range of `[start, end)`, returning a DataFrame with
+                `time_column` and a column per channel.
+
+        Returns:
+            Per-channel DataFrames of `time_column` and that channel's values, which together cover every
+            channel over `[start, end)` exactly once.
+        """
+        series_dirs = {
+            name: self._directory / _series_key(datasource_rid, name, tags, options) for name in channel_names
+        }
+        tilings = {name: _tile(self._segments(series_dir), start, end) for name, series_dir in series_dirs.items()}
+        gaps = _merge_gaps(tilings.values())
+
+        fetched: dict[str, list[pl.DataFrame]] = {name: [] for name in channel_names}
+        for gap_start, gap_end in gaps:
+            df = fetch(gap_start, gap_end)
+            for name, series_dir in series_dirs.items():
+                channel_df = _channel_frame(df, name, time_column)
+                self._store(series_dir / f"{gap_start}_{gap_end}{_SEGMENT_SUFFIX}", channel_df)
+                fetched[name].append(channel_df)
+
+        frames: list[pl.DataFrame] = []
+        for name, (segments, _) in tilings.items():
+            for segment in segments:
+                if not any(gap_start <= segment.start and segment.end <= gap_end for gap_start, gap_end in gaps):
+                    frames.append(self._read(segment.path))
+            frames.extend(fetched[name])
+        return frames
+
+    def _segments(self, series_dir: pathlib.Path) -> list[_Segment]:
+        segments = []
+        with self._lock:
+            paths = [path for path in self._files if path.parent == series_dir]
+        for path in paths:
+            start, _, end = path.name.removesuffix(_SEGMENT_SUFFIX).partition("_")
+            segments.append(_Segment(int(start), int(end), path))
+        return segments
+
+    def _read(self, path: pathlib.Path) -> pl.DataFrame:
+        df = pl.read_parquet(path)
+        now = time.time()
+        os.utime(path, (now, now))
+        with self._lock:
+            if path in self._files:
+                self._files[path] = (self._files[path][0], now)
+        return df
+
+    def _store(self, path: pathlib.Path, df: pl.DataFrame) -> None:
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        df.write_parquet(tmp_path)
+        tmp_path.replace(path)
+        size = path.stat().st_size
+        with self._lock:
+            previous_size, _ = self._files.get(path, (0, 0.0))
+            self._files[path] = (size, time.time())
+            self._total_bytes += size - previous_size
+            self._evict()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self._max_bytes:
+            return
+        for path, (size, _) in sorted(self._files.items(), key=lambda item: item[1][1]):
+            path.unlink(missing_ok=True)
+            del self._files[path]
+            self._total_bytes -= size
+            logger.debug("Evicted %s from export cache", path)
+            if self._total_bytes <= self._max_bytes:
+                return
+
+
+def _series_key(datasource_rid: str, channel_name: str, tags: Mapping[str, str], options: str) -> str:
+    key = json.dumps([datasource_rid, channel_name, sorted(tags.items()), options])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _tile(
+    segments: Sequence[_Segment], start: IntegralNanosecondsUTC, end: IntegralNanosecondsUTC
+) -> tuple[list[_Segment], list[_Interval]]:
+    """Cover `[start, end)` with non-overlapping cached segments that lie within it, and gaps between them."""
+    contained = [segment for segment in segments if start <= segment.start and segment.end <= end]
+    tiles: list[_Segment] = []
+    gaps: list[_Interval] = []
+    cursor = start
+    while cursor < end:
+        candidates = [segment for segment in contained if segment.start == cursor]
+        if candidates:
+            tile = max(candidates, key=lambda segment: segment.end)
+            tiles.append(tile)
+            cursor = tile.end
+        else:
+            gap_end = min((segment.start for segment in contained if segment.start > cursor), default=end)
+            gaps.append((cursor, gap_end))
+            cursor = gap_end
+    return tiles, gaps
+
+
+def _merge_gaps(tilings: Iterable[tuple[list[_Segment], list[_Interval]]]) -> list[_Interval]:
+    """Merge every channel's gaps, widening them until no channel's cached segment straddles a gap's edge.
+
+    Every channel is exported over the resulting gaps, and served from its cached segments elsewhere.
+    """
+    all_tilings = list(tilings)
+    gaps = sorted(gap for _, channel_gaps in all_tilings for gap in channel_gaps)
+    while True:
+        merged: list[_Interval] = []
+        for gap_start, gap_end in gaps:
+            if merged and gap_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], gap_end))
+            else:
+                merged.append((gap_start, gap_end))
+
+        widened = list(merged)
+        for tiles, _ in all_tilings:
+            for tile in tiles:
+                for idx, (gap_start, gap_end) in enumerate(widened):
+                    overlaps = tile.start < gap_end and gap_start < tile.end
+                    if overlaps and not (gap_start <= tile.start and tile.end <= gap_end):
+                        widened[idx] = (min(gap_start, tile.start), max(gap_end, tile.end))
+        if widened == merged:
+            return merged
+        gaps = sorted(widened)
+
+
+def _channel_frame(df: pl.DataFrame, channel_name: str, time_column: str) -> pl.DataFrame:
+    if channel_name not in df.columns or time_column not in df.columns:
+        return pl.DataFrame()
+    return df.select(time_column, channel_name).filter(pl.col(channel_name).is_not_null())
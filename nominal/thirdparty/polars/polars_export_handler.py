@@ -2,8 +2,11 @@ import collections
 import concurrent.futures
 import dataclasses
 import datetime
+import functools
+import gzip
 import logging
-from typing import Iterator, Mapping, Sequence
+import threading
+from typing import Any, BinaryIO, Callable, Iterator, Literal, Mapping, Sequence, cast
 
 from nominal_api import api, scout_compute_api, scout_dataexport_api
 from typing_extensions import Self
@@ -11,9 +14,9 @@ from typing_extensions import Self
 import polars as pl
 from nominal._utils import LogTiming
 from nominal._utils.iterator_tools import batched
-from nominal.core.channel import Channel, ChannelDataType, filter_channels_with_data
+from nominal.core.channel import Channel, ChannelDataType
 from nominal.core.client import NominalClient
-from nominal.core.datasource import DataSource
+from nominal.thirdparty.polars.polars_export_cache import ExportCache
 from nominal.ts import (
     Epoch,
     IntegralNanosecondsDuration,
@@ -41,6 +44,9 @@ DEFAULT_POINTS_PER_DATAFRAME = 25_000_000
 # Maximum number of channels to get data for within a single request to Nominal
 DEFAULT_CHANNELS_PER_REQUEST = 25
 
+# Maximum number of time slices downloading, merging, or waiting to be yielded at once
+DEFAULT_MAX_BUFFERED_SLICES = 3
+
 # Maximum number of buckets / decimated points exported per compute query.
 # TODO(drake) raise 1000 limit once backend limit is raised
 MAX_NUM_BUCKETS = 1000
@@ -50,6 +56,10 @@ _EXPORTABLE_DATA_TYPES: frozenset[ChannelDataType] = frozenset(
     [ChannelDataType.DOUBLE, ChannelDataType.INT, ChannelDataType.STRING]
 )
 
+# File format requested from the data export service: CSV is parsed client-side, while Arrow arrives as an
+# already-columnar IPC stream that polars can load without any text parsing
+ExportFileFormat = Literal["csv", "arrow"]
+
 DEFAULT_EXPORTED_TIMESTAMP_COL_NAME = "timestamp"
 _INTERNAL_TS_COL = "__nmnl_ts__"  # internal join key, chosen to avoid collision with channel names
 
@@ -242,8 +252,9 @@ def _channel_points_per_second(
 ) -> Mapping[tuple[str, str], float | None]:
     """For each provided channel, determine the peak number of points per second in the given range.
 
-    Splits channels into batches of `DEFAULT_CHANNELS_PER_REQUEST` and queries each batch in parallel
-    via an internally-managed thread pool.
+    Splits each datasource's channels into batches of `DEFAULT_CHANNELS_PER_REQUEST` and queries each
+    batch in parallel via an internally-managed thread pool. A channel with no data in the range gets a
+    rate of 0.0, so no separate data presence check is needed.
 
     NOTE: may take a long time for large channel counts. Takes approx. 30s for 1000 channels with good internet,
           but varies based on how many points are within the query bounds.
@@ -264,9 +275,17 @@ def _channel_points_per_second(
     """
     start_ns = _SecondsNanos.from_flexible(start).to_nanoseconds()
     end_ns = _SecondsNanos.from_flexible(end).to_nanoseconds()
+    channels_by_datasource: dict[str, list[Channel]] = collections.defaultdict(list)
+    for channel in channels:
+        channels_by_datasource[channel.data_source].append(channel)
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
         futures = {}
-        for channel_batch in batched(channels, DEFAULT_CHANNELS_PER_REQUEST):
+        for channel_batch in (
+            channel_batch
+            for ds_channels in channels_by_datasource.values()
+            for channel_batch in batched(ds_channels, DEFAULT_CHANNELS_PER_REQUEST)
+        ):
             fut = pool.submit(
                 _batch_channel_points_per_second,
                 client,
@@ -382,6 +401,10 @@ class _TimeRange:
         return self.subdivide_ns(int(duration.total_seconds() * 1e9))
 
 
+# (data_source, channel_name, tags, time range) a point rate was estimated for
+_RateKey = tuple[str, str, frozenset[tuple[str, str]], _TimeRange]
+
+
 def _compute_batch_duration(
     batch_duration: datetime.timedelta | None,
     time_range: _TimeRange,
@@ -407,6 +430,66 @@ def _compute_batch_duration(
         return int(batch_duration.total_seconds() * 1e9)
 
 
+@dataclasses.dataclass(frozen=True)
+class _ExportRequestTemplate:
+    """Everything in an export request except its time bounds.
+
+    Resolved once per channel group when planning an export, and shared by all of that group's jobs.
+    """
+
+    channels: scout_dataexport_api.ExportChannels
+    resolution: scout_dataexport_api.ResolutionOption
+    file_format: ExportFileFormat = "csv"
+
+    @classmethod
+    def for_channels(
+        cls,
+        channels: Sequence[Channel],
+        *,
+        tags: Mapping[str, str],
+        buckets: int | None,
+        resolution: IntegralNanosecondsDuration | None,
+        timestamp_type: _AnyExportableTimestampType,
+        file_format: ExportFileFormat = "csv",
+    ) -> Self:
+        """Construct the export channels and resolution options for the given channels and export options."""
+        if buckets is not None and resolution is not None:
+            raise ValueError("Only one of buckets or resolution may be provided")
+        elif buckets is None and resolution is None:
+            resolution_option = scout_dataexport_api.ResolutionOption(
+                undecimated=scout_dataexport_api.UndecimatedResolution()
+            )
+        else:
+            resolution_option = scout_dataexport_api.ResolutionOption(nanoseconds=resolution, buckets=buckets)
+
+        export_channels = scout_dataexport_api.ExportChannels(
+            time_domain=scout_dataexport_api.ExportTimeDomainChannels(
+                channels=[channel._to_time_domain_channel(tags=tags) for channel in channels],
+                merge_timestamp_strategy=scout_dataexport_api.MergeTimestampStrategy(
+                    none=scout_dataexport_api.NoneStrategy()
+                ),
+                output_timestamp_format=_to_export_timestamp_format(timestamp_type),
+            )
+        )
+        return cls(channels=export_channels, resolution=resolution_option, file_format=file_format)
+
+    def export_request(self, time_slice: _TimeRange) -> scout_dataexport_api.ExportDataRequest:
+        """Construct the conjure export request for the given time slice."""
+        return scout_dataexport_api.ExportDataRequest(
+            channels=self.channels,
+            context=scout_compute_api.Context(dataset_references={}, variables={}, function_variables={}),
+            end_time=time_slice.end_api,
+            start_time=time_slice.start_api,
+            resolution=self.resolution,
+            compression=scout_dataexport_api.CompressionFormat.GZIP,
+            format=(
+                scout_dataexport_api.ExportFormat(arrow=scout_dataexport_api.Arrow())
+                if self.file_format == "arrow"
+                else scout_dataexport_api.ExportFormat(csv=scout_dataexport_api.Csv())
+            ),
+        )
+
+
 @dataclasses.dataclass(frozen=True, unsafe_hash=True)
 class _ExportJob:
     """Represents a single CSV export request dispatched to a worker thread."""
@@ -421,6 +504,9 @@ class _ExportJob:
     # Key-value pairs to filter channels by
     tags: dict[str, str]
 
+    # Request contents shared with the other jobs for the same channels
+    template: _ExportRequestTemplate = dataclasses.field(compare=False, repr=False)
+
     # Decimation settings
     buckets: int | None = None
     resolution: IntegralNanosecondsDuration | None = None
@@ -428,41 +514,13 @@ class _ExportJob:
     # Timestamp formatting
     timestamp_type: _AnyExportableTimestampType = "epoch_seconds"
 
-    def resolution_options(self) -> scout_dataexport_api.ResolutionOption:
-        """Construct data export resolution options based on bucketing and resolution parameters."""
-        if self.buckets is not None and self.resolution is not None:
-            raise ValueError("Only one of buckets or resolution may be provided")
-        elif self.buckets is None and self.resolution is None:
-            return scout_dataexport_api.ResolutionOption(undecimated=scout_dataexport_api.UndecimatedResolution())
-        else:
-            return scout_dataexport_api.ResolutionOption(nanoseconds=self.resolution, buckets=self.buckets)
+    def export_request(self) -> scout_dataexport_api.ExportDataRequest:
+        """Construct conjure export request for this job's time slice."""
+        return self.template.export_request(self.time_slice)
 
-    def export_channels(self, datasource: DataSource) -> scout_dataexport_api.ExportChannels:
-        """Construct data export channels for the configured channels and export options."""
-        channels = datasource.get_channels(names=self.channel_names)
-        return scout_dataexport_api.ExportChannels(
-            time_domain=scout_dataexport_api.ExportTimeDomainChannels(
-                channels=[channel._to_time_domain_channel(tags=self.tags) for channel in channels],
-                merge_timestamp_strategy=scout_dataexport_api.MergeTimestampStrategy(
-                    none=scout_dataexport_api.NoneStrategy()
-                ),
-                output_timestamp_format=_to_export_timestamp_format(self.timestamp_type),
-            )
-        )
 
-    def export_request(self, datasource: DataSource) -> scout_dataexport_api.ExportDataRequest:
-        """Construct conjure export request given the provided configuration options."""
-        return scout_dataexport_api.ExportDataRequest(
-            channels=self.export_channels(datasource),
-            context=scout_compute_api.Context(dataset_references={}, variables={}, function_variables={}),
-            end_time=self.time_slice.end_api,
-            start_time=self.time_slice.start_api,
-            resolution=self.resolution_options(),
-            compression=scout_dataexport_api.CompressionFormat.GZIP,
-            format=scout_dataexport_api.ExportFormat(
-                csv=scout_dataexport_api.Csv(),
-            ),
-        )
+# Computes export jobs keyed by time slice, e.g. for one datasource while earlier jobs already download
+_JobPlanner = Callable[[], Mapping[_TimeRange, Sequence[_ExportJob]]]
 
 
 def _format_time_col(df: pl.DataFrame, time_col: str, job: _ExportJob) -> pl.DataFrame:
@@ -472,12 +530,25 @@ def _format_time_col(df: pl.DataFrame, time_col: str, job: _ExportJob) -> pl.Dat
         # Already numeric/relative per export service; no transform.
         return df.with_columns(pl.col(time_col).cast(pl.Float64).alias(time_col))
     elif isinstance(typed_timestamp_type, Iso8601):
+        if df.schema[time_col].is_temporal():
+            # Arrow exports carry native timestamps
+            return df
         # Parse ISO8601 into timezone-aware datetime
         return df.with_columns(pl.col(time_col).str.strptime(pl.Datetime, strict=False, exact=False).alias(time_col))
     else:
         raise ValueError("Expected timestamp type to be a typed timestamp type")
 
 
+def _read_export(resp: BinaryIO, file_format: ExportFileFormat, schema: Mapping[str, pl.DataType]) -> pl.DataFrame:
+    """Load a gzipped export response into a DataFrame, coercing known channels to their expected types."""
+    if file_format == "csv":
+        return pl.read_csv(resp, schema_overrides=schema)
+
+    with gzip.GzipFile(fileobj=resp, mode="rb") as gz:
+        df = pl.read_ipc_stream(gz.read())
+    return df.cast({name: dtype for name, dtype in schema.items() if name in df.columns}, strict=False)
+
+
 def _get_exported_timestamp_channel(channel_names: list[str]) -> str:
     # skip data channel names, and find the highest numbered "timestamp" channel
     renamed_timestamp_col = DEFAULT_EXPORTED_TIMESTAMP_COL_NAME
@@ -501,27 +572,13 @@ def _export_job(job: _ExportJob, client: NominalClient) -> pl.DataFrame:
     # Warn user about renamed channels, handle data with channel names of "timestamp"
     time_col = _get_exported_timestamp_channel(job.channel_names)
 
-    datasource = client.get_datasource(job.datasource_rid)
-    req = job.export_request(datasource)
+    req = job.export_request()
     resp = client._clients.dataexport.export_channel_data(client._clients.auth_header, req)
 
     # force schema for export based on known channel types (helps if columns are all nan for a given part to prevent
     # that channel from loading as strings)
-    schema: dict[str, pl.DataType] = {}
-    for channel_name, data_type in job.channel_types.items():
-        match data_type:
-            case ChannelDataType.STRING:
-                schema[channel_name] = pl.String()
-            case ChannelDataType.DOUBLE:
-                schema[channel_name] = pl.Float64()
-            case ChannelDataType.INT:
-                schema[channel_name] = pl.Int64()
-            case _:
-                logger.warning("Can't add missing channel %s to dataframe-- no known datatype!", channel_name)
-                continue
-
-    # Read CSV via Polars
-    df = pl.read_csv(resp, schema_overrides=schema)
+    schema = _channel_schema(job)
+    df = _read_export(cast(BinaryIO, resp), job.template.file_format, schema)
     if df.is_empty():
         logger.warning("No data found for export for channels %s", job.channel_names)
         return pl.DataFrame({col: [] for col in [*job.channel_names, time_col]})
@@ -538,8 +595,29 @@ def _export_job(job: _ExportJob, client: NominalClient) -> pl.DataFrame:
     ordered_cols = [_INTERNAL_TS_COL] + [c for c in df.columns if c not in (_INTERNAL_TS_COL, time_col)]
     df = df.select(ordered_cols).sort(by=pl.col(_INTERNAL_TS_COL))
 
+    return _with_missing_channels(df, job.channel_names, schema)
+
+
+def _channel_schema(job: _ExportJob) -> dict[str, pl.DataType]:
+    schema: dict[str, pl.DataType] = {}
+    for channel_name, data_type in job.channel_types.items():
+        match data_type:
+            case ChannelDataType.STRING:
+                schema[channel_name] = pl.String()
+            case ChannelDataType.DOUBLE:
+                schema[channel_name] = pl.Float64()
+            case ChannelDataType.INT:
+                schema[channel_name] = pl.Int64()
+            case _:
+                logger.warning("Can't add missing channel %s to dataframe-- no known datatype!", channel_name)
+    return schema
+
+
+def _with_missing_channels(
+    df: pl.DataFrame, channel_names: Sequence[str], schema: Mapping[str, pl.DataType]
+) -> pl.DataFrame:
     # Add columns missing from the data to the dataframe for schema inference
-    missing_channels = [channel_name for channel_name in job.channel_names if channel_name not in df.columns]
+    missing_channels = [channel_name for channel_name in channel_names if channel_name not in df.columns]
     if missing_channels:
         logger.warning("Found %d missing channels", len(missing_channels))
         channel_exprs = {}
@@ -593,20 +671,45 @@ def _merge_dfs(dfs: Sequence[pl.DataFrame]) -> pl.DataFrame:
     return merged.sort(_INTERNAL_TS_COL).collect()
 
 
+@dataclasses.dataclass
+class _SliceDownload:
+    """Progress of the export jobs for a single time slice."""
+
+    time_slice: _TimeRange
+    # Per-job results, in job order; None until the job succeeds
+    results: list[pl.DataFrame | None]
+    remaining: int
+    failed: int = 0
+    merged: concurrent.futures.Future[pl.DataFrame] | None = None
+
+
+def _merge_slice(results: Sequence[pl.DataFrame], time_column: str) -> pl.DataFrame:
+    with LogTiming(f"Merged {len(results)} exports"):
+        merged_df = _merge_dfs(results)
+    if merged_df.is_empty():
+        logger.warning("Dataframe empty after merging...")
+        return merged_df
+    return merged_df.rename({_INTERNAL_TS_COL: time_column})
+
+
 class PolarsExportHandler:
     """Streams data out of Nominal into Polars DataFrames.
 
     Pipeline:
     * Filter to exportable channel types (DOUBLE/INT/STRING).
-    * Confirm each channel has data in the range (via `filter_channels_with_data`) and
-      estimate per-channel peak points-per-second.
+    * Estimate per-channel peak points-per-second with one batched compute request per datasource
+      and batch of channels, dropping channels without data in the range. Estimates are cached per
+      (channel, tags, time range) for the lifetime of the handler.
     * Compute a batch duration such that each DataFrame batch stays under `points_per_dataframe`,
-      unless the caller passes an explicit `batch_duration`.
+      unless the caller passes an explicit `batch_duration`. With an explicit batch duration, each
+      datasource is planned independently, and downloads start as soon as its jobs are ready.
     * Bin-pack channels into per-request groups within the `points_per_request` rate budget;
       channels whose rate exceeds the budget are split across sub-slices of the time range.
-    * For each time slice, fetch channel groups in parallel and stitch the results back into a
-      single DataFrame (via vertical concat within equal-column groups, outer-join across groups
-      on the timestamp column) before yielding.
+    * Fetch channel groups with up to `num_workers` requests in flight across time slice
+      boundaries, and stitch each finished slice back into a single DataFrame on a separate
+      thread (via vertical concat within equal-column groups, outer-join across groups on the
+      timestamp column) while later slices download. Slices are yielded in time order, with at
+      most `max_buffered_slices` held in memory at once.
     """
 
     def __init__(
@@ -616,14 +719,33 @@ class PolarsExportHandler:
         points_per_dataframe: int = DEFAULT_POINTS_PER_DATAFRAME,
         channels_per_request: int = DEFAULT_CHANNELS_PER_REQUEST,
         num_workers: int = DEFAULT_NUM_WORKERS,
+        max_buffered_slices: int = DEFAULT_MAX_BUFFERED_SLICES,
+        file_format: ExportFileFormat = "csv",
+        cache: ExportCache | None = None,
     ):
-        """Initialize export handler"""
+        """Initialize export handler
+
+        `file_format` selects the format data is transferred in. "arrow" skips client-side CSV parsing
+        entirely, and is much cheaper on CPU for large exports, but requires a backend with Arrow export support.
+
+        If a `cache` is given, undecimated exports of historical data are served from it where possible, and
+        whatever it is missing is exported and added to it.
+        """
+        if max_buffered_slices < 1:
+            raise ValueError(f"max_buffered_slices must be at least 1, got {max_buffered_slices}")
+
         self._client = client
         self._points_per_request = points_per_request
         self._points_per_dataframe = points_per_dataframe
         self._channels_per_request = channels_per_request
 
         self._num_workers = num_workers
+        self._max_buffered_slices = max_buffered_slices
+        self._file_format = file_format
+        self._cache = cache
+
+        self._rate_cache: dict[_RateKey, float] = {}
+        self._rate_cache_lock = threading.Lock()
 
     def _compute_channel_rates(
         self,
@@ -631,35 +753,47 @@ class PolarsExportHandler:
         time_range: _TimeRange,
         tags: Mapping[str, str] | None,
     ) -> tuple[list[Channel], dict[tuple[str, str], float]]:
-        """Filter by data presence, compute PPS, and fill in 0.0 for unknown/missing rates.
+        """Compute PPS, dropping channels without data in the range.
 
-        Returns the filtered channel list (confirmed to have data in the range) and a
-        mapping from (data_source, channel_name) to estimated peak PPS. Channels with
-        failed/degenerate PPS estimation default to 0.0 so they aren't silently dropped
-        downstream.
+        Returns the channels confirmed to have data in the range, and a mapping from
+        (data_source, channel_name) to estimated peak PPS. Rates are only computed for channels
+        that haven't been estimated over the same range and tags by this handler before.
         """
-        # Cost gate: PPS compute alone correctly handles empty-data channels, but this filter
-        # avoids running the expensive compute on channels with no data in the range.
-        supported_channels = list(
-            filter_channels_with_data(
-                channels,
-                tags=tags,
-                start_time=time_range.start_time,
-                end_time=time_range.end_time,
-            )
-        )
-        all_pps = _channel_points_per_second(
+        tag_key = frozenset((tags or {}).items())
+
+        def rate_key(channel: Channel) -> _RateKey:
+            return channel.data_source, channel.name, tag_key, time_range
+
+        with self._rate_cache_lock:
+            cached = {key: self._rate_cache[key] for key in map(rate_key, channels) if key in self._rate_cache}
+        uncached = [ch for ch in channels if rate_key(ch) not in cached]
+        if cached:
+            logger.debug("Reusing point rates for %d / %d channels", len(cached), len(channels))
+
+        # The rate estimate doubles as a data presence check: channels without data in range get 0.0
+        all_pps: dict[tuple[str, str], float | None] = {
+            (data_source, name): rate for (data_source, name, _, _), rate in cached.items()
+        }
+        computed_pps = _channel_points_per_second(
             client=self._client,
-            channels=supported_channels,
+            channels=uncached,
             start=time_range.start_time,
             end=time_range.end_time,
             tags=tags,
         )
+        all_pps.update(computed_pps)
+        with self._rate_cache_lock:
+            for channel in uncached:
+                rate = computed_pps.get((channel.data_source, channel.name))
+                # Failed estimates are retried next time rather than cached
+                if rate is not None:
+                    self._rate_cache[rate_key(channel)] = rate
+
         # Drop channels whose rate estimator returned 0.0 or None — either the channel has no
         # data in range (0.0) or the compute failed (None); either way there's nothing to
         # export, and keeping them would just waste an export request per channel.
         points_per_second = {key: rate for key, rate in all_pps.items() if rate}
-        exportable_channels = [ch for ch in supported_channels if (ch.data_source, ch.name) in points_per_second]
+        exportable_channels = [ch for ch in channels if (ch.data_source, ch.name) in points_per_second]
         return exportable_channels, points_per_second
 
     def _compute_export_jobs(
@@ -733,29 +867,46 @@ class PolarsExportHandler:
             ds_pps, channels_by_key, self._points_per_request, self._channels_per_request, batch_duration
         )
 
-        def make_job(group: Sequence[Channel], slice_: _TimeRange) -> _ExportJob:
+        job_tags = dict(tags or {})
+
+        # Only the time bounds differ between a group's jobs, so resolve the rest of each request once up front
+        def make_template(group: Sequence[Channel]) -> _ExportRequestTemplate:
+            return _ExportRequestTemplate.for_channels(
+                group,
+                tags=job_tags,
+                buckets=buckets,
+                resolution=resolution,
+                timestamp_type=timestamp_type,
+                file_format=self._file_format,
+            )
+
+        def make_job(group: Sequence[Channel], template: _ExportRequestTemplate, slice_: _TimeRange) -> _ExportJob:
             return _ExportJob(
                 datasource_rid=datasource_rid,
                 channel_names=[ch.name for ch in group],
                 channel_types={ch.name: ch.data_type for ch in group},
                 time_slice=slice_,
-                tags=dict(tags or {}),
+                tags=job_tags,
+                template=template,
                 buckets=buckets,
                 resolution=resolution,
                 timestamp_type=timestamp_type,
             )
 
+        group_templates = [(group, make_template(group)) for group in channel_groups]
+        large_templates = [(channel, make_template([channel])) for channel in large_channels]
+
         jobs: dict[_TimeRange, list[_ExportJob]] = collections.defaultdict(list)
         for time_slice in time_slices:
-            for group in channel_groups:
-                jobs[time_slice].append(make_job(group, time_slice))
+            for group, template in group_templates:
+                jobs[time_slice].append(make_job(group, template, time_slice))
             # Large channels exceed the per-request rate budget, so subdivide the slice per
             # channel so each sub-slice fits. All sub-slice jobs roll up under the parent slice.
-            for channel in large_channels:
+            for channel, template in large_templates:
                 rate = ds_pps[(channel.data_source, channel.name)]
                 sub_offset = datetime.timedelta(seconds=self._points_per_request / rate)
                 for sub_slice in time_slice.subdivide(sub_offset):
-                    jobs[time_slice].append(make_job([channel], sub_slice))
+                    jobs[time_slice].append(make_job([channel], template, sub_slice))
         return jobs
 
     def export(
@@ -794,10 +945,80 @@ class PolarsExportHandler:
         Yields:
             Polars DataFrames covering successive time slices of the export range.
         """
+        planned = self._plan_export(channels, start, end, tags, batch_duration, timestamp_type, buckets, resolution)
+        if planned is None:
+            return
+
+        export_jobs, planners, time_column = planned
+        for _, df in self._export_dataframes(export_jobs, time_column, join_batches, planners=planners):
+            if not df.is_empty():
+                yield df
+
+    def export_slices(
+        self,
+        channels: Sequence[Channel],
+        start: IntegralNanosecondsUTC,
+        end: IntegralNanosecondsUTC,
+        tags: Mapping[str, str] | None = None,
+        batch_duration: datetime.timedelta | None = None,
+        timestamp_type: _AnyExportableTimestampType = "epoch_seconds",
+        buckets: int | None = None,
+        resolution: IntegralNanosecondsDuration | None = None,
+    ) -> Iterator[tuple[IntegralNanosecondsUTC, IntegralNanosecondsUTC, pl.DataFrame]]:
+        """Yield the merged DataFrame for each time slice of the export, along with the slice's bounds.
+
+        Unlike `export`, every slice whose data was fully retrieved is yielded -- including slices with
+        no data, as an empty DataFrame -- and slices where any export request failed are skipped (after
+        logging the error) rather than yielded with missing channels. Together, the yielded bounds tell a
+        caller exactly which parts of `[start, end)` were exported, e.g. to resume an interrupted export.
+
+        Args:
+            channels: Channels to export.
+            start: Start of the export time range (nanoseconds UTC).
+            end: End of the export time range (nanoseconds UTC).
+            tags: Key-value pairs used to filter channel data server-side.
+            batch_duration: Explicit per-batch time window. If omitted, one is computed
+                from total channel rate and `points_per_dataframe`.
+            timestamp_type: Output timestamp representation (`epoch_seconds`, `iso8601`, etc.).
+            buckets: Decimate each channel to at most this many buckets per request. Mutually
+                exclusive with `resolution`.
+            resolution: Decimate each channel to samples at this interval (nanoseconds).
+                Mutually exclusive with `buckets`.
+
+        Yields:
+            Tuples of (slice start, slice end, DataFrame) for successive time slices of the export range.
+        """
+        planned = self._plan_export(channels, start, end, tags, batch_duration, timestamp_type, buckets, resolution)
+        if planned is None:
+            return
+
+        export_jobs, planners, time_column = planned
+        for time_slice, df in self._export_dataframes(
+            export_jobs, time_column, True, skip_incomplete_slices=True, planners=planners
+        ):
+            yield time_slice.start_time, time_slice.end_time, df
+
+    def _plan_export(
+        self,
+        channels: Sequence[Channel],
+        start: IntegralNanosecondsUTC,
+        end: IntegralNanosecondsUTC,
+        tags: Mapping[str, str] | None,
+        batch_duration: datetime.timedelta | None,
+        timestamp_type: _AnyExportableTimestampType,
+        buckets: int | None,
+        resolution: IntegralNanosecondsDuration | None,
+    ) -> tuple[Mapping[_TimeRange, Sequence[_ExportJob]], Sequence[_JobPlanner], str] | None:
+        """Validate export options and plan the export, or return None if there are no channels.
+
+        Returns:
+            The export jobs known up front, keyed by time slice (including slices without jobs yet), planners
+            for the remaining jobs, and the output time column.
+        """
         # Ensure user has selected channels to export
         if not channels:
             logger.warning("No channels requested for export-- returning")
-            return
+            return None
 
         # Ensure user has not selected incompatible decimation options
         if None not in (buckets, resolution):
@@ -830,70 +1051,235 @@ class PolarsExportHandler:
                 )
                 batch_duration = computed_batch_duration
 
-        # Determine download schedule
-        export_jobs = self._compute_export_jobs(
-            supported_channels, _TimeRange(start, end), timestamp_type, tags or {}, buckets, resolution, batch_duration
-        )
+        time_range = _TimeRange(start, end)
         time_column = _get_exported_timestamp_channel([ch.name for ch in supported_channels])
-        yield from self._export_dataframes(export_jobs, time_column, join_batches)
+        if batch_duration is None:
+            # The batch duration depends on the rates of every channel, so planning has to finish first
+            export_jobs = self._compute_export_jobs(
+                supported_channels, time_range, timestamp_type, tags or {}, buckets, resolution, batch_duration
+            )
+            return export_jobs, [], time_column
+
+        # Otherwise, each datasource's jobs only depend on its own channels' rates, so plan them concurrently
+        # while the jobs of datasources planned earlier download
+        channels_by_datasource: dict[str, list[Channel]] = collections.defaultdict(list)
+        for channel in supported_channels:
+            channels_by_datasource[channel.data_source].append(channel)
+        time_slices = time_range.subdivide(batch_duration)
+        planners = [
+            functools.partial(
+                self._plan_datasource_jobs,
+                datasource_rid=datasource_rid,
+                channels=ds_channels,
+                time_range=time_range,
+                time_slices=time_slices,
+                batch_duration=batch_duration,
+                timestamp_type=timestamp_type,
+                tags=tags or {},
+                buckets=buckets,
+                resolution=resolution,
+            )
+            for datasource_rid, ds_channels in channels_by_datasource.items()
+        ]
+        return {time_slice: [] for time_slice in time_slices}, planners, time_column
+
+    def _plan_datasource_jobs(
+        self,
+        *,
+        datasource_rid: str,
+        channels: Sequence[Channel],
+        time_range: _TimeRange,
+        time_slices: Sequence[_TimeRange],
+        batch_duration: datetime.timedelta,
+        timestamp_type: _AnyExportableTimestampType,
+        tags: Mapping[str, str],
+        buckets: int | None,
+        resolution: IntegralNanosecondsDuration | None,
+    ) -> Mapping[_TimeRange, Sequence[_ExportJob]]:
+        ds_channels, points_per_second = self._compute_channel_rates(channels, time_range, tags)
+        return self._build_jobs_for_datasource(
+            datasource_rid=datasource_rid,
+            channels=ds_channels,
+            points_per_second=points_per_second,
+            time_slices=time_slices,
+            batch_duration=batch_duration,
+            timestamp_type=timestamp_type,
+            tags=tags,
+            buckets=buckets,
+            resolution=resolution,
+        )
 
     def _export_dataframes(
-        self, export_jobs: Mapping[_TimeRange, Sequence[_ExportJob]], time_column: str, join_batches: bool
-    ) -> Iterator[pl.DataFrame]:
-        # Kick off downloads
+        self,
+        export_jobs: Mapping[_TimeRange, Sequence[_ExportJob]],
+        time_column: str,
+        join_batches: bool,
+        skip_incomplete_slices: bool = False,
+        planners: Sequence[_JobPlanner] = (),
+    ) -> Iterator[tuple[_TimeRange, pl.DataFrame]]:
+        """Yield (time slice, DataFrame) pairs in time order; merged slices are yielded even when empty.
+
+        Jobs are started in time order whenever a worker frees up, regardless of which slice they belong to,
+        so one slow request only holds back its own slice. A slice is merged on a separate thread as soon as
+        all of its jobs finish. Jobs are only started for the `max_buffered_slices` slices following the last
+        one yielded, which bounds how much data is held when the consumer is slower than the downloads.
+
+        `planners` are run on up to `num_workers` separate threads while the jobs in `export_jobs` download, and
+        add jobs for the slices of `export_jobs`. No slice is finished until every planner has run.
+        """
+        slices = [_SliceDownload(time_slice, [], 0) for time_slice in sorted(export_jobs.keys())]
+        slice_indices = {download.time_slice: slice_idx for slice_idx, download in enumerate(slices)}
+        pending: collections.deque[tuple[int, int, _ExportJob]] = collections.deque()
+        in_flight: dict[concurrent.futures.Future[pl.DataFrame], tuple[int, int]] = {}
+        next_slice = 0
+
+        self._queue_jobs(export_jobs, slices, slice_indices, pending)
         with (
             LogTiming(f"Downloaded {len(export_jobs)} batches"),
             concurrent.futures.ThreadPoolExecutor(max_workers=self._num_workers) as pool,
+            concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="nominal-export-merge") as merger,
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(len(planners), self._num_workers)), thread_name_prefix="nominal-export-plan"
+            ) as planner,
         ):
-            futures: list[concurrent.futures.Future[pl.DataFrame]] = []
-
-            time_slices = sorted(export_jobs.keys())
-            for idx, time_slice in enumerate(time_slices):
-                logger.info(
-                    "Starting to download data for slice %s (%d / %d)",
-                    time_slice,
-                    idx + 1,
-                    len(time_slices),
-                )
-                with LogTiming(f"Downloaded data for slice {time_slice} ({idx + 1} / {len(time_slices)})"):
-                    # Start by downloading if this is the first batch
-                    if not futures:
-                        futures = [
-                            pool.submit(
-                                _export_job,
-                                task,
-                                self._client,
-                            )
-                            for task in export_jobs[time_slice]
-                        ]
-
-                    results: list[pl.DataFrame] = []
-                    for future_idx, future in enumerate(concurrent.futures.as_completed(futures)):
-                        ex = future.exception()
-                        if ex is not None:
-                            logger.error("Failed to extract batch", exc_info=ex)
-                            continue
-
-                        res = future.result()
-                        logger.info("Finished extracting batch %d/%d", future_idx + 1, len(futures))
-                        if join_batches:
-                            results.append(res)
-                        elif res.is_empty():
-                            continue
-                        else:
-                            yield res.rename({_INTERNAL_TS_COL: time_column})
-
-                    # Schedule next batch of downloads before starting merge
-                    if idx < len(time_slices) - 1:
-                        futures = [
-                            pool.submit(_export_job, task, self._client) for task in export_jobs[time_slices[idx + 1]]
-                        ]
-
-                if join_batches:
-                    with LogTiming(f"Merged {len(results)} exports"):
-                        logger.info("Merging dataframes")
-                        merged_df = _merge_dfs(results)
-                        if merged_df.is_empty():
-                            logger.warning("Dataframe empty after merging...")
-                        else:
-                            yield merged_df.rename({_INTERNAL_TS_COL: time_column})
+            planning: set[concurrent.futures.Future[Mapping[_TimeRange, Sequence[_ExportJob]]]] = {
+                planner.submit(plan) for plan in planners
+            }
+
+            def on_slice_downloaded(slice_idx: int) -> None:
+                download = slices[slice_idx]
+                if join_batches and not (download.failed and skip_incomplete_slices):
+                    results = [df for df in download.results if df is not None]
+                    download.merged = merger.submit(_merge_slice, results, time_column)
+
+            def on_planned(future: concurrent.futures.Future[Mapping[_TimeRange, Sequence[_ExportJob]]]) -> None:
+                planning.discard(future)
+                # planning failures are raised to the caller, as when planning up front
+                self._queue_jobs(future.result(), slices, slice_indices, pending)
+                if not planning:
+                    merge_downloaded_slices()
+
+            def merge_downloaded_slices() -> None:
+                for slice_idx, download in enumerate(slices):
+                    if not download.remaining:
+                        on_slice_downloaded(slice_idx)
+
+            def start_jobs() -> None:
+                while (
+                    pending
+                    and len(in_flight) < self._num_workers
+                    and pending[0][0] < next_slice + self._max_buffered_slices
+                ):
+                    slice_idx, job_idx, job = pending.popleft()
+                    in_flight[pool.submit(self._run_export_job, job)] = (slice_idx, job_idx)
+
+            if not planning:
+                merge_downloaded_slices()
+            start_jobs()
+
+            while next_slice < len(slices):
+                download = slices[next_slice]
+                if not planning and not download.remaining and (download.merged is None or download.merged.done()):
+                    logger.info(
+                        "Downloaded data for slice %s (%d / %d)", download.time_slice, next_slice + 1, len(slices)
+                    )
+                    yield from self._finished_slice(download, time_column, join_batches)
+                    # release the slice's data before moving on
+                    download.results, download.merged = [], None
+                    next_slice += 1
+                    start_jobs()
+                    continue
+
+                waitables: set[concurrent.futures.Future[Any]] = {*in_flight, *planning}
+                if download.merged is not None:
+                    waitables.add(download.merged)
+                done, _ = concurrent.futures.wait(waitables, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in planning:
+                        on_planned(future)
+                    elif future in in_flight:
+                        slice_idx, job_idx = in_flight.pop(future)
+                        self._record_result(slices[slice_idx], job_idx, future)
+                        if not slices[slice_idx].remaining and not planning:
+                            on_slice_downloaded(slice_idx)
+                start_jobs()
+
+    @staticmethod
+    def _queue_jobs(
+        jobs_by_slice: Mapping[_TimeRange, Sequence[_ExportJob]],
+        slices: Sequence[_SliceDownload],
+        slice_indices: Mapping[_TimeRange, int],
+        pending: collections.deque[tuple[int, int, _ExportJob]],
+    ) -> None:
+        for time_slice, jobs in jobs_by_slice.items():
+            slice_idx = slice_indices[time_slice]
+            download = slices[slice_idx]
+            for job in jobs:
+                pending.append((slice_idx, len(download.results), job))
+                download.results.append(None)
+                download.remaining += 1
+        # keep pending jobs in time order; the sort is stable, so each slice's jobs keep their order
+        ordered = sorted(pending, key=lambda item: item[0])
+        pending.clear()
+        pending.extend(ordered)
+
+    @staticmethod
+    def _record_result(download: _SliceDownload, job_idx: int, future: concurrent.futures.Future[pl.DataFrame]) -> None:
+        download.remaining -= 1
+        ex = future.exception()
+        if ex is not None:
+            logger.error("Failed to extract batch", exc_info=ex)
+            download.failed += 1
+        else:
+            download.results[job_idx] = future.result()
+
+    def _run_export_job(self, job: _ExportJob) -> pl.DataFrame:
+        if (
+            self._cache is None
+            or job.buckets is not None
+            or job.resolution is not None
+            or not self._cache.is_cacheable(job.time_slice.end_time)
+        ):
+            return _export_job(job, self._client)
+
+        def fetch(start: IntegralNanosecondsUTC, end: IntegralNanosecondsUTC) -> pl.DataFrame:
+            return _export_job(dataclasses.replace(job, time_slice=_TimeRange(start, end)), self._client)
+
+        try:
+            frames = self._cache.load(
+                datasource_rid=job.datasource_rid,
+                channel_names=job.channel_names,
+                tags=job.tags,
+                options=f"{_to_typed_timestamp_type(job.timestamp_type)!r}/{job.template.file_format}",
+                start=job.time_slice.start_time,
+                end=job.time_slice.end_time,
+                time_column=_INTERNAL_TS_COL,
+                fetch=fetch,
+            )
+        except OSError:
+            logger.warning("Failed to use export cache, exporting %s directly", job.time_slice, exc_info=True)
+            return _export_job(job, self._client)
+
+        df = _merge_dfs(frames)
+        if df.is_empty():
+            df = pl.DataFrame({_INTERNAL_TS_COL: []})
+        df = _with_missing_channels(df, job.channel_names, _channel_schema(job))
+        return df.select(_INTERNAL_TS_COL, *[name for name in job.channel_names if name in df.columns])
+
+    @staticmethod
+    def _finished_slice(
+        download: _SliceDownload, time_column: str, join_batches: bool
+    ) -> Iterator[tuple[_TimeRange, pl.DataFrame]]:
+        if not join_batches:
+            for df in download.results:
+                if df is not None and not df.is_empty():
+                    yield download.time_slice, df.rename({_INTERNAL_TS_COL: time_column})
+        elif download.merged is None:
+            logger.error(
+                "Skipping slice %s: %d / %d exports failed",
+                download.time_slice,
+                download.failed,
+                len(download.results),
+            )
+        else:
+            yield download.time_slice, download.merged.result()
@@ -0,0 +1,62 @@
+from typing import Mapping
+
+import polars as pl
+from nominal.core.channel import Channel
+from nominal.ts import _InferrableTimestampType
+
+# Arrow's map<string, string> layout, which polars has no dedicated type for
+_ARGS_DTYPE = pl.List(pl.Struct({"key": pl.String, "value": pl.String}))
+
+
+def search_logs_to_dataframe(
+    channel: Channel,
+    *,
+    regex_match: str | None = None,
+    insensitive_match: str | None = None,
+    tags: Mapping[str, str] | None = None,
+    start: _InferrableTimestampType | None = None,
+    end: _InferrableTimestampType | None = None,
+    parallelism: int = 1,
+) -> pl.DataFrame:
+    """Search a log channel like `Channel.search_logs`, returning the matching logs as a single DataFrame.
+
+    Pages are converted straight into columns, without building a `LogPoint` per log.
+
+    Args:
+        channel: Log channel to search.
+        regex_match: If provided, a regex match to filter potential log messages by.
+            NOTE: must not be present with `insensitive_match`
+        insensitive_match: If provided, a case insensitive string that returned logs match exactly.
+            NOTE: must not be present with `regex_match`
+        tags: Tags to filter logs from the channel with.
+        start: Timestamp to start searching from. If not present, searches starting from unix epoch.
+        end: Timestamp to search until. If not present, searches until end of time.
+        parallelism: Number of sub-ranges of `[start, end)` to search concurrently. Values above 1
+            require both `start` and `end`.
+
+    Returns:
+        A DataFrame sorted by time with columns `timestamp` (UTC nanosecond datetimes), `message`, and
+        `args` (a list of key/value structs per log).
+    """
+    timestamps: list[int] = []
+    messages: list[str] = []
+    args: list[list[dict[str, str]]] = []
+    for page_timestamps, values in channel._search_log_pages(
+        regex_match=regex_match,
+        insensitive_match=insensitive_match,
+        tags=tags,
+        start=start,
+        end=end,
+        parallelism=parallelism,
+    ):
+        timestamps.extend(page_timestamps)
+        messages.extend(value.message for value in values)
+        args.extend([{"key": k, "value": v} for k, v in value.args.items()] for value in values)
+
+    return pl.DataFrame(
+        {
+            "timestamp": pl.Series(timestamps, dtype=pl.Int64).cast(pl.Datetime("ns", "UTC")),
+            "message": pl.Series(messages, dtype=pl.String),
+            "args": pl.Series(args, dtype=_ARGS_DTYPE),
+        }
+    )
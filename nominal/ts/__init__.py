@@ -198,10 +198,11 @@ from __future__ import annotations
 
 import abc
 import logging
+import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from types import MappingProxyType
-from typing import Literal, Mapping, NamedTuple, TypeAlias, cast, get_args
+from typing import TYPE_CHECKING, Iterable, Literal, Mapping, NamedTuple, TypeAlias, cast, get_args
 
 import dateutil.parser
 from google.protobuf import timestamp_pb2
@@ -211,6 +212,12 @@ from typing_extensions import Self, assert_never
 from nominal.protos.types import common_pb2
 from nominal.protos.types.time import time_pb2, timestamp_parsers_pb2
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+    import pandas as pd
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -681,12 +688,22 @@ class _SecondsNanos(NamedTuple):
         if isinstance(ts, int):
             return cls.from_nanoseconds(ts)
         if isinstance(ts, str):
-            # TODO(drake-nominal): by involving dateutil, this chops off any nano level precision provided
-            #                      in the timestamp. Update to not lose precision when converting to absolute
-            #                      nanos.
-            ts = dateutil.parser.parse(ts)
+            return cls.from_string(ts)
         return cls.from_datetime(ts)
 
+    @classmethod
+    def from_string(cls, ts: str) -> Self:
+        # dateutil only parses down to microseconds, so the fractional seconds are parsed separately
+        fraction = _FRACTIONAL_SECONDS.search(ts)
+        if fraction is None:
+            return cls.from_datetime(dateutil.parser.parse(ts))
+        seconds, _ = cls.from_datetime(dateutil.parser.parse(ts[: fraction.start()] + ts[fraction.end() :]))
+        return cls(seconds, int(fraction.group(1)[:9].ljust(9, "0")))
+
+
+_FRACTIONAL_SECONDS = re.compile(r"(?<=\d:\d\d)[.,](\d+)")
+"""Fractional seconds following the seconds of a time of day, e.g. '.123456789' in '19:00:00.123456789Z'."""
+
 
 _MIN_TIMESTAMP = _SecondsNanos(seconds=0, nanos=0)
 _MAX_TIMESTAMP = _SecondsNanos(seconds=9223372036, nanos=854775807)
@@ -696,6 +713,150 @@ The backend converts to long nanoseconds, and the maximum long (int64) value is
 """
 
 
+_NANOSECONDS_PER_UNIT: Mapping[_LiteralTimeUnit, tuple[int, int]] = MappingProxyType(
+    {
+        "picoseconds": (1, 1_000),
+        "nanoseconds": (1, 1),
+        "microseconds": (1_000, 1),
+        "milliseconds": (1_000_000, 1),
+        "seconds": (1_000_000_000, 1),
+        "minutes": (60_000_000_000, 1),
+        "hours": (3_600_000_000_000, 1),
+        "days": (86_400_000_000_000, 1),
+    }
+)
+"""Nanoseconds in each time unit, as a (numerator, denominator) pair to keep picoseconds integral."""
+
+
+def _to_nanoseconds_array(
+    values: Iterable[_InferrableTimestampType] | np.ndarray | pd.Series | pd.Index | pl.Series,
+    timestamp_type: _AnyExportableTimestampType | None = None,
+) -> npt.NDArray[np.int64]:
+    """Convert a column of timestamps to nanoseconds since the unix epoch, UTC, in bulk.
+
+    Gives the same result as `_SecondsNanos.from_flexible(value).to_nanoseconds()` for each value, without
+    losing sub-microsecond precision, but converts ISO 8601 strings with a time zone, datetime columns, and
+    numeric columns in a single vectorized pass. Strings in any other format fall back to `dateutil`, value by
+    value. Naive datetimes in numpy, pandas, or polars columns are taken to be in UTC.
+
+    Args:
+        values: Timestamps as a numpy array, pandas Series or Index, polars Series, or any iterable of
+            strings, datetimes, and integral nanoseconds.
+        timestamp_type: How to interpret numeric timestamps. Integers default to nanoseconds since the epoch,
+            while floating point timestamps require an epoch or relative timestamp type.
+
+    Returns:
+        An int64 array of nanoseconds since the unix epoch, UTC, with one entry per value.
+
+    Raises:
+        ValueError: If any timestamp is missing or can't be parsed, or `timestamp_type` doesn't fit the values.
+    """
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy(dtype="datetime64[ns]") if values.dtype.kind == "M" else values.to_numpy()
+    elif isinstance(values, pl.Series):
+        if values.dtype == pl.String:
+            return _iso8601_to_nanoseconds_array(values, timestamp_type)
+        elif values.dtype.is_temporal():
+            values = values.cast(pl.Datetime("ns")) if values.dtype == pl.Date else values
+            return _checked_nanoseconds(values.dt.epoch("ns"))
+        values = values.to_numpy()
+    elif not isinstance(values, np.ndarray):
+        values = np.array(list(values), dtype=object)
+
+    if values.dtype.kind == "O":
+        return _objects_to_nanoseconds_array(values.tolist(), timestamp_type)
+    elif values.dtype.kind in "UST":
+        return _iso8601_to_nanoseconds_array(pl.Series(values.astype(str), dtype=pl.String), timestamp_type)
+    elif values.dtype.kind == "M":
+        if np.isnat(values).any():
+            raise ValueError("Timestamps must not be missing")
+        return values.astype("datetime64[ns]").view(np.int64)
+    elif values.dtype.kind in "iufb":
+        return _numeric_to_nanoseconds_array(values, timestamp_type)
+    raise ValueError(f"Cannot convert timestamps of dtype {values.dtype} to nanoseconds")
+
+
+def _objects_to_nanoseconds_array(
+    items: list[object], timestamp_type: _AnyExportableTimestampType | None
+) -> npt.NDArray[np.int64]:
+    import numpy as np
+    import polars as pl
+
+    if all(isinstance(item, str) for item in items):
+        return _iso8601_to_nanoseconds_array(pl.Series(items, dtype=pl.String), timestamp_type)
+    elif all(isinstance(item, (int, float)) for item in items):
+        return _numeric_to_nanoseconds_array(np.array(items), timestamp_type)
+    # e.g. python datetimes, of which naive ones are taken to be in local time
+    return np.array(
+        [_SecondsNanos.from_flexible(cast(_InferrableTimestampType, item)).to_nanoseconds() for item in items],
+        dtype=np.int64,
+    )
+
+
+def _iso8601_to_nanoseconds_array(
+    strings: pl.Series, timestamp_type: _AnyExportableTimestampType | None
+) -> npt.NDArray[np.int64]:
+    import numpy as np
+    import polars as pl
+
+    if timestamp_type is not None and not isinstance(_to_typed_timestamp_type(timestamp_type), Iso8601):
+        raise ValueError(f"String timestamps must be ISO 8601, not {timestamp_type}")
+    if strings.null_count():
+        raise ValueError("Timestamps must not be missing")
+
+    # Parses RFC 3339 timestamps, i.e. ISO 8601 with a time zone, with full nanosecond precision
+    parsed = strings.str.strptime(pl.Datetime("ns", "UTC"), format="%+", strict=False).dt.epoch("ns")
+    nanos = parsed.fill_null(0).to_numpy().astype(np.int64)
+    unparsed = np.flatnonzero(parsed.is_null().to_numpy())
+    if len(unparsed):
+        # e.g. timestamps without a time zone, which dateutil takes to be in local time
+        nanos[unparsed] = [_SecondsNanos.from_string(ts).to_nanoseconds() for ts in strings.gather(unparsed)]
+    return nanos
+
+
+def _numeric_to_nanoseconds_array(
+    values: np.ndarray, timestamp_type: _AnyExportableTimestampType | None
+) -> npt.NDArray[np.int64]:
+    import numpy as np
+
+    is_float = values.dtype.kind == "f"
+    if is_float and np.isnan(values).any():
+        raise ValueError("Timestamps must not be missing")
+
+    typed_type = None if timestamp_type is None else _to_typed_timestamp_type(timestamp_type)
+    if typed_type is None:
+        if is_float:
+            raise ValueError("Floating point timestamps require an epoch or relative timestamp type")
+        return values.astype(np.int64)
+    elif not isinstance(typed_type, (Epoch, Relative)):
+        raise ValueError(f"Numeric timestamps require an epoch or relative timestamp type, not {timestamp_type}")
+
+    numerator, denominator = _NANOSECONDS_PER_UNIT[typed_type.unit]
+    if is_float:
+        # Scale whole and fractional units separately, so that large values keep their integral precision
+        whole = np.floor(values)
+        fraction = np.round((values - whole) * numerator / denominator).astype(np.int64)
+        nanos = whole.astype(np.int64) * numerator // denominator + fraction
+    else:
+        nanos = values.astype(np.int64) * numerator // denominator
+
+    if isinstance(typed_type, Relative):
+        nanos += _SecondsNanos.from_flexible(typed_type.start).to_nanoseconds()
+    return cast("npt.NDArray[np.int64]", nanos)
+
+
+def _checked_nanoseconds(nanos: pl.Series) -> npt.NDArray[np.int64]:
+    import numpy as np
+
+    if nanos.null_count():
+        raise ValueError("Timestamps must not be missing")
+    return nanos.to_numpy().astype(np.int64)
+
+
 _ONE_MICROSECOND = timedelta(microseconds=1)
 """timedelta's resolution, used to convert one losslessly to an integer without re-allocating it per call."""
 
@@ -3,21 +3,41 @@ from __future__ import annotations
 import functools
 import logging
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence, Tuple
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 from nptdms import TdmsChannel, TdmsFile, TdmsGroup
 
 from nominal import ts
+from nominal._utils import pipe_from_writer, write_gzip_members
 from nominal.core._types import PathLike
 from nominal.core.client import NominalClient
 from nominal.core.dataset import Dataset
 from nominal.core.dataset_file import DatasetFile
+from nominal.core.filetype import FileTypes
 from nominal.thirdparty.pandas import upload_dataframe, upload_dataframe_to_dataset
 
 logger = logging.getLogger(__name__)
 
+_WAVEFORM_TIMESTAMP_COLUMN = "__nominal_ts__"
+
+
+def _resolve_timestamp_column(
+    tdms_path: Path,
+    timestamp_column: str | None,
+    timestamp_type: ts._AnyTimestampType | None,
+) -> Tuple[str, ts._AnyTimestampType, bool]:
+    """Returns tuple of timestamp column, timestamp type, and whether timestamps come from waveform properties"""
+    if timestamp_column is None and timestamp_type is None:
+        return _WAVEFORM_TIMESTAMP_COLUMN, ts.EPOCH_NANOSECONDS, True
+    elif timestamp_column is None or timestamp_type is None:
+        raise ValueError(
+            f"Cannot upload tdms {tdms_path}-- either both, or neither, of "
+            "`timestamp_column` and `timestamp_type` must be provided"
+        )
+    return timestamp_column, timestamp_type, False
+
 
 def _tdms_to_dataframe(
     file: PathLike,
@@ -26,16 +46,9 @@ def _tdms_to_dataframe(
 ) -> Tuple[str, ts._AnyTimestampType, pd.DataFrame]:
     """Returns tuple of timestamp column, timestamp type, and dataframe"""
     tdms_path = Path(file)
-
-    use_waveform = timestamp_column is None and timestamp_type is None
-    if use_waveform:
-        timestamp_column = "__nominal_ts__"
-        timestamp_type = ts.EPOCH_NANOSECONDS
-    elif timestamp_column is None or timestamp_type is None:
-        raise ValueError(
-            f"Cannot upload tdms {tdms_path}-- either both, or neither, of "
-            "`timestamp_column` and `timestamp_type` must be provided"
-        )
+    timestamp_column, timestamp_type, use_waveform = _resolve_timestamp_column(
+        tdms_path, timestamp_column, timestamp_type
+    )
 
     if use_waveform:
         df = _tdms_with_waveform_props_to_pandas(tdms_path, timestamp_column)
@@ -55,6 +68,7 @@ def upload_tdms_to_dataset(
     file_name: str | None = None,
     tag_columns: Mapping[str, str] | None = None,
     tags: Mapping[str, str] | None = None,
+    chunk_size: int | None = None,
 ) -> DatasetFile:
     """Process and upload a tdms file to an existing dataset as if it were a gzipped-CSV file
 
@@ -72,11 +86,34 @@ def upload_tdms_to_dataset(
             If not provided, defaults to using the dataset's name
         tag_columns: Mapping of column names => tag keys to use for their respective rows.
         tags: Mapping of key-value pairs to apply uniformly as tags to all data within the dataframe.
+        chunk_size: If provided, stream the file into the upload in blocks of at most this many rows per group
+            (or per waveform), rather than loading the entire file into memory first. Memory usage then depends
+            on `chunk_size` and the size of the file's raw data chunks, rather than the size of the file.
+            Rows from different groups (or waveforms) are uploaded separately rather than joined on their
+            timestamps, which the ingested data does not depend on.
 
     Channels will be named as f"{group_name}.{channel_name}", with spaces replaced with underscores.
 
     NOTE: `timestamp_column` and `timestamp_type` must both be provided or excluded together.
     """
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        tdms_path = Path(file)
+        timestamp_column, timestamp_type, use_waveform = _resolve_timestamp_column(
+            tdms_path, timestamp_column, timestamp_type
+        )
+        return _upload_blocks_to_dataset(
+            dataset,
+            _iter_tdms_blocks(tdms_path, timestamp_column, use_waveform, chunk_size),
+            timestamp_column=timestamp_column,
+            timestamp_type=timestamp_type,
+            wait_until_complete=wait_until_complete,
+            file_name=file_name,
+            tag_columns=tag_columns,
+            tags=tags,
+        )
+
     timestamp_column, timestamp_type, df = _tdms_to_dataframe(file, timestamp_column, timestamp_type)
     return upload_dataframe_to_dataset(
         dataset,
@@ -104,6 +141,7 @@ def upload_tdms(
     properties: Mapping[str, str] | None = None,
     tag_columns: Mapping[str, str] | None = None,
     tags: Mapping[str, str] | None = None,
+    chunk_size: int | None = None,
 ) -> Dataset:
     """Create a dataset in the Nominal platform from a tdms file.
 
@@ -113,6 +151,29 @@ def upload_tdms(
     if name is None:
         name = Path(file).name
 
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        dataset = client.create_dataset(
+            name=name,
+            description=description,
+            labels=labels,
+            properties=properties,
+            prefix_tree_delimiter=channel_name_delimiter,
+        )
+        upload_tdms_to_dataset(
+            dataset,
+            file,
+            timestamp_column=timestamp_column,
+            timestamp_type=timestamp_type,
+            wait_until_complete=wait_until_complete,
+            file_name=name,
+            tag_columns=tag_columns,
+            tags=tags,
+            chunk_size=chunk_size,
+        )
+        return dataset
+
     timestamp_column, timestamp_type, df = _tdms_to_dataframe(file, timestamp_column, timestamp_type)
     return upload_dataframe(
         client,
@@ -144,16 +205,26 @@ def _tdms_with_time_column_to_pandas(path: Path, timestamp_column: str) -> pd.Da
             group_dfs.append(group_df)
 
     # format for nominal upload
-    df = functools.reduce(
-        lambda left, right: pd.merge(left, right, left_index=True, right_index=True, how="outer"),
-        group_dfs,
-    )
+    df = _merge_group_dataframes(group_dfs)
     df.index = df.index.set_names(timestamp_column, level=None)
     df = df.reset_index()
 
     return df
 
 
+def _merge_group_dataframes(group_dfs: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Outer-join groups' dataframes on their timestamp indexes"""
+    if all(group_df.index.is_unique for group_df in group_dfs):
+        # Align every group to the union of their timestamps at once, rather than re-joining a growing frame per group
+        return pd.concat(group_dfs, axis=1, join="outer", sort=True)
+
+    # Repeated timestamps within a group are paired up between groups as in a SQL join, which requires merging
+    return functools.reduce(
+        lambda left, right: pd.merge(left, right, left_index=True, right_index=True, how="outer"),
+        group_dfs,
+    )
+
+
 def _tdms_with_waveform_props_to_pandas(path: Path, timestamp_column: str) -> pd.DataFrame:
     channels_to_export: dict[str, pd.Series[Any]] = {}
     with TdmsFile.open(path) as tdms_file:
@@ -175,6 +246,112 @@ def _tdms_with_waveform_props_to_pandas(path: Path, timestamp_column: str) -> pd
     return df
 
 
+def _upload_blocks_to_dataset(
+    dataset: Dataset,
+    blocks: Iterator[pd.DataFrame],
+    timestamp_column: str,
+    timestamp_type: ts._AnyTimestampType,
+    *,
+    wait_until_complete: bool,
+    file_name: str | None,
+    tag_columns: Mapping[str, str] | None,
+    tags: Mapping[str, str] | None,
+) -> DatasetFile:
+    """Upload dataframes sharing the same columns to a dataset as a single gzipped-CSV file, one at a time"""
+
+    def write(w: BinaryIO) -> None:
+        write_gzip_members((block.to_csv(header=idx == 0, index=False).encode() for idx, block in enumerate(blocks)), w)
+
+    # Write the blocks to .csv.gz as they are read in a background thread while uploading them; a failure to read
+    # or write fails the upload, so no incomplete file is ingested
+    with pipe_from_writer(write) as reader:
+        dataset_file = dataset.add_from_io(
+            reader,
+            timestamp_column=timestamp_column,
+            timestamp_type=timestamp_type,
+            file_type=FileTypes.CSV_GZ,
+            file_name=file_name,
+            tag_columns=tag_columns,
+            tags=tags,
+        )
+
+    if wait_until_complete:
+        dataset_file.poll_until_ingestion_completed()
+
+    return dataset_file
+
+
+def _iter_tdms_blocks(path: Path, timestamp_column: str, use_waveform: bool, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yield dataframes of at most `chunk_size` rows, each with the timestamp column and every exported channel"""
+    with TdmsFile.open(path) as tdms_file:
+        if use_waveform:
+            yield from _iter_waveform_blocks(tdms_file, timestamp_column, chunk_size)
+        else:
+            yield from _iter_time_column_blocks(tdms_file, timestamp_column, chunk_size)
+
+
+def _iter_time_column_blocks(tdms_file: TdmsFile, timestamp_column: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    group_channels: list[tuple[TdmsGroup, TdmsChannel, list[TdmsChannel]]] = [
+        (group, time_channel, list(_get_export_channels(group.channels(), time_channel, timestamp_column)))
+        for group, time_channel in _get_groups_with_time_channel(tdms_file.groups(), timestamp_column)
+    ]
+    columns = [timestamp_column] + [
+        _create_channel_name(group, channel) for group, _, channels in group_channels for channel in channels
+    ]
+
+    for group, time_channel, channels in group_channels:
+        names = [_create_channel_name(group, channel) for channel in channels]
+        blocks = zip(*(_iter_channel_blocks(channel, chunk_size) for channel in [time_channel, *channels]))
+        for timestamps, *channel_data in blocks:
+            yield pd.DataFrame({timestamp_column: timestamps, **dict(zip(names, channel_data))}, columns=columns)
+
+
+def _iter_waveform_blocks(tdms_file: TdmsFile, timestamp_column: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    # Channels sharing a time track are uploaded in the same rows
+    time_tracks: dict[tuple[int, float, float, int], list[tuple[str, TdmsChannel]]] = {}
+    for group in tdms_file.groups():
+        for channel in _filter_waveform_channels(group.channels()):
+            start_time = channel.properties["wf_start_time"]
+            if not isinstance(start_time, np.datetime64):
+                start_time = start_time.as_datetime64("ns")
+            time_track = (
+                int(start_time.astype("datetime64[ns]").astype(np.int64)),
+                channel.properties["wf_start_offset"],
+                channel.properties["wf_increment"],
+                len(channel),
+            )
+            time_tracks.setdefault(time_track, []).append((_create_channel_name(group, channel), channel))
+    columns = [timestamp_column] + [name for channels in time_tracks.values() for name, _ in channels]
+
+    for (start_time_ns, start_offset, increment, _), channels in time_tracks.items():
+        names = [name for name, _ in channels]
+        row = 0
+        for channel_data in zip(*(_iter_channel_blocks(channel, chunk_size) for _, channel in channels)):
+            relative_time = start_offset + np.arange(row, row + len(channel_data[0])) * increment
+            timestamps = start_time_ns + (relative_time * 1e9).astype(np.int64)
+            row += len(timestamps)
+            yield pd.DataFrame({timestamp_column: timestamps, **dict(zip(names, channel_data))}, columns=columns)
+
+
+def _iter_channel_blocks(channel: TdmsChannel, chunk_size: int) -> Iterator[np.ndarray[Any, Any]]:
+    """Stream a channel's data from disk, re-chunked into arrays of `chunk_size` values (but for the last)"""
+    pending: list[np.ndarray[Any, Any]] = []
+    pending_size = 0
+    for chunk in channel.data_chunks():
+        data = chunk[:]
+        while len(data) > 0:
+            taken = data[: chunk_size - pending_size]
+            data = data[len(taken) :]
+            pending.append(taken)
+            pending_size += len(taken)
+            if pending_size == chunk_size:
+                yield np.concatenate(pending)
+                pending = []
+                pending_size = 0
+    if pending:
+        yield np.concatenate(pending)
+
+
 def _filter_waveform_channels(channels: Iterable[TdmsChannel]) -> Iterable[TdmsChannel]:
     """Skip channels that do not have the required waveform properties to construct a time track"""
     for channel in channels:
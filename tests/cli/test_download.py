@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import pathlib
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import polars as pl
+import pytest
+from rich.console import Console
+
+from nominal.cli.download import (
+    CsvDownloader,
+    DataDownloader,
+    ParquetDownloader,
+    _CompletedSlice,
+    _DownloadManifest,
+)
+
+
+def _manifest(**kwargs: object) -> _DownloadManifest:
+    fields: dict[str, object] = dict(
+        dataset_rid="ri.catalog.dataset.abc",
+        channel_names=["a", "b"],
+        tags={"vehicle": "alpha"},
+        start_ns=0,
+        end_ns=100,
+        file_format="parquet",
+    )
+    fields.update(kwargs)
+    return _DownloadManifest(**fields)  # type: ignore[arg-type]
+
+
+class FakeExporter:
+    """Splits each requested range into fixed-width slices, each holding one row per slice start."""
+
+    def __init__(self, slice_ns: int = 25, empty_starts: frozenset[int] = frozenset()) -> None:
+        """Record the ranges requested so tests can check what a resumed download re-exports."""
+        self.slice_ns = slice_ns
+        self.empty_starts = empty_starts
+        self.requested: list[tuple[int, int]] = []
+
+    def export_slices(
+        self, channels: object, start: int, end: int, tags: object
+    ) -> Iterator[tuple[int, int, pl.DataFrame]]:
+        self.requested.append((start, end))
+        for slice_start in range(start, end, self.slice_ns):
+            slice_end = min(slice_start + self.slice_ns, end)
+            if slice_start in self.empty_starts:
+                yield slice_start, slice_end, pl.DataFrame()
+            else:
+                yield slice_start, slice_end, pl.DataFrame({"timestamp": [float(slice_start)], "a": [1.0]})
+
+
+def _download(
+    downloader: DataDownloader, exporter: FakeExporter, manifest: _DownloadManifest, tmp_path: pathlib.Path
+) -> pathlib.Path:
+    manifest_path = tmp_path / "manifest.json"
+    downloader._download_slices(
+        exporter,  # type: ignore[arg-type]
+        [],
+        {},
+        manifest,
+        manifest_path,
+        tmp_path,
+        "abc",
+        writer_threads=2,
+    )
+    return manifest_path
+
+
+def test_remaining_ranges_skips_completed_slices() -> None:
+    manifest = _manifest(completed=[_CompletedSlice(25, 50, 1), _CompletedSlice(0, 25, 0), _CompletedSlice(75, 90, 2)])
+    assert manifest.remaining_ranges() == [(50, 75), (90, 100)]
+    assert manifest.part_indices() == [0, 1, 2]
+    assert _manifest().remaining_ranges() == [(0, 100)]
+
+
+def test_manifest_round_trips(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "manifest.json"
+    manifest = _manifest(completed=[_CompletedSlice(0, 25, 0), _CompletedSlice(25, 50, None)])
+    manifest.save(path)
+    assert _DownloadManifest.load(path) == manifest
+    assert _DownloadManifest.load(tmp_path / "missing.json") is None
+
+    path.write_text("{not json")
+    assert _DownloadManifest.load(path) is None
+
+
+def test_same_download_ignores_progress() -> None:
+    assert _manifest(completed=[_CompletedSlice(0, 25, 0)]).is_same_download(_manifest())
+    assert not _manifest(channel_names=["a"]).is_same_download(_manifest())
+    assert not _manifest(end_ns=200).is_same_download(_manifest())
+
+
+def test_download_records_every_slice(tmp_path: pathlib.Path) -> None:
+    downloader = CsvDownloader(MagicMock(), Console())
+    manifest = _manifest(file_format="csv")
+    manifest_path = _download(downloader, FakeExporter(empty_starts=frozenset([50])), manifest, tmp_path)
+
+    assert manifest.remaining_ranges() == []
+    assert _DownloadManifest.load(manifest_path) == manifest
+    assert sorted(p.name for p in tmp_path.glob("abc-part_*.csv")) == [
+        "abc-part_0.csv",
+        "abc-part_1.csv",
+        "abc-part_2.csv",
+    ]
+    # empty slices are recorded without writing a part
+    assert _CompletedSlice(50, 75, None) in manifest.completed
+
+
+def test_failed_write_leaves_slice_for_resume(tmp_path: pathlib.Path) -> None:
+    downloader = CsvDownloader(MagicMock(), Console())
+    write = downloader.write_dataframe
+
+    def flaky_write(df: pl.DataFrame, part_idx: int, directory: pathlib.Path, prefix: str) -> pathlib.Path:
+        if part_idx == 1:
+            raise OSError("disk full")
+        return write(df, part_idx, directory, prefix)
+
+    downloader.write_dataframe = flaky_write  # type: ignore[method-assign]
+    manifest = _manifest(file_format="csv")
+    _download(downloader, FakeExporter(), manifest, tmp_path)
+    assert manifest.remaining_ranges() == [(25, 50)]
+
+    # resuming only re-exports the missing range, into a new part index
+    downloader.write_dataframe = write  # type: ignore[method-assign]
+    exporter = FakeExporter()
+    _download(downloader, exporter, manifest, tmp_path)
+    assert exporter.requested == [(25, 50)]
+    assert manifest.remaining_ranges() == []
+    assert _CompletedSlice(25, 50, 4) in manifest.completed
+
+
+def test_interrupted_download_keeps_finished_parts(tmp_path: pathlib.Path) -> None:
+    class InterruptingExporter(FakeExporter):
+        def export_slices(
+            self, channels: object, start: int, end: int, tags: object
+        ) -> Iterator[tuple[int, int, pl.DataFrame]]:
+            for i, item in enumerate(super().export_slices(channels, start, end, tags)):
+                if i == 2:
+                    raise KeyboardInterrupt
+                yield item
+
+    manifest = _manifest()
+    with pytest.raises(KeyboardInterrupt):
+        _download(ParquetDownloader(MagicMock(), Console()), InterruptingExporter(), manifest, tmp_path)
+    assert manifest.remaining_ranges() == [(50, 100)]
+
+
+def test_remove_stale_parts_keeps_recorded_files(tmp_path: pathlib.Path) -> None:
+    downloader = CsvDownloader(MagicMock(), Console())
+    for idx in range(3):
+        (tmp_path / f"abc-part_{idx}.csv").write_text("")
+    (tmp_path / "other-part_0.csv").write_text("")
+
+    manifest = _manifest(file_format="csv", completed=[_CompletedSlice(0, 25, 1)])
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("nominal.cli.download.Confirm.ask", lambda *args, **kwargs: True)
+        assert downloader._remove_stale_parts(manifest, tmp_path, "abc")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["abc-part_1.csv", "other-part_0.csv"]
+
+
+def test_single_file_download_assembles_parts_in_time_order(tmp_path: pathlib.Path) -> None:
+    downloader = ParquetDownloader(MagicMock(), Console(), single_file=True)
+    parts_dir = downloader.parts_directory(tmp_path, "abc")
+    parts_dir.mkdir()
+    # a later slice written first, and a slice missing a channel that had no data in it
+    downloader.write_dataframe(pl.DataFrame({"timestamp": [3.0], "a": [3.0], "b": ["z"]}), 0, parts_dir, "abc")
+    downloader.write_dataframe(pl.DataFrame({"timestamp": [1.0, 2.0], "a": [1.0, 2.0]}), 1, parts_dir, "abc")
+
+    downloader.finalize([1, 0], tmp_path, "abc")
+
+    assert not parts_dir.exists()
+    result = pl.read_parquet(tmp_path / "abc.parquet")
+    assert result.to_dict(as_series=False) == {
+        "timestamp": [1.0, 2.0, 3.0],
+        "a": [1.0, 2.0, 3.0],
+        "b": [None, None, "z"],
+    }
@@ -1,13 +1,38 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import grpc
 import pytest
 
+from nominal._utils import polling_tools
 from nominal.core.channel import Channel, ChannelDataType
 
 
+class FakeClock:
+    """Deterministic monotonic clock whose sleep advances time — no real sleeping in fake-time tests.
+
+    Pass the instance itself wherever a `clock` callable is injected, or `sleep` wherever a sleep is; tests may also
+    move time by setting `now` directly.
+    """
+
+    def __init__(self) -> None:
+        """Start at time zero with no sleeps recorded."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
 class _FakeRpcError(grpc.RpcError):
     """A grpc.RpcError with a controllable status code and details, for exercising gRPC error translation."""
 
@@ -70,3 +95,17 @@ def make_series_count_response():
 def fake_rpc_error():
     """Factory fixture for grpc.RpcError instances with a chosen status code (and optional details)."""
     return _FakeRpcError
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """A fresh deterministic clock for tests that drive time seams directly."""
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_polling_clock(monkeypatch: pytest.MonkeyPatch, fake_clock: FakeClock) -> FakeClock:
+    """`fake_clock`, installed as the clock `PollBackoff` waits on; jittered waits always take the shortest wait."""
+    monkeypatch.setattr(polling_tools, "time", SimpleNamespace(monotonic=fake_clock.monotonic, sleep=fake_clock.sleep))
+    monkeypatch.setattr(polling_tools, "random", SimpleNamespace(uniform=lambda low, high: low))
+    return fake_clock
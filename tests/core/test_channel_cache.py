@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from nominal_api import datasource_api, scout_run_api, timeseries_channelmetadata_api
+
+from nominal.core._utils.channel_cache import ChannelCacheStats, ChannelMetadataCache
+from tests.conftest import FakeClock
+
+
+def _metadata(name: str, rid: str = "ds-1", unit: str | None = None) -> timeseries_channelmetadata_api.ChannelMetadata:
+    return timeseries_channelmetadata_api.ChannelMetadata(
+        channel_identifier=timeseries_channelmetadata_api.ChannelIdentifier(channel_name=name, data_source_rid=rid),
+        unit=unit,
+    )
+
+
+def test_hits_and_misses_are_counted() -> None:
+    cache = ChannelMetadataCache()
+    cache.put_many([_metadata("a"), _metadata("b", rid="ds-2")])
+
+    found, missing = cache.get_many("ds-1", ["a", "b"])
+
+    assert list(found) == ["a"]
+    assert missing == ["b"]
+    assert cache.stats == ChannelCacheStats(hits=1, misses=1, evictions=0, size=2)
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = ChannelMetadataCache(ttl=timedelta(seconds=10), clock=clock)
+    cache.put_many([_metadata("a")])
+
+    clock.now = 9.0
+    assert cache.get_many("ds-1", ["a"])[1] == []
+    clock.now = 10.0
+    assert cache.get_many("ds-1", ["a"])[1] == ["a"]
+    assert cache.stats.size == 0
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = ChannelMetadataCache(max_size=2)
+    cache.put_many([_metadata("a"), _metadata("b")])
+    cache.get_many("ds-1", ["a"])
+    cache.put_many([_metadata("c")])
+
+    found, missing = cache.get_many("ds-1", ["a", "b", "c"])
+
+    assert sorted(found) == ["a", "c"]
+    assert missing == ["b"]
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate() -> None:
+    cache = ChannelMetadataCache()
+    cache.put_many([_metadata("a"), _metadata("b"), _metadata("a", rid="ds-2")])
+
+    cache.invalidate("ds-1", ["a"])
+    assert cache.get_many("ds-1", ["a", "b"])[1] == ["a"]
+    cache.invalidate("ds-1")
+    assert cache.get_many("ds-1", ["b"])[1] == ["b"]
+    assert cache.get_many("ds-2", ["a"])[1] == []
+
+
+def test_search_results_are_converted() -> None:
+    cache = ChannelMetadataCache()
+    cache.put_search_results(
+        [
+            datasource_api.ChannelMetadata(
+                data_source="ds-1", name="speed", description="fast", unit=scout_run_api.Unit(symbol="m/s")
+            )
+        ]
+    )
+
+    found, _ = cache.get_many("ds-1", ["speed"])
+
+    assert found["speed"] == timeseries_channelmetadata_api.ChannelMetadata(
+        channel_identifier=timeseries_channelmetadata_api.ChannelIdentifier(
+            channel_name="speed", data_source_rid="ds-1"
+        ),
+        description="fast",
+        unit="m/s",
+    )
+
+
+def test_zero_ttl_disables_caching() -> None:
+    cache = ChannelMetadataCache(ttl=timedelta(0))
+    cache.put_many([_metadata("a")])
+    assert cache.get_many("ds-1", ["a"])[1] == ["a"]
+    assert not cache.enabled
+
+
+def test_invalid_max_size() -> None:
+    with pytest.raises(ValueError):
+        ChannelMetadataCache(max_size=0)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from nominal_api import scout_compute_api
+
+from nominal.core.channel import Channel, ChannelDataType
+from nominal.ts import _SecondsNanos
+
+PAGE_SIZE = 2
+
+
+def _channel(data_type: ChannelDataType = ChannelDataType.LOG) -> tuple[Channel, list[tuple[int, int]]]:
+    """A log channel whose compute service serves logs at 0, 10, ..., 90ns (inclusive of both range ends)."""
+    logs = [(ts, f"log {ts}") for ts in range(0, 100, 10)]
+    requested: list[tuple[int, int]] = []
+
+    def compute(
+        auth_header: str, request: scout_compute_api.ComputeNodeRequest
+    ) -> scout_compute_api.ComputeNodeResponse:
+        start = _SecondsNanos.from_api(request.start).to_nanoseconds()
+        end = _SecondsNanos.from_api(request.end).to_nanoseconds()
+        page_info = request.node.series.summarization_strategy.page.page_info
+        offset = page_info.page_token or 0
+        if offset == 0:
+            requested.append((start, end))
+        in_range = [(ts, msg) for ts, msg in logs if start <= ts <= end]
+        page = in_range[offset : offset + PAGE_SIZE]
+        next_offset = offset + PAGE_SIZE if offset + PAGE_SIZE < len(in_range) else None
+        return scout_compute_api.ComputeNodeResponse(
+            paged_log=scout_compute_api.PagedLogPlot(
+                timestamps=[_SecondsNanos.from_nanoseconds(ts).to_api() for ts, _ in page],
+                values=[scout_compute_api.LogValue(args={"ts": str(ts)}, id=str(ts), message=msg) for ts, msg in page],
+                next_page_token=next_offset,  # type: ignore[arg-type]
+            )
+        )
+
+    clients = MagicMock()
+    clients.compute.compute.side_effect = compute
+    channel = Channel(
+        name="logs",
+        data_source="ri.datasource.abc",
+        unit=None,
+        description=None,
+        data_type=data_type,
+        _clients=clients,
+    )
+    return channel, requested
+
+
+def test_search_logs_serial() -> None:
+    channel, requested = _channel()
+    logs = list(channel.search_logs(start=0, end=90))
+
+    assert [log.timestamp for log in logs] == list(range(0, 100, 10))
+    assert logs[3].message == "log 30"
+    assert logs[3].args == {"ts": "30"}
+    assert requested == [(0, 90)]
+
+
+def test_search_logs_parallel_is_ordered_without_boundary_duplicates() -> None:
+    channel, requested = _channel()
+    logs = list(channel.search_logs(start=0, end=90, parallelism=3))
+
+    # sub-range ends such as 30 and 60 are served by both neighbouring requests but yielded once
+    assert [log.timestamp for log in logs] == list(range(0, 100, 10))
+    assert len(requested) == 12
+    assert requested[0][0] == 0
+    assert max(end for _, end in requested) == 90
+
+
+def test_search_logs_parallel_requires_bounds() -> None:
+    channel, _ = _channel()
+    with pytest.raises(ValueError):
+        list(channel.search_logs(start=0, parallelism=2))
+    with pytest.raises(ValueError):
+        list(channel.search_logs(start=0, end=90, parallelism=0))
+
+
+def test_search_logs_rejects_non_log_channel() -> None:
+    channel, _ = _channel(ChannelDataType.DOUBLE)
+    with pytest.raises(TypeError):
+        list(channel.search_logs())
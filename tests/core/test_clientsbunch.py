@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import fields
+from datetime import timedelta
 from typing import cast
 from unittest.mock import MagicMock
 
@@ -271,6 +272,28 @@ def test_from_config_wires_grpc_services_through_one_shared_channel(monkeypatch)
     assert create_grpc_channel.call_args.kwargs["header_provider"] is None
 
 
+def test_from_config_configures_channel_metadata_cache(monkeypatch):
+    """from_config builds the channel metadata cache with the requested TTL and size; a zero TTL disables it."""
+    monkeypatch.setattr("nominal.core._clientsbunch.create_conjure_client_factory", _fake_create_conjure_client_factory)
+    monkeypatch.setattr("nominal.core._clientsbunch.create_grpc_channel", MagicMock(return_value=MagicMock()))
+
+    def build(**kwargs):
+        return ClientsBunch.from_config(
+            ServiceConfiguration(uris=["https://api.nominal.test"]),
+            "https://api.nominal.test",
+            "test-agent",
+            "token",
+            None,
+            **kwargs,
+        )
+
+    cache = build(channel_cache_ttl=timedelta(minutes=5), channel_cache_max_size=10).channel_metadata_cache
+    assert cache.enabled
+    assert cache.ttl == timedelta(minutes=5)
+    assert cache.max_size == 10
+    assert not build(channel_cache_ttl=timedelta(0)).channel_metadata_cache.enabled
+
+
 def test_experimental_as_user_returns_derived_nominal_client(monkeypatch):
     """as_user returns a new client that injects the on-behalf-of header on both the HTTP and gRPC paths."""
     monkeypatch.setattr("nominal.core._clientsbunch.create_conjure_client_factory", _fake_create_conjure_client_factory)
@@ -12,10 +12,12 @@ from nominal.core.container_image import (
     FileOutputFormat,
     _get_container_image,
     _search_container_images,
+    poll_until_all_ready,
 )
 from nominal.core.exceptions import NominalContainerImageError
 from nominal.protos.registry.v2 import registry_pb2
 from nominal.protos.types.time import timestamp_parsers_pb2
+from tests.conftest import FakeClock
 
 
 def _clients() -> MagicMock:
@@ -142,6 +144,51 @@ def test_poll_until_ready_raises_when_image_failed() -> None:
         image.poll_until_ready(interval=timedelta(seconds=0))
 
 
+def _images_ready_after(clients: MagicMock, count: int) -> list[ContainerImage]:
+    """Images "ri.img.N" that become READY on their Nth refresh, recording the refreshes per image in `gets`."""
+    gets: dict[str, int] = {}
+
+    def get_image(request: registry_pb2.GetImageRequest) -> registry_pb2.GetImageResponse:
+        gets[request.rid] = gets.get(request.rid, 0) + 1
+        ready = gets[request.rid] >= int(request.rid.removeprefix("ri.img."))
+        status = registry_pb2.CONTAINER_IMAGE_STATUS_READY if ready else registry_pb2.CONTAINER_IMAGE_STATUS_PENDING
+        return registry_pb2.GetImageResponse(image=_img_with_status(request.rid, status))
+
+    clients.registry.GetImage.side_effect = get_image
+    clients.gets = gets
+    return [
+        ContainerImage._from_proto(
+            clients, "ri.ws", _img_with_status(f"ri.img.{idx}", registry_pb2.CONTAINER_IMAGE_STATUS_PENDING)
+        )
+        for idx in range(1, count + 1)
+    ]
+
+
+def test_poll_until_all_ready_refreshes_pending_images_together_with_backoff(fake_polling_clock: FakeClock) -> None:
+    clients = _clients()
+    images = _images_ready_after(clients, 20)
+
+    returned = poll_until_all_ready(images, interval=timedelta(seconds=2), max_interval=timedelta(seconds=8))
+
+    assert returned is images
+    assert all(image.status is ContainerImageStatus.READY for image in images)
+    # one poll per wait covers every pending image, and ready images are not refreshed again
+    assert clients.gets == {f"ri.img.{idx}": idx for idx in range(1, 21)}
+    # waits are jittered down to half of 2s, 4s, 8s, 8s, ...
+    assert fake_polling_clock.sleeps[:4] == [1, 2, 4, 4]
+    assert len(fake_polling_clock.sleeps) == 19
+
+
+def test_poll_until_all_ready_times_out(fake_polling_clock: FakeClock) -> None:
+    clients = _clients()
+
+    with pytest.raises(TimeoutError, match="1 of 4 container images"):
+        poll_until_all_ready(
+            _images_ready_after(clients, 4), interval=timedelta(seconds=4), timeout=timedelta(seconds=3)
+        )
+    assert fake_polling_clock.sleeps == [2, 1]
+
+
 def test_enum_from_proto_falls_back_to_unspecified_on_unknown_value() -> None:
     """A value a newer server might return (unknown to this SDK) decodes to UNSPECIFIED, not a crash."""
     assert FileOutputFormat._from_proto(999) is FileOutputFormat.UNSPECIFIED
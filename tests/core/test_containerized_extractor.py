@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import pathlib
 from unittest.mock import MagicMock
 
 import pytest
 
+from nominal.core import containerized_extractor
+from nominal.core._utils.upload_cache import UploadCache
 from nominal.core.container_image import FileOutputFormat
 from nominal.core.containerized_extractor import (
     ContainerizedExtractor,
     _create_containerized_extractor,
     _search_containerized_extractors,
 )
-from nominal.core.exceptions import NominalContainerImageError
+from nominal.core.exceptions import NominalAlreadyExistsError, NominalContainerImageError, NominalError
 from nominal.protos.ingest.v2 import containerized_extractor_pb2
 from nominal.protos.registry.v2 import registry_pb2
 
@@ -18,6 +21,7 @@ from nominal.protos.registry.v2 import registry_pb2
 def _clients() -> MagicMock:
     clients = MagicMock()
     clients.auth_header = "Bearer test-token"
+    clients.app_base_url = "https://app.gov.nominal.io"
     clients.resolve_default_workspace_rid.return_value = "ri.workspace.default"
     clients.resolve_workspace.return_value.rid = "ri.workspace.default"
     return clients
@@ -137,3 +141,102 @@ def test_set_active_image_polls_then_activates() -> None:
     assert clients.registry.GetImage.call_args_list[0].args[0].workspace_rid == "ri.workspace.default"
     update_request = clients.containerized_extractor.UpdateContainerizedExtractor.call_args.args[0]
     assert update_request.active_container_image_rid == "ri.img.1"
+
+
+def test_register_image_reuses_uploads_of_identical_tarballs(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With an upload cache, a tarball already uploaded to the workspace is registered from its existing object."""
+    uploaded: list[pathlib.Path] = []
+
+    def upload_multipart_file(
+        auth_header: str, workspace_rid: str, file: pathlib.Path, *_: object, **__: object
+    ) -> str:
+        uploaded.append(file)
+        return f"s3://bucket/{len(uploaded)}/{file.name}"
+
+    monkeypatch.setattr(containerized_extractor, "upload_multipart_file", upload_multipart_file)
+    clients = _clients()
+    clients.registry.CreateImage.return_value = registry_pb2.CreateImageResponse(
+        image=_img("ri.img.1", registry_pb2.CONTAINER_IMAGE_STATUS_READY)
+    )
+    image, same_image, other_image = tmp_path / "image.tar", tmp_path / "retagged.tar", tmp_path / "other.tar"
+    image.write_bytes(b"layers")
+    same_image.write_bytes(b"layers")
+    other_image.write_bytes(b"other layers")
+
+    def register(tarball: pathlib.Path, extractor: ContainerizedExtractor, cache: UploadCache | None) -> str:
+        extractor.register_image(
+            tarball,
+            tag="v1",
+            inputs=[],
+            default_timestamp_column="ts",
+            default_timestamp_type="iso_8601",
+            upload_cache=cache,
+        )
+        return clients.registry.CreateImage.call_args.args[0].object_path
+
+    extractor = ContainerizedExtractor._from_proto(clients, _ext("ri.ext"))
+    cache_path = tmp_path / "cache" / "uploads.json"
+    assert register(image, extractor, UploadCache(cache_path)) == "s3://bucket/1/image.tar"
+    # the cache persists across instances and extractors, and is keyed by content rather than file name
+    other_extractor = ContainerizedExtractor._from_proto(clients, _ext("ri.ext.other"))
+    assert register(same_image, other_extractor, UploadCache(cache_path)) == "s3://bucket/1/image.tar"
+    assert register(other_image, extractor, UploadCache(cache_path)) == "s3://bucket/2/other.tar"
+    # without a cache, or in another workspace, tarballs are always uploaded
+    assert register(image, extractor, None) == "s3://bucket/3/image.tar"
+    other_workspace = ContainerizedExtractor._from_proto(
+        clients,
+        containerized_extractor_pb2.ContainerizedExtractor(
+            rid="ri.ext", workspace_rid="ri.workspace.other", name="ext"
+        ),
+    )
+    assert register(image, other_workspace, UploadCache(cache_path)) == "s3://bucket/4/image.tar"
+    assert uploaded == [image, other_image, image, image]
+
+
+def test_register_image_reuploads_when_cached_upload_is_gone(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A cached object that can no longer be registered is dropped from the cache and uploaded again, once."""
+    uploads = iter(["s3://bucket/expired/image.tar", "s3://bucket/fresh/image.tar"])
+    monkeypatch.setattr(containerized_extractor, "upload_multipart_file", lambda *_, **__: next(uploads))
+    clients = _clients()
+    tarball = tmp_path / "image.tar"
+    tarball.write_bytes(b"layers")
+    cache = UploadCache(tmp_path / "uploads.json")
+    extractor = ContainerizedExtractor._from_proto(clients, _ext("ri.ext"))
+
+    def register(tag: str) -> None:
+        extractor.register_image(
+            tarball,
+            tag=tag,
+            inputs=[],
+            default_timestamp_column="ts",
+            default_timestamp_type="iso_8601",
+            upload_cache=cache,
+        )
+
+    def create_image(request: registry_pb2.CreateImageRequest) -> registry_pb2.CreateImageResponse:
+        if request.object_path == "s3://bucket/expired/image.tar" and request.tag != "v1":
+            raise NominalError("object not found")
+        return registry_pb2.CreateImageResponse(image=_img("ri.img.1", registry_pb2.CONTAINER_IMAGE_STATUS_READY))
+
+    clients.registry.CreateImage.side_effect = create_image
+    register("v1")
+    register("v2")
+    register("v3")
+
+    object_paths = [call.args[0].object_path for call in clients.registry.CreateImage.call_args_list]
+    assert object_paths == [
+        "s3://bucket/expired/image.tar",
+        "s3://bucket/expired/image.tar",
+        "s3://bucket/fresh/image.tar",
+        "s3://bucket/fresh/image.tar",
+    ]
+
+    # a tag that already exists is not retried with a fresh upload
+    clients.registry.CreateImage.side_effect = NominalAlreadyExistsError("tag exists")
+    with pytest.raises(NominalAlreadyExistsError):
+        register("v3")
+    assert clients.registry.CreateImage.call_count == 5
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from nominal.core import data_review
+from nominal.core.data_review import DataReview, poll_until_completed
+from tests.conftest import FakeClock
+
+
+def _conjure_review(rid: str, completed: bool) -> MagicMock:
+    state = MagicMock(_pending_execution=None, _executing=None if completed else MagicMock())
+    return MagicMock(
+        rid=rid,
+        run_rid=f"run-{rid}",
+        checklist_ref=MagicMock(rid="checklist", commit="commit"),
+        created_at="2024-01-01T00:00:00Z",
+        created_by=None,
+        check_evaluations=[MagicMock(state=state)],
+    )
+
+
+@pytest.fixture
+def reviews_completing_after() -> tuple[MagicMock, dict[str, int]]:
+    """Clients whose data review "review-N" completes on its Nth get, recording the gets per review."""
+    clients = MagicMock()
+    gets: dict[str, int] = {}
+
+    def get(auth_header: str, rid: str) -> MagicMock:
+        gets[rid] = gets.get(rid, 0) + 1
+        return _conjure_review(rid, completed=gets[rid] >= int(rid.removeprefix("review-")))
+
+    clients.datareview.get.side_effect = get
+    return clients, gets
+
+
+def _reviews(clients: MagicMock, count: int) -> list[DataReview]:
+    return [
+        DataReview._from_conjure(clients, _conjure_review(f"review-{idx}", completed=False))
+        for idx in range(1, count + 1)
+    ]
+
+
+def test_poll_until_completed_reloads_running_reviews_together_with_backoff(
+    fake_polling_clock: FakeClock, reviews_completing_after: tuple[MagicMock, dict[str, int]]
+) -> None:
+    clients, gets = reviews_completing_after
+
+    completed = poll_until_completed(
+        _reviews(clients, 50), interval=timedelta(seconds=1), max_interval=timedelta(seconds=4)
+    )
+
+    assert [review.rid for review in completed] == [f"review-{idx}" for idx in range(1, 51)]
+    assert all(review.completed for review in completed)
+    # one poll per interval covers every running review, and completed reviews are not fetched again
+    assert len(fake_polling_clock.sleeps) == 50
+    assert fake_polling_clock.sleeps[:5] == [1, 2, 4, 4, 4]
+    assert gets == {f"review-{idx}": idx for idx in range(1, 51)}
+
+
+def test_poll_until_completed_times_out(
+    fake_polling_clock: FakeClock, reviews_completing_after: tuple[MagicMock, dict[str, int]]
+) -> None:
+    clients, _ = reviews_completing_after
+
+    with pytest.raises(TimeoutError, match="1 of 3 data reviews"):
+        poll_until_completed(_reviews(clients, 3), interval=timedelta(seconds=2), timeout=timedelta(seconds=3))
+    assert fake_polling_clock.sleeps == [2, 1]
+
+
+def test_poll_for_completion_returns_reloaded_review(
+    fake_polling_clock: FakeClock, reviews_completing_after: tuple[MagicMock, dict[str, int]]
+) -> None:
+    clients, _ = reviews_completing_after
+    review = DataReview._from_conjure(clients, _conjure_review("review-2", completed=False))
+
+    assert review.poll_for_completion().completed
+
+
+def test_iter_events_resolves_events_in_bounded_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(data_review.Event, "_from_proto", lambda clients, proto: proto)
+    clients = MagicMock()
+    checks = [
+        MagicMock(state=MagicMock(_generated_alerts=MagicMock(event_rids=[f"event-{check}-{idx}" for idx in range(4)])))
+        for check in range(3)
+    ] + [MagicMock(state=MagicMock(_generated_alerts=None))]
+    clients.datareview.get.return_value = MagicMock(check_evaluations=checks)
+    requested: list[list[str]] = []
+
+    def batch_get_events(request: MagicMock) -> MagicMock:
+        requested.append(list(request.event_rids))
+        return MagicMock(events=list(request.event_rids))
+
+    clients.event.BatchGetEvents.side_effect = batch_get_events
+    review = DataReview._from_conjure(clients, _conjure_review("review-1", completed=True))
+
+    events = review.iter_events(batch_size=5, parallelism=1)
+    assert next(events) == "event-0-0"
+    # only the first batch has been requested before the first event is yielded
+    assert requested == [["event-0-0", "event-0-1", "event-0-2", "event-0-3", "event-1-0"]]
+
+    remaining = list(events)
+    assert [len(batch) for batch in requested] == [5, 5, 2]
+    assert ["event-0-0", *remaining] == [f"event-{check}-{idx}" for check in range(3) for idx in range(4)]
+    assert review.get_events() == ["event-0-0", *remaining]
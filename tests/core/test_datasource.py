@@ -3,7 +3,9 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pytest
+from nominal_api import api, datasource_api, timeseries_channelmetadata_api
 
+from nominal.core._utils.channel_cache import ChannelMetadataCache
 from nominal.core.channel import ChannelDataType
 from nominal.core.datasource import BatchAddChannelsResult, CreateChannelRequest, DataSource
 
@@ -18,6 +20,7 @@ def mock_clients():
     clients.series_metadata = MagicMock()
     # get_channels iterates over response.responses — default to empty so existing tests don't crash
     clients.channel_metadata.batch_get_channel_metadata.return_value.responses = []
+    clients.channel_metadata_cache = ChannelMetadataCache()
     return clients
 
 
@@ -193,3 +196,53 @@ def test_batch_update_or_create_channels_returns_missing_when_server_drops_chann
     assert result.channels[0] == mock_ch1
     assert len(result.missing) == 1
     assert result.missing[0] == req2
+
+
+def _channel_metadata(name: str) -> timeseries_channelmetadata_api.ChannelMetadata:
+    return timeseries_channelmetadata_api.ChannelMetadata(
+        channel_identifier=timeseries_channelmetadata_api.ChannelIdentifier(
+            channel_name=name, data_source_rid="test-datasource-rid"
+        ),
+        data_type=api.SeriesDataType.DOUBLE,
+    )
+
+
+def test_get_channels_only_fetches_uncached_channels(mock_datasource: DataSource, mock_clients: MagicMock):
+    """Channels fetched once are served from the client's cache, and only new names reach the API."""
+    batch_get = mock_clients.channel_metadata.batch_get_channel_metadata
+    batch_get.return_value.responses = [_channel_metadata("a"), _channel_metadata("b")]
+    assert [ch.name for ch in mock_datasource.get_channels(names=["a", "b"])] == ["a", "b"]
+
+    batch_get.return_value.responses = [_channel_metadata("c")]
+    assert [ch.name for ch in mock_datasource.get_channels(names=["c", "b", "a"])] == ["c", "b", "a"]
+
+    requested = [req.channel_identifier.channel_name for req in batch_get.call_args[0][1].requests]
+    assert requested == ["c"]
+    assert mock_datasource.get_channel("a").data_type == ChannelDataType.DOUBLE
+    assert batch_get.call_count == 2
+
+
+def test_get_channels_without_names_uses_search_results(mock_datasource: DataSource, mock_clients: MagicMock):
+    """Listing every channel doesn't re-fetch what the search returned, and fills the cache."""
+    mock_clients.datasource.search_channels.return_value = datasource_api.SearchChannelsResponse(
+        results=[datasource_api.ChannelMetadata(data_source="test-datasource-rid", name="a", description="desc")],
+        next_page_token=None,
+    )
+
+    assert [ch.description for ch in mock_datasource.get_channels()] == ["desc"]
+    assert mock_datasource.get_channel("a").description == "desc"
+    mock_clients.channel_metadata.batch_get_channel_metadata.assert_not_called()
+
+
+def test_batch_update_or_create_channels_refetches_updated_channels(
+    mock_datasource: DataSource, mock_clients: MagicMock
+):
+    """Upserted channels are dropped from the cache so the result reflects the update."""
+    batch_get = mock_clients.channel_metadata.batch_get_channel_metadata
+    batch_get.return_value.responses = [_channel_metadata("ch0")]
+    list(mock_datasource.get_channels(names=["ch0"]))
+
+    result = mock_datasource.batch_update_or_create_channels(_make_channels(1))
+
+    assert [ch.name for ch in result.channels] == ["ch0"]
+    assert batch_get.call_count == 2
@@ -0,0 +1,265 @@
+"""Tests for the adaptive (AIMD) request lane shared by both migration tenants."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from nominal.core import NominalClient
+from nominal.experimental.migration.request_pacing import (
+    DESTINATION_TENANT,
+    SOURCE_TENANT,
+    MigrationRequestPacer,
+    _AIMDLimiter,
+)
+from tests.conftest import FakeClock
+
+
+class FakeAdapter(BaseAdapter):
+    """Returns a canned status (or raises) and advances the fake clock by a fixed latency."""
+
+    def __init__(self, clock: FakeClock, latency: float = 0.1) -> None:
+        """Answer 200 until a test sets `status_code` or `exc`."""
+        super().__init__()
+        self.clock = clock
+        self.latency = latency
+        self.status_code = 200
+        self.exc: BaseException | None = None
+        self.sent = 0
+
+    def send(self, request: Any, **kwargs: Any) -> requests.Response:
+        self.sent += 1
+        self.clock.now += self.latency
+        if self.exc is not None:
+            raise self.exc
+        response = requests.Response()
+        response.status_code = self.status_code
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _make_client(adapter: BaseAdapter) -> NominalClient:
+    client = NominalClient.from_token("token", "https://api.example.test/api")
+    client._clients.assets._requests_session.mount("https://api.example.test/api", adapter)
+    return client
+
+
+def _send(client: NominalClient) -> requests.Response:
+    return client._clients.assets._requests_session.get("https://api.example.test/api/scout/v1/asset")
+
+
+def _limiter(clock: FakeClock, *, max_concurrency: int = 8, initial: int = 2, **kwargs: Any) -> _AIMDLimiter:
+    return _AIMDLimiter(
+        max_concurrency=max_concurrency,
+        initial_concurrency=initial,
+        clock=clock,
+        sleep=lambda _: None,
+        jitter=lambda delay: delay,
+        **kwargs,
+    )
+
+
+class TestAIMDLimiter:
+    def test_healthy_responses_widen_lane_additively(self) -> None:
+        limiter = _limiter(FakeClock())
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(latency_seconds=0.1, throttled=False)
+        # 2 -> 2.5 -> 3.0 -> 3.33 -> 3.63 -> 3.91
+        assert limiter.limit == 3
+
+    def test_lane_never_exceeds_max(self) -> None:
+        limiter = _limiter(FakeClock(), max_concurrency=3)
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release(latency_seconds=0.1, throttled=False)
+        assert limiter.limit == 3
+
+    def test_throttle_halves_lane_once_per_cooldown(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, initial=8)
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(latency_seconds=None, throttled=True)
+        assert limiter.limit == 4
+
+        clock.now += 5.0
+        limiter.acquire()
+        limiter.release(latency_seconds=None, throttled=True)
+        assert limiter.limit == 2
+
+    def test_lane_floors_at_one(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, initial=1)
+        limiter.acquire()
+        limiter.release(latency_seconds=None, throttled=True)
+        assert limiter.limit == 1
+
+    def test_sustained_latency_spike_narrows_lane(self) -> None:
+        limiter = _limiter(FakeClock(), initial=8)
+        limiter.acquire()
+        limiter.release(latency_seconds=0.1, throttled=False)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(latency_seconds=5.0, throttled=False)
+        assert limiter.limit < 8
+
+    def test_non_throttle_failures_leave_lane_alone(self) -> None:
+        limiter = _limiter(FakeClock(), initial=4)
+        limiter.acquire()
+        limiter.release(latency_seconds=None, throttled=False)
+        assert limiter.limit == 4
+
+    def test_throttle_engages_damper_before_admission(self) -> None:
+        sleeps: list[float] = []
+        limiter = _AIMDLimiter(
+            max_concurrency=4,
+            initial_concurrency=2,
+            clock=FakeClock(),
+            sleep=sleeps.append,
+            jitter=lambda delay: delay,
+        )
+        limiter.acquire()
+        limiter.release(latency_seconds=None, throttled=True)
+        limiter.acquire()
+        assert sleeps and sleeps[0] > 0.0
+        assert limiter.in_flight == 1
+
+    def test_acquire_blocks_at_limit(self) -> None:
+        limiter = _limiter(FakeClock(), initial=1)
+        limiter.acquire()
+        admitted = threading.Event()
+
+        def second() -> None:
+            limiter.acquire()
+            admitted.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        assert not admitted.wait(0.05)
+        limiter.release(latency_seconds=0.1, throttled=False)
+        assert admitted.wait(1.0)
+        thread.join()
+
+    def test_rejects_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError):
+            _limiter(FakeClock(), max_concurrency=0, initial=1)
+
+
+class TestMigrationRequestPacer:
+    def test_counts_requests_per_tenant(self) -> None:
+        clock = FakeClock()
+        source_adapter = FakeAdapter(clock, latency=0.5)
+        destination_adapter = FakeAdapter(clock, latency=0.25)
+        source = _make_client(source_adapter)
+        destination = _make_client(destination_adapter)
+        pacer = MigrationRequestPacer(4, clock=clock, sleep=lambda _: None)
+        pacer.install(source, SOURCE_TENANT)
+        pacer.install(destination, DESTINATION_TENANT)
+
+        for _ in range(3):
+            _send(source)
+        destination_adapter.status_code = 429
+        _send(destination)
+
+        stats = {s.tenant: s for s in pacer.stats()}
+        assert stats[SOURCE_TENANT].requests == 3
+        assert stats[SOURCE_TENANT].throttled == 0
+        assert stats[SOURCE_TENANT].mean_latency_seconds == pytest.approx(0.5)
+        assert stats[SOURCE_TENANT].requests_per_second == pytest.approx(2.0)
+        assert stats[DESTINATION_TENANT].requests == 1
+        assert stats[DESTINATION_TENANT].throttled == 1
+
+    def test_non_adaptive_pacer_only_counts_requests(self) -> None:
+        clock = FakeClock()
+        adapter = FakeAdapter(clock)
+        adapter.status_code = 429
+        client = _make_client(adapter)
+        sleeps: list[float] = []
+        pacer = MigrationRequestPacer(1, adaptive=False, clock=clock, sleep=sleeps.append)
+        pacer.install(client, SOURCE_TENANT)
+
+        # requests are neither serialized behind a lane nor delayed after throttles
+        threads = [threading.Thread(target=_send, args=(client,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        _send(client)
+
+        assert sleeps == []
+        assert pacer.stats()[0].requests == 5
+        assert pacer.stats()[0].throttled == 5
+        assert pacer.concurrency_limit is None
+        assert pacer.peak_concurrency_limit is None
+
+    def test_install_is_idempotent(self) -> None:
+        clock = FakeClock()
+        adapter = FakeAdapter(clock)
+        client = _make_client(adapter)
+        pacer = MigrationRequestPacer(4, clock=clock)
+        pacer.install(client, SOURCE_TENANT)
+        pacer.install(client, SOURCE_TENANT)
+
+        _send(client)
+        assert adapter.sent == 1
+        assert pacer.stats()[0].requests == 1
+
+    def test_retry_exhaustion_counts_as_throttle(self) -> None:
+        clock = FakeClock()
+        adapter = FakeAdapter(clock)
+        adapter.exc = requests.exceptions.RetryError("too many 429s")
+        client = _make_client(adapter)
+        pacer = MigrationRequestPacer(4, initial_concurrency=4, clock=clock, sleep=lambda _: None)
+        pacer.install(client, SOURCE_TENANT)
+
+        with pytest.raises(requests.exceptions.RetryError):
+            _send(client)
+        assert pacer.stats()[0].throttled == 1
+        assert pacer.concurrency_limit == 2
+
+    def test_connection_errors_count_as_errors(self) -> None:
+        clock = FakeClock()
+        adapter = FakeAdapter(clock)
+        adapter.exc = requests.exceptions.ConnectionError("reset")
+        client = _make_client(adapter)
+        pacer = MigrationRequestPacer(4, clock=clock)
+        pacer.install(client, SOURCE_TENANT)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            _send(client)
+        stats = pacer.stats()[0]
+        assert stats.errors == 1
+        assert stats.throttled == 0
+
+    def test_interrupts_free_their_slot_without_feedback(self) -> None:
+        clock = FakeClock()
+        adapter = FakeAdapter(clock)
+        adapter.exc = KeyboardInterrupt()
+        client = _make_client(adapter)
+        pacer = MigrationRequestPacer(4, initial_concurrency=1, clock=clock, sleep=lambda _: None)
+        pacer.install(client, SOURCE_TENANT)
+
+        with pytest.raises(KeyboardInterrupt):
+            _send(client)
+        assert pacer.stats()[0].requests == 0
+        assert pacer.concurrency_limit == 1
+
+        # the slot was released, so the lane still admits requests
+        adapter.exc = None
+        _send(client)
+        assert pacer.stats()[0].requests == 1
+
+    def test_close_reaches_inner_adapter(self) -> None:
+        inner = MagicMock(spec=BaseAdapter)
+        client = _make_client(inner)
+        MigrationRequestPacer(4).install(client, SOURCE_TENANT)
+        client._clients.assets._requests_session.close()
+        inner.close.assert_called_once()
@@ -16,11 +16,13 @@ from nominal.experimental.migration.migration_state import MigrationState
 from nominal.experimental.migration.migration_summary import (
     build_summary,
     load_migration_block,
+    render_request_rate_table,
     render_summary_table,
     summarize_config,
     summarize_log,
     summarize_state,
 )
+from nominal.experimental.migration.request_pacing import TenantRequestStats
 from nominal.experimental.migration.resource_type import ResourceType, format_resource_label, resource_label
 
 
@@ -48,6 +50,23 @@ class TestRenderSummaryTable:
         assert "| **Total** | **5** |" in table
 
 
+class TestRenderRequestRateTable:
+    def test_empty_stats(self) -> None:
+        table = render_request_rate_table([])
+        assert "| _(none)_ |" in table
+        assert "Peak request concurrency" not in table
+
+    def test_row_per_tenant(self) -> None:
+        stats = [
+            TenantRequestStats("destination", 10, 2, 1, 5.0, 0.25),
+            TenantRequestStats("source", 30, 0, 0, 10.0, 0.125),
+        ]
+        table = render_request_rate_table(stats, peak_concurrency=6)
+        assert "Peak request concurrency: 6" in table
+        assert "| destination | 10 | 2.00 | 2 | 1 | 0.250 |" in table
+        assert "| source | 30 | 3.00 | 0 | 0 | 0.125 |" in table
+
+
 class TestSummarizeConfig:
     def _write(self, tmp_path: Path, content: str) -> Path:
         path = tmp_path / "config.yml"
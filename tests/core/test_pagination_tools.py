@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock
 
+import pytest
 from nominal_api import ingest_api
 
-from nominal.core._utils.pagination_tools import DEFAULT_PAGE_SIZE, search_ingest_jobs_paginated
+from nominal.core._utils.pagination_tools import (
+    DEFAULT_PAGE_SIZE,
+    PaginationStats,
+    paginate_grpc,
+    paginate_rpc,
+    search_ingest_jobs_paginated,
+)
 
 
 def test_search_ingest_jobs_paginated_walks_all_pages():
@@ -28,3 +36,74 @@ def test_search_ingest_jobs_paginated_walks_all_pages():
     # Second request carries the token returned by the first page.
     second_request = client.search_ingest_jobs.call_args_list[1].args[1]
     assert second_request.next_page_token == "token-2"
+
+
+def _pages(count: int) -> list[MagicMock]:
+    return [
+        MagicMock(ingest_jobs=[f"job-{i}"], next_page_token=f"token-{i + 1}" if i + 1 < count else None)
+        for i in range(count)
+    ]
+
+
+def test_search_ingest_jobs_paginated_uses_requested_page_size():
+    client = MagicMock()
+    client.search_ingest_jobs.side_effect = _pages(1)
+    list(search_ingest_jobs_paginated(client, "Bearer token", filter=MagicMock(), page_size=500))
+    assert client.search_ingest_jobs.call_args.args[1].page_size == 500
+
+
+def test_prefetch_yields_every_page_in_order_and_records_stats():
+    client = MagicMock()
+    client.search_ingest_jobs.side_effect = _pages(5)
+    stats = PaginationStats()
+
+    results = list(search_ingest_jobs_paginated(client, "Bearer token", MagicMock(), prefetch=2, stats=stats))
+
+    assert results == [f"job-{i}" for i in range(5)]
+    tokens = [c.args[1].next_page_token for c in client.search_ingest_jobs.call_args_list]
+    assert tokens == [None, "token-1", "token-2", "token-3", "token-4"]
+    assert stats.pages == 5
+    assert stats.max_fetch_seconds <= stats.fetch_seconds
+    assert stats.mean_fetch_seconds == pytest.approx(stats.fetch_seconds / 5)
+
+
+def test_prefetch_fetches_next_page_while_consumer_holds_current():
+    fetched = threading.Semaphore(0)
+    pages = _pages(3)
+
+    def rpc(auth_header, request):
+        fetched.release()
+        return pages.pop(0)
+
+    responses = iter(paginate_rpc(rpc, "Bearer token", request_factory=MagicMock(), prefetch=1))
+    next(responses)
+    # the second page is requested without the consumer asking for it
+    assert fetched.acquire(timeout=5) and fetched.acquire(timeout=5)
+    # ... but the look-ahead is bounded: the third is not requested until the second is consumed
+    assert not fetched.acquire(timeout=0.1)
+    assert len(list(responses)) == 2
+
+
+def test_prefetch_propagates_errors_after_earlier_pages():
+    def rpc(auth_header, request):
+        if request.token is not None:
+            raise RuntimeError("page 2 failed")
+        return MagicMock(next_page_token="token-2")
+
+    responses = iter(
+        paginate_rpc(rpc, "Bearer token", request_factory=lambda token: MagicMock(token=token), prefetch=3)
+    )
+    next(responses)
+    with pytest.raises(RuntimeError, match="page 2 failed"):
+        next(responses)
+
+
+def test_paginate_grpc_prefetch_stops_on_empty_token():
+    rpc = MagicMock(side_effect=[MagicMock(next_page_token="t"), MagicMock(next_page_token="")])
+    assert len(list(paginate_grpc(rpc, request_factory=lambda token: token, prefetch=2))) == 2
+    assert [c.args[0] for c in rpc.call_args_list] == [None, "t"]
+
+
+def test_negative_prefetch_is_rejected():
+    with pytest.raises(ValueError, match="prefetch"):
+        list(paginate_grpc(MagicMock(), request_factory=lambda token: token, prefetch=-1))
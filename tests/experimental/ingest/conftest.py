@@ -9,22 +9,7 @@ import pytest
 
 from nominal.experimental.ingest._multipart_uploader import MultipartUploader
 from nominal.experimental.ingest._upload_pacing import _ThrottleGate
-
-
-class FakeClock:
-    """Deterministic clock whose sleep advances time — no real sleeping in fake-time tests."""
-
-    def __init__(self) -> None:
-        """Start at time zero with no sleeps recorded."""
-        self.now = 0.0
-        self.sleeps: list[float] = []
-
-    def __call__(self) -> float:
-        return self.now
-
-    def sleep(self, seconds: float) -> None:
-        self.sleeps.append(seconds)
-        self.now += seconds
+from tests.conftest import FakeClock
 
 
 @pytest.fixture
@@ -39,12 +24,6 @@ def write_file(tmp_path: pathlib.Path) -> Callable[[str, int], pathlib.Path]:
     return _write
 
 
-@pytest.fixture
-def fake_clock() -> FakeClock:
-    """A fresh deterministic clock for tests that drive time seams directly."""
-    return FakeClock()
-
-
 @pytest.fixture
 def install_test_gate() -> Callable[..., FakeClock]:
     """Factory swapping an uploader's gate for one on a fake clock: retries instant and countable.
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from nominal.core._stream.write_stream import WriteStream
+from nominal.experimental.logging.nominal_log_handler import NominalLogHandler
+
+
+class FakeLogStream:
+    """Records enqueued logs; `gate` lets a test hold the background worker inside `enqueue`."""
+
+    def __init__(self) -> None:
+        """Start with the gate open."""
+        self.enqueued: list[tuple[str, int, str, dict[str, str]]] = []
+        self.enqueue_threads: set[str] = set()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.flushed = 0
+        self.closed = False
+        self.closed_waiting: bool | None = None
+
+    def enqueue(self, channel: str, timestamp: int, message: str, args: dict[str, str]) -> None:
+        self.gate.wait()
+        self.enqueue_threads.add(threading.current_thread().name)
+        self.enqueued.append((channel, timestamp, message, args))
+
+    def flush(self, wait: bool = False, timeout: float | None = None) -> None:
+        self.flushed += 1
+
+    def close(self, wait: bool = True) -> None:
+        self.closed = True
+        self.closed_waiting = wait
+
+
+@pytest.fixture
+def stream() -> FakeLogStream:
+    return FakeLogStream()
+
+
+def _handler(stream: FakeLogStream, **kwargs: Any) -> NominalLogHandler:
+    write_stream = MagicMock(spec=WriteStream)
+    write_stream.enqueue.side_effect = stream.enqueue
+    write_stream.flush.side_effect = stream.flush
+    write_stream.close.side_effect = stream.close
+    dataset = MagicMock()
+    dataset.get_log_stream.return_value = write_stream
+    return NominalLogHandler(dataset, **kwargs)
+
+
+def _record(msg: str, **extra: Any) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, "file.py", 12, msg, None, None, func="fn")
+    for k, v in extra.items():
+        setattr(record, k, v)
+    return record
+
+
+def _wait_until_picked_up(handler: NominalLogHandler) -> None:
+    """Wait for the worker to pop everything buffered (and block inside the gated `enqueue`)."""
+    while handler._buffer:
+        time.sleep(0.001)
+
+
+def test_emit_ships_formatted_records_from_worker_thread(stream: FakeLogStream) -> None:
+    handler = _handler(stream, default_args={"service": "svc"})
+    handler.handle(_record("hello", nominal_args={"count": 3}))
+    handler.flush(timeout=5)
+
+    assert len(stream.enqueued) == 1
+    channel, _, message, args = stream.enqueued[0]
+    assert channel == "logs"
+    assert message == "hello"
+    assert args == {
+        "level": "INFO",
+        "filename": "file.py",
+        "function": "fn",
+        "line": "12",
+        "service": "svc",
+        "count": "3",
+    }
+    assert stream.enqueue_threads == {"nominal-log-handler"}
+    assert stream.flushed == 1
+    handler.close()
+
+
+def test_close_delivers_buffered_records(stream: FakeLogStream) -> None:
+    handler = _handler(stream)
+    for i in range(500):
+        handler.handle(_record(f"msg {i}"))
+    handler.close(timeout=5)
+
+    assert [m for _, _, m, _ in stream.enqueued] == [f"msg {i}" for i in range(500)]
+    assert stream.closed
+    assert handler.dropped_count == 0
+
+
+def test_drop_newest_when_full(stream: FakeLogStream) -> None:
+    stream.gate.clear()
+    handler = _handler(stream, buffer_size=2, drop_policy="drop_newest")
+    handler.handle(_record("in flight"))
+    _wait_until_picked_up(handler)
+    for i in range(4):
+        handler.handle(_record(f"msg {i}"))
+    assert handler.dropped_count == 2
+
+    stream.gate.set()
+    handler.close(timeout=5)
+    assert [m for _, _, m, _ in stream.enqueued] == ["in flight", "msg 0", "msg 1"]
+
+
+def test_drop_oldest_when_full(stream: FakeLogStream) -> None:
+    stream.gate.clear()
+    handler = _handler(stream, buffer_size=2, drop_policy="drop_oldest")
+    handler.handle(_record("in flight"))
+    _wait_until_picked_up(handler)
+    for i in range(4):
+        handler.handle(_record(f"msg {i}"))
+    assert handler.dropped_count == 2
+
+    stream.gate.set()
+    handler.close(timeout=5)
+    assert [m for _, _, m, _ in stream.enqueued] == ["in flight", "msg 2", "msg 3"]
+
+
+def test_block_policy_is_lossless(stream: FakeLogStream) -> None:
+    handler = _handler(stream, buffer_size=4, drop_policy="block")
+    for i in range(200):
+        handler.handle(_record(f"msg {i}"))
+    handler.close(timeout=5)
+
+    assert len(stream.enqueued) == 200
+    assert handler.dropped_count == 0
+
+
+def test_emit_after_close_is_dropped(stream: FakeLogStream) -> None:
+    handler = _handler(stream)
+    handler.close()
+    handler.handle(_record("late"))
+    assert stream.enqueued == []
+    assert handler.dropped_count == 1
+
+
+def test_flush_times_out_while_worker_is_stuck(stream: FakeLogStream) -> None:
+    stream.gate.clear()
+    handler = _handler(stream)
+    handler.handle(_record("stuck"))
+    handler.flush(timeout=0.1)
+    assert stream.flushed == 0
+
+    stream.gate.set()
+    handler.close(timeout=5)
+    assert len(stream.enqueued) == 1
+
+
+def test_close_with_timeout_does_not_wait_for_uploads(stream: FakeLogStream) -> None:
+    handler = _handler(stream)
+    handler.handle(_record("msg"))
+    handler.close(timeout=5)
+
+    assert len(stream.enqueued) == 1
+    assert stream.flushed == 1
+    assert stream.closed_waiting is False
+
+
+def test_close_times_out_without_closing_stream_under_worker(stream: FakeLogStream) -> None:
+    stream.gate.clear()
+    handler = _handler(stream)
+    handler.handle(_record("stuck"))
+    _wait_until_picked_up(handler)
+    handler.handle(_record("buffered"))
+
+    started = time.monotonic()
+    handler.close(timeout=0.1)
+    assert time.monotonic() - started < 2
+    # the worker is still inside `enqueue`, so the stream stays open until it finishes
+    assert not stream.closed
+
+    stream.gate.set()
+    handler._worker.join(5)
+    assert stream.closed
+    assert stream.closed_waiting is False
+    assert [m for _, _, m, _ in stream.enqueued] == ["stuck"]
+    assert handler.dropped_count == 1
+
+
+def test_invalid_buffer_size(stream: FakeLogStream) -> None:
+    with pytest.raises(ValueError):
+        _handler(stream, buffer_size=0)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from nominal.experimental.video_processing.video_conversion import (
+    EncoderStats,
+    _FfmpegOutputPipe,
+    _StderrCollector,
+    parse_encoder_stats,
+    split_at_keyframes,
+)
+
+FFMPEG_SUMMARY = [
+    "[out#0/mp4 @ 0x1]   Output stream #0:0 (video): 148 frames encoded; 148 packets muxed (24151 bytes); ",
+    "[out#0/mp4 @ 0x1]   Output stream #0:1 (audio): 216 frames encoded (221184 samples); 217 packets muxed; ",
+    "[in#0/mov @ 0x2]   Input stream #0:0 (video): 150 packets read (24054 bytes); 150 frames decoded; 0 errors; ",
+    "[in#0/mov @ 0x2]   Input stream #0:1 (audio): 217 packets read (43554 bytes); 216 frames decoded; ",
+]
+
+
+def test_parse_encoder_stats_reads_video_streams_only() -> None:
+    assert parse_encoder_stats(FFMPEG_SUMMARY) == EncoderStats(frames_decoded=150, frames_encoded=148)
+
+
+def test_parse_encoder_stats_without_summary() -> None:
+    assert parse_encoder_stats(["frame=  10 fps=0.0 q=-1.0 size=0kB"]) == EncoderStats(None, None)
+
+
+def test_encoder_stats_sum_propagates_unknowns() -> None:
+    assert EncoderStats(1, 2) + EncoderStats(3, 4) == EncoderStats(4, 6)
+    assert EncoderStats(1, 2) + EncoderStats(None, 4) == EncoderStats(None, 6)
+
+
+@pytest.mark.parametrize(
+    ("keyframes", "duration", "num_segments", "expected"),
+    [
+        ([0.0, 2.0, 4.0, 6.0, 8.0], 10.0, 2, [0.0, 4.0]),
+        ([0.0, 2.0, 4.0, 6.0, 8.0], 10.0, 4, [0.0, 2.0, 4.0, 8.0]),
+        ([0.0, 2.0, 4.0, 6.0, 8.0], 10.0, 1, [0.0]),
+        # too few keyframes: fewer segments rather than duplicate or out-of-order cuts
+        ([0.0], 10.0, 4, [0.0]),
+        ([0.0, 9.0], 10.0, 3, [0.0, 9.0]),
+    ],
+)
+def test_split_at_keyframes(keyframes: list[float], duration: float, num_segments: int, expected: list[float]) -> None:
+    assert split_at_keyframes(keyframes, duration, num_segments) == expected
+
+
+def _fake_ffmpeg(script: str) -> _FfmpegOutputPipe:
+    process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert process.stderr is not None
+    return _FfmpegOutputPipe(process, _StderrCollector(process.stderr))
+
+
+def test_output_pipe_collects_stats_at_eof() -> None:
+    summary = "\\n".join(FFMPEG_SUMMARY)
+    pipe = _fake_ffmpeg(f"import sys; sys.stdout.buffer.write(b'x' * 10); sys.stderr.write('{summary}')")
+    assert pipe.read(4) == b"xxxx"
+    assert pipe.read(100) == b"xxxxxx"
+    assert pipe.read(100) == b""
+    assert pipe.stats == EncoderStats(frames_decoded=150, frames_encoded=148)
+    pipe.close()
+
+
+def test_output_pipe_raises_when_ffmpeg_fails() -> None:
+    pipe = _fake_ffmpeg("import sys; sys.stdout.buffer.write(b'partial'); sys.stderr.write('boom'); sys.exit(3)")
+    assert pipe.read(100) == b"partial"
+    with pytest.raises(RuntimeError, match="status 3"):
+        pipe.read(100)
+    pipe.close()
+
+
+def test_closing_pipe_early_stops_ffmpeg() -> None:
+    pipe = _fake_ffmpeg("import time; time.sleep(30)")
+    pipe.close()
+    assert pipe._process.returncode is not None
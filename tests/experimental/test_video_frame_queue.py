@@ -0,0 +1,141 @@
+"""Tests for VideoStream's frame queue and pusher thread that run without the `video` extra.
+
+The queue and pusher are pure Python, so `_video_stream` is loaded here against a stand-in `nominal_video`
+module whose `Stream` is a fake pipeline; test_video_stream.py covers the rest against the real bindings.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import pathlib
+import sys
+import threading
+import types
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import nominal.experimental
+from nominal.core.exceptions import NominalVideoStreamNotOpenError
+
+
+class FakePipeline:
+    """Stands in for the rust `Stream`; records pushed frames and can be held shut with `gate`."""
+
+    def __init__(self) -> None:
+        """Accept every frame until a test says otherwise."""
+        self.frames: list[tuple[bytes, int | None]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.on_close: Any = None
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.on_close is not None:
+            self.on_close()
+
+    def send_frame(self, data: bytes, timestamp_ns: int | None = None) -> bool:
+        self.gate.wait()
+        assert type(data) is bytes
+        self.frames.append((data, timestamp_ns))
+        return True
+
+
+@pytest.fixture
+def pipeline() -> FakePipeline:
+    return FakePipeline()
+
+
+@pytest.fixture
+def video_stream(monkeypatch: pytest.MonkeyPatch, pipeline: FakePipeline) -> Any:
+    """The `_video_stream` module, loaded against a `nominal_video` whose `Stream` is always `pipeline`."""
+    fake_bindings = types.ModuleType("nominal_video")
+    fake_bindings.Sink = fake_bindings.Src = fake_bindings.StreamOptions = MagicMock  # type: ignore[attr-defined]
+    fake_bindings.Stream = lambda *args, **kwargs: pipeline  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "nominal_video", fake_bindings)
+
+    path = pathlib.Path(nominal.experimental.__file__).parent / "video" / "_video_stream.py"
+    spec = importlib.util.spec_from_file_location("_video_stream_without_bindings", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _open_stream(video_stream: Any, max_queued_frames: int | None = 4) -> Any:
+    stream = video_stream.VideoStream(
+        rid="ri.catalog.dataset.1",
+        src=MagicMock(),
+        options=None,
+        whip_sink=MagicMock(),
+        max_queued_frames=max_queued_frames,
+    )
+    stream.open()
+    return stream
+
+
+def test_queued_frames_are_pushed_in_order_and_flushed_on_close(video_stream: Any, pipeline: FakePipeline):
+    stream = _open_stream(video_stream)
+    frame = bytearray(b"b")
+    assert stream.send_frame(b"a", timestamp_ns=1)
+    assert stream.send_frame(memoryview(frame), timestamp_ns=2)
+    stream.close()
+
+    assert pipeline.frames == [(b"a", 1), (b"b", 2)]
+    assert stream.frame_stats == video_stream.FrameStats(accepted=2, dropped=0, late=0)
+
+
+def test_queue_drops_oldest_and_late_frames(video_stream: Any, pipeline: FakePipeline):
+    stream = _open_stream(video_stream, max_queued_frames=2)
+    pipeline.gate.clear()
+    assert stream.send_frame(b"in flight", timestamp_ns=1)
+    while stream._frames:  # wait for the pusher to pick it up and block inside the pipeline
+        threading.Event().wait(0.001)
+    for i in range(3):
+        assert stream.send_frame(f"frame {i}".encode(), timestamp_ns=10 + i)
+    assert not stream.send_frame(b"late", timestamp_ns=12)
+
+    pipeline.gate.set()
+    stream.close()
+    assert [data for data, _ in pipeline.frames] == [b"in flight", b"frame 1", b"frame 2"]
+    assert stream.frame_stats == video_stream.FrameStats(accepted=3, dropped=1, late=1)
+
+
+def test_frames_sent_while_closing_are_rejected_and_not_pushed_after_reopening(
+    video_stream: Any, pipeline: FakePipeline
+):
+    stream = _open_stream(video_stream)
+    assert stream.send_frame(b"a", timestamp_ns=10)
+    rejected: list[Exception] = []
+
+    def send_while_closing() -> None:
+        # the pusher has drained the queue and exited, but the stream is not yet marked closed
+        try:
+            stream.send_frame(b"stale", timestamp_ns=20)
+        except NominalVideoStreamNotOpenError as e:
+            rejected.append(e)
+
+    pipeline.on_close = send_while_closing
+    stream.close()
+    assert len(rejected) == 1
+    assert not stream._frames
+
+    pipeline.on_close = None
+    stream.open()
+    assert stream.send_frame(b"b", timestamp_ns=1)
+    stream.close()
+    assert pipeline.frames == [(b"a", 10), (b"b", 1)]
+
+
+def test_unqueued_frames_are_pushed_on_the_callers_thread(video_stream: Any, pipeline: FakePipeline):
+    stream = _open_stream(video_stream, max_queued_frames=None)
+    assert stream.send_frame(b"a", timestamp_ns=10)
+    assert stream.send_frame(b"b", timestamp_ns=10)  # no late check without a queue
+    assert pipeline.frames == [(b"a", 10), (b"b", 10)]
+    stream.close()
+    with pytest.raises(NominalVideoStreamNotOpenError):
+        stream.send_frame(b"c")
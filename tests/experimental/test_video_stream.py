@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from nominal.core.exceptions import LegacyVideoDeprecationWarning
+from nominal.core.exceptions import LegacyVideoDeprecationWarning, NominalVideoStreamNotOpenError
 from nominal.core.video import Video
 
 # Requires the `video` extra to import the rust bindings, plus GStreamer at load time. exc_type covers
@@ -12,7 +13,7 @@ from nominal.core.video import Video
 # which importorskip otherwise reports as a warning rather than a skip.
 pytest.importorskip("nominal_video", exc_type=ImportError)
 
-from nominal.experimental.video import Src, VideoStream  # noqa: E402
+from nominal.experimental.video import FrameStats, Src, VideoStream  # noqa: E402
 
 
 def _clients_returning_whip_url(response_attr: str) -> MagicMock:
@@ -79,3 +80,130 @@ def test_create_rejects_a_channel_for_a_legacy_video():
     with pytest.raises(ValueError, match="does not apply"):
         VideoStream.create(video, Src.file("in.mp4"), channel="camera/front")
     clients.video.generate_whip_stream.assert_not_called()
+
+
+class FakePipeline:
+    """Stands in for the rust `Stream`; records pushed frames and can be held shut with `gate`."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Accept every frame until a test says otherwise."""
+        self.frames: list[tuple[bytes, int | None]] = []
+        self.accept = True
+        self.gate = threading.Event()
+        self.gate.set()
+        self.closed = False
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def send_frame(self, data: bytes, timestamp_ns: int | None = None) -> bool:
+        self.gate.wait()
+        assert type(data) is bytes
+        self.frames.append((data, timestamp_ns))
+        return self.accept
+
+
+def _open_stream(**kwargs: object) -> tuple[VideoStream, FakePipeline]:
+    pipeline = FakePipeline()
+    stream = VideoStream(rid="ri.catalog.dataset.1", src=MagicMock(), options=None, whip_sink=MagicMock(), **kwargs)
+    with patch("nominal.experimental.video._video_stream.Stream", return_value=pipeline):
+        stream.open()
+    return stream, pipeline
+
+
+def test_send_frame_accepts_buffer_protocol_objects():
+    """Bytes pass through untouched; other buffers (memoryview, bytearray, arrays) are converted once."""
+    stream, pipeline = _open_stream()
+    payload = b"\x01\x02\x03"
+    assert stream.send_frame(payload, timestamp_ns=1)
+    assert stream.send_frame(memoryview(bytearray(b"\x04\x05\x06")), timestamp_ns=2)
+    assert stream.send_frame(bytearray(b"\x07\x08\x09"))
+
+    assert pipeline.frames[0][0] is payload
+    assert [data for data, _ in pipeline.frames] == [b"\x01\x02\x03", b"\x04\x05\x06", b"\x07\x08\x09"]
+    with pytest.raises(TypeError):
+        stream.send_frame("not a buffer")  # type: ignore[arg-type]
+    stream.close()
+
+
+def test_send_frame_accepts_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    stream, pipeline = _open_stream()
+    frame = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+    assert stream.send_frame(frame)
+    assert stream.send_frame(frame[:, ::-1])  # non-contiguous views are copied in C order
+    assert pipeline.frames[0][0] == frame.tobytes()
+    assert pipeline.frames[1][0] == frame[:, ::-1].tobytes()
+    stream.close()
+
+
+def test_rejected_frames_are_counted_and_timestamps_passed_through():
+    """Without a frame queue, every frame reaches the pipeline, including repeated or earlier timestamps."""
+    stream, pipeline = _open_stream()
+    assert stream.send_frame(b"a", timestamp_ns=10)
+    assert stream.send_frame(b"b", timestamp_ns=10)
+    assert stream.send_frame(b"c", timestamp_ns=5)
+    pipeline.accept = False
+    assert not stream.send_frame(b"d", timestamp_ns=20)
+
+    assert stream.frame_stats == FrameStats(accepted=3, dropped=1, late=0)
+    assert [data for data, _ in pipeline.frames] == [b"a", b"b", b"c", b"d"]
+    stream.close()
+
+
+def test_frame_queue_drops_late_frames_until_restart():
+    stream, pipeline = _open_stream(max_queued_frames=4)
+    assert stream.send_frame(b"a", timestamp_ns=10)
+    assert not stream.send_frame(b"b", timestamp_ns=10)
+    assert not stream.send_frame(b"c", timestamp_ns=5)
+    stream.close()
+    assert stream.frame_stats == FrameStats(accepted=1, dropped=0, late=2)
+
+    # the source's clock may start over once the stream is reopened
+    with patch("nominal.experimental.video._video_stream.Stream", return_value=pipeline):
+        stream.open()
+    assert stream.send_frame(b"d", timestamp_ns=1)
+    stream.close()
+    assert [data for data, _ in pipeline.frames] == [b"a", b"d"]
+
+
+def test_frame_queue_drops_oldest_when_full():
+    stream, pipeline = _open_stream(max_queued_frames=2)
+    pipeline.gate.clear()
+    assert stream.send_frame(b"in flight", timestamp_ns=1)
+    while stream._frames:  # wait for the pusher to pick it up and block inside the pipeline
+        threading.Event().wait(0.001)
+    for i in range(4):
+        assert stream.send_frame(f"frame {i}".encode(), timestamp_ns=10 + i)
+
+    pipeline.gate.set()
+    stream.close()
+    assert [data for data, _ in pipeline.frames] == [b"in flight", b"frame 2", b"frame 3"]
+    assert [ts for _, ts in pipeline.frames] == [1, 12, 13]
+    assert stream.frame_stats == FrameStats(accepted=3, dropped=2, late=0)
+    assert pipeline.closed
+
+
+def test_frame_queue_survives_restart():
+    stream, pipeline = _open_stream(max_queued_frames=4)
+    stream.send_frame(b"a")
+    stream.close()
+    with patch("nominal.experimental.video._video_stream.Stream", return_value=pipeline):
+        stream.open()
+    stream.send_frame(b"b")
+    stream.close()
+    assert [data for data, _ in pipeline.frames] == [b"a", b"b"]
+
+
+def test_send_frame_requires_open_stream():
+    stream = VideoStream(rid="ri.catalog.dataset.1", src=MagicMock(), options=None, whip_sink=MagicMock())
+    with pytest.raises(NominalVideoStreamNotOpenError):
+        stream.send_frame(b"a")
+
+
+def test_max_queued_frames_must_be_positive():
+    with pytest.raises(ValueError, match="max_queued_frames"):
+        VideoStream(rid="ri", src=MagicMock(), options=None, whip_sink=MagicMock(), max_queued_frames=0)
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import threading
+import time
+
+import pytest
+
 from nominal._utils import iterator_tools
 
 
@@ -27,3 +32,110 @@ def test_batched_multiple_of_batch_size():
     assert len(batches) == 2
     assert batches[0] == tuple(range(10))
     assert batches[1] == tuple(range(10, 20))
+
+
+def test_chain_concurrently_preserves_source_order():
+    def source(i: int):
+        def produce():
+            time.sleep(0.01 * (5 - i))  # later sources finish first
+            return range(i * 10, i * 10 + 3)
+
+        return produce
+
+    result = list(iterator_tools.chain_concurrently([source(i) for i in range(5)], max_workers=3))
+    assert result == [i * 10 + j for i in range(5) for j in range(3)]
+
+
+def test_chain_concurrently_bounds_running_sources():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def produce():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        yield 1
+        with lock:
+            running -= 1
+
+    assert sum(iterator_tools.chain_concurrently([produce] * 10, max_workers=2)) == 10
+    assert max_running <= 2
+
+
+def test_chain_concurrently_yields_items_before_error():
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    it = iterator_tools.chain_concurrently([lambda: [0], failing, lambda: [2]], max_workers=3)
+    assert next(it) == 0
+    assert next(it) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(it)
+
+
+def test_chain_concurrently_stops_sources_when_closed():
+    produced = 0
+
+    def endless():
+        nonlocal produced
+        while True:
+            produced += 1
+            yield produced
+
+    it = iterator_tools.chain_concurrently([endless], max_workers=1, max_buffered=4)
+    assert next(it) == 1
+    it.close()  # type: ignore[attr-defined]
+    time.sleep(0.05)
+    # the source stays paused at the buffer limit and is released on close
+    assert produced <= 6
+
+
+@pytest.mark.parametrize(("max_workers", "max_buffered"), [(0, 1), (1, 0)])
+def test_chain_concurrently_rejects_bad_limits(max_workers: int, max_buffered: int):
+    with pytest.raises(ValueError):
+        iterator_tools.chain_concurrently([], max_workers=max_workers, max_buffered=max_buffered)
+
+
+def test_map_concurrently_preserves_item_order():
+    def slow_square(i: int) -> int:
+        time.sleep(0.01 * (5 - i))  # later items finish first
+        return i * i
+
+    assert iterator_tools.map_concurrently(slow_square, range(5), max_workers=3) == [0, 1, 4, 9, 16]
+
+
+def test_map_concurrently_bounds_running_calls():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def call(_: int) -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    iterator_tools.map_concurrently(call, range(10), max_workers=2)
+    assert max_running <= 2
+
+
+def test_map_concurrently_reraises_errors():
+    def fail_on_two(i: int) -> int:
+        if i == 2:
+            raise RuntimeError("boom")
+        return i
+
+    with pytest.raises(RuntimeError, match="boom"):
+        iterator_tools.map_concurrently(fail_on_two, range(4))
+
+
+def test_map_concurrently_rejects_bad_limit():
+    with pytest.raises(ValueError):
+        iterator_tools.map_concurrently(str, [1], max_workers=0)
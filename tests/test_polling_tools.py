@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from nominal._utils.polling_tools import PollBackoff
+from tests.conftest import FakeClock
+
+
+def test_poll_backoff_doubles_up_to_max_interval(fake_polling_clock: FakeClock):
+    backoff = PollBackoff(timedelta(seconds=1), timedelta(seconds=5))
+    assert all(backoff.wait() for _ in range(5))
+    assert fake_polling_clock.sleeps == [1, 2, 4, 5, 5]
+
+
+def test_poll_backoff_jitter_shortens_waits(fake_polling_clock: FakeClock):
+    backoff = PollBackoff(timedelta(seconds=2), timedelta(seconds=8), jitter=True)
+    assert all(backoff.wait() for _ in range(4))
+    assert fake_polling_clock.sleeps == [1, 2, 4, 4]
+
+
+def test_poll_backoff_stops_at_timeout(fake_polling_clock: FakeClock):
+    backoff = PollBackoff(timedelta(seconds=2), timedelta(seconds=30), timeout=timedelta(seconds=5))
+    assert backoff.wait()
+    assert backoff.wait()
+    assert not backoff.wait()
+    assert fake_polling_clock.sleeps == [2, 3]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import gzip
+import io
+from typing import BinaryIO, Iterator
+
+import pytest
+
+from nominal._utils import streaming_tools
+
+
+def test_write_gzip_members_forms_a_single_gzip_file_in_order():
+    chunks = [f"chunk {idx}\n".encode() * (idx + 1) for idx in range(50)]
+    out = io.BytesIO()
+
+    streaming_tools.write_gzip_members(iter(chunks), out, max_workers=3)
+
+    assert gzip.decompress(out.getvalue()) == b"".join(chunks)
+    with gzip.open(io.BytesIO(out.getvalue())) as f:
+        assert f.read() == b"".join(chunks)
+
+
+def test_pipe_from_writer_fails_reads_when_writer_fails():
+    def write(w: BinaryIO) -> None:
+        def chunks() -> Iterator[bytes]:
+            yield b"complete"
+            raise RuntimeError("failed to produce chunk")
+
+        streaming_tools.write_gzip_members(chunks(), w, max_workers=2)
+
+    with pytest.raises(RuntimeError, match="failed to produce chunk"):
+        with streaming_tools.pipe_from_writer(write) as reader:
+            # everything written before the failure is readable, then the failure is raised in place of EOF
+            assert gzip.decompress(reader.read(len(gzip.compress(b"complete")))) == b"complete"
+            reader.read()
+
+
+def test_pipe_from_writer_streams_what_is_written():
+    with streaming_tools.pipe_from_writer(lambda w: streaming_tools.write_gzip_members([b"a", b"b"], w)) as reader:
+        assert gzip.decompress(reader.read()) == b"ab"
+
+
+def test_write_gzip_members_rejects_no_workers():
+    with pytest.raises(ValueError, match="max_workers"):
+        streaming_tools.write_gzip_members([b"data"], io.BytesIO(), max_workers=0)
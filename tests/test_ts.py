@@ -4,10 +4,13 @@ import time
 from datetime import datetime, timedelta
 
 import dateutil.parser
+import numpy as np
+import pandas as pd
+import polars as pl
 import pytest
 
 from nominal import ts
-from nominal.ts import _to_api_duration
+from nominal.ts import _to_api_duration, _to_nanoseconds_array
 
 
 @pytest.mark.parametrize(
@@ -125,3 +128,78 @@ def test_to_api_duration_encodes_the_same_split_for_both_input_types(duration, e
     api_duration = _to_api_duration(duration)
 
     assert (api_duration.seconds, api_duration.nanos) == expected
+
+
+def test_from_flexible_keeps_nanoseconds_of_strings() -> None:
+    assert ts._SecondsNanos.from_flexible("2021-01-31T19:00:00.123456789Z") == ts._SecondsNanos(1612119600, 123456789)
+    assert ts._SecondsNanos.from_flexible("2021-01-31T20:00:00,5+01:00") == ts._SecondsNanos(1612119600, 500_000_000)
+    assert ts._SecondsNanos.from_flexible("Sun Jan 31 19:00:00 2021 UTC") == ts._SecondsNanos(1612119600, 0)
+
+
+ISO_TIMESTAMPS = ["2021-01-31T19:00:00.123456789Z", "2021-01-31T14:00:00-05:00", "1969-12-31T23:59:59.5Z"]
+ISO_NANOSECONDS = [1612119600123456789, 1612119600000000000, -500_000_000]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param(ISO_TIMESTAMPS, id="list"),
+        pytest.param(np.array(ISO_TIMESTAMPS), id="numpy"),
+        pytest.param(pd.Series(ISO_TIMESTAMPS), id="pandas"),
+        pytest.param(pl.Series(ISO_TIMESTAMPS), id="polars"),
+        pytest.param(pd.Series(pd.to_datetime(ISO_TIMESTAMPS, format="ISO8601", utc=True)), id="pandas-datetime"),
+        pytest.param(pl.Series(ISO_TIMESTAMPS).str.to_datetime(time_unit="ns"), id="polars-datetime"),
+        pytest.param(np.array(ISO_NANOSECONDS), id="numpy-nanoseconds"),
+    ],
+)
+def test_to_nanoseconds_array_converts_columns(values) -> None:
+    nanos = _to_nanoseconds_array(values)
+    assert nanos.dtype == np.int64
+    assert nanos.tolist() == ISO_NANOSECONDS
+
+
+def test_to_nanoseconds_array_matches_from_flexible() -> None:
+    values = [
+        "2021-01-31T19:00:00",
+        "Sun Jan 31 19:00:00 2021",
+        "2021-01-31 19:00:00.000000001+00:00",
+        datetime(2021, 1, 31, 19),
+        1612119600000000000,
+    ]
+    expected = [ts._SecondsNanos.from_flexible(value).to_nanoseconds() for value in values]
+    assert _to_nanoseconds_array(values).tolist() == expected
+    assert _to_nanoseconds_array([v for v in values if isinstance(v, str)]).tolist() == expected[:3]
+
+
+@pytest.mark.parametrize(
+    ("values", "timestamp_type", "expected"),
+    [
+        ([1612119600, 1.5], "epoch_seconds", [1612119600_000_000_000, 1_500_000_000]),
+        ([1500, 2], ts.Epoch("picoseconds"), [1, 0]),
+        ([1, 0.25], ts.Epoch("days"), [86_400_000_000_000, 21_600_000_000_000]),
+        (
+            [0.5],
+            ts.Relative("milliseconds", start=datetime.fromisoformat("2021-01-31T19:00:00+00:00")),
+            [1612119600_000_500_000],
+        ),
+    ],
+)
+def test_to_nanoseconds_array_scales_numeric_units(values, timestamp_type, expected) -> None:
+    assert _to_nanoseconds_array(np.array(values), timestamp_type).tolist() == expected
+    assert _to_nanoseconds_array(pl.Series(np.array(values)), timestamp_type).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    ("values", "timestamp_type"),
+    [
+        ([1.5], None),
+        ([1], "iso_8601"),
+        (["2021-01-31T19:00:00Z"], "epoch_seconds"),
+        ([1.0, float("nan")], "epoch_seconds"),
+        (pl.Series(["2021-01-31T19:00:00Z", None]), None),
+        (["not a timestamp"], None),
+    ],
+)
+def test_to_nanoseconds_array_rejects_invalid_timestamps(values, timestamp_type) -> None:
+    with pytest.raises(ValueError):
+        _to_nanoseconds_array(values, timestamp_type)
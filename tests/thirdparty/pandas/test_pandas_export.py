@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import gzip
+import io
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from nominal_api import scout_compute_api, scout_dataexport_api
+from nominal_api.api import Timestamp
+
+from nominal.core.channel import Channel, ChannelDataType
+from nominal.core.datasource import DataSource
+from nominal.thirdparty.pandas import (
+    _pandas,
+    channel_to_dataframe_decimated,
+    channel_to_series,
+    datasource_to_dataframe,
+    iter_datasource_dataframes,
+)
+from nominal.ts import _SecondsNanos
+
+SECOND_NS = 1_000_000_000
+
+
+def _datasource(points: dict[str, list[int]]) -> tuple[DataSource, list[tuple[int, int]]]:
+    """A datasource whose export service serves `points[channel]` (second offsets) as a gzipped CSV.
+
+    Each value equals its timestamp's second offset, so tests can check rows line up after joining.
+    """
+    clients = MagicMock()
+    requested: list[tuple[int, int]] = []
+
+    def export_channel_data(auth_header: str, request: scout_dataexport_api.ExportDataRequest) -> io.BytesIO:
+        start = _SecondsNanos.from_api(request.start_time).to_nanoseconds()
+        end = _SecondsNanos.from_api(request.end_time).to_nanoseconds()
+        requested.append((start, end))
+        names = [channel.column_name for channel in request.channels.time_domain.channels]
+        rows: dict[int, dict[str, int]] = {}
+        for name in names:
+            for second in points.get(name, []):
+                if start <= second * SECOND_NS < end:
+                    rows.setdefault(second, {})[name] = second
+        df = pd.DataFrame(
+            {
+                "timestamp": [pd.Timestamp(second * SECOND_NS, tz="UTC").isoformat() for second in sorted(rows)],
+                **{name: [rows[second].get(name) for second in sorted(rows)] for name in names},
+            }
+        )
+        return io.BytesIO(gzip.compress(df.to_csv(index=False).encode()))
+
+    clients.dataexport.export_channel_data.side_effect = export_channel_data
+    return DataSource(rid="ri.datasource.abc", _clients=clients), requested
+
+
+def _channels(datasource: DataSource, *names: str) -> list[Channel]:
+    return [
+        Channel(
+            name=name,
+            data_source=datasource.rid,
+            data_type=ChannelDataType.DOUBLE,
+            unit=None,
+            description=None,
+            _clients=datasource._clients,
+        )
+        for name in names
+    ]
+
+
+def test_iter_datasource_dataframes_yields_joined_slices_in_order() -> None:
+    datasource, requested = _datasource({"a": [0, 1, 5, 9], "b": [1, 2, 9]})
+    channels = _channels(datasource, "a", "b")
+
+    frames = list(
+        iter_datasource_dataframes(
+            datasource, 0, 10 * SECOND_NS, timedelta(seconds=4), channels=channels, channel_batch_size=1
+        )
+    )
+
+    assert [frame.index.min().second for frame in frames] == [0, 5, 9]
+    joined = pd.concat(frames)
+    assert joined.equals(datasource_to_dataframe(datasource, start=0, end=10 * SECOND_NS, channels=channels))
+    assert joined.loc[pd.Timestamp(1 * SECOND_NS, tz="UTC")].tolist() == [1, 1]
+    assert sorted(set(requested)) == [
+        (0, 4 * SECOND_NS),
+        (0, 10 * SECOND_NS),
+        (4 * SECOND_NS, 8 * SECOND_NS),
+        (8 * SECOND_NS, 10 * SECOND_NS),
+    ]
+
+
+def test_iter_datasource_dataframes_skips_empty_slices() -> None:
+    datasource, _ = _datasource({"a": [0, 9]})
+
+    frames = list(
+        iter_datasource_dataframes(
+            datasource, 0, 10 * SECOND_NS, timedelta(seconds=2), channels=_channels(datasource, "a")
+        )
+    )
+
+    assert [frame["a"].tolist() for frame in frames] == [[0], [9]]
+
+
+def test_iter_datasource_dataframes_narrows_slices_toward_target_frame_size() -> None:
+    datasource, requested = _datasource({"a": list(range(100))})
+
+    frames = list(
+        iter_datasource_dataframes(
+            datasource,
+            0,
+            100 * SECOND_NS,
+            timedelta(seconds=40),
+            channels=_channels(datasource, "a"),
+            max_frame_bytes=20 * 16,
+        )
+    )
+
+    # the first slice is 40 rows of 16 bytes (index + value); every later slice is narrowed to fit 20 rows
+    assert [len(frame) for frame in frames] == [40, 20, 20, 20]
+    assert pd.concat(frames)["a"].tolist() == list(range(100))
+    assert requested[1] == (40 * SECOND_NS, 60 * SECOND_NS)
+
+
+def test_iter_datasource_dataframes_rejects_empty_slices() -> None:
+    datasource, _ = _datasource({})
+    with pytest.raises(ValueError):
+        list(iter_datasource_dataframes(datasource, 0, SECOND_NS, timedelta(0), channels=_channels(datasource, "a")))
+
+
+def _csv_channel(data_type: ChannelDataType, csv: str) -> Channel:
+    """A channel whose export service serves the given CSV, gzipped."""
+    clients = MagicMock()
+    clients.dataexport.export_channel_data.return_value = io.BytesIO(gzip.compress(csv.encode()))
+    return Channel(
+        name="value", data_source="ri.ds", data_type=data_type, unit=None, description=None, _clients=clients
+    )
+
+
+def test_channel_to_series_types_values_by_channel_data_type() -> None:
+    csv = "timestamp,value\n2024-01-01T00:00:00Z,1\n2024-01-01T00:00:00.5Z,2\n2024-01-01T00:00:01.123456789Z,3\n"
+
+    series = channel_to_series(_csv_channel(ChannelDataType.DOUBLE, csv))
+
+    assert series.name == "value"
+    assert series.dtype == "float64"
+    assert series.tolist() == [1.0, 2.0, 3.0]
+    assert series.index.name == "timestamp"
+    assert str(series.index.dtype) == "datetime64[ns, UTC]"
+    assert series.index.asi8.tolist() == [1704067200000000000, 1704067200500000000, 1704067201123456789]
+
+
+def test_channel_to_series_reads_missing_strings_as_nan() -> None:
+    csv = "timestamp,value\n2024-01-01T00:00:00Z,on\n2024-01-01T00:00:01Z,\n"
+
+    series = channel_to_series(_csv_channel(ChannelDataType.STRING, csv))
+
+    assert series.iloc[0] == "on"
+    assert pd.isna(series.iloc[1])
+
+
+def _read_untyped(csv: str) -> pd.Series[Any]:
+    """Read an export of a channel with no known data type, as `datasource_to_dataframe` does."""
+    channel = Channel(
+        name="value", data_source="ri.ds", data_type=None, unit=None, description=None, _clients=MagicMock()
+    )
+    df = _pandas._read_export_csv(
+        io.BytesIO(csv.encode()), [channel], "timestamp", enable_gzip=False, absolute_timestamps=True
+    )
+    return df["value"]
+
+
+def test_read_export_csv_infers_untyped_channels_from_all_values() -> None:
+    rows = [f"2024-01-01T00:00:{idx // 10:02d}.{idx % 10}Z" for idx in range(151)]
+    csv = "timestamp,value\n" + "".join(f"{row},{idx}\n" for idx, row in enumerate(rows[:150])) + f"{rows[150]},1.5\n"
+
+    series = _read_untyped(csv)
+
+    assert series.dtype == "float64"
+    assert series.iloc[-1] == 1.5
+    assert len(series) == 151
+
+
+def test_read_export_csv_reads_empty_untyped_channels_as_nan() -> None:
+    rows = "".join(f"2024-01-01T00:00:{idx:02d}Z,\n" for idx in range(50))
+    csv = "timestamp,value\n" + rows + "2024-01-01T00:01:00Z,2\n"
+
+    series = _read_untyped(csv)
+
+    assert series.dtype == "float64"
+    assert series.isna().sum() == 50
+    assert series.iloc[-1] == 2.0
+
+
+def test_channel_to_series_keeps_relative_timestamps_numeric() -> None:
+    csv = "timestamp,value\n0,1\n1500,2\n"
+
+    series = channel_to_series(
+        _csv_channel(ChannelDataType.INT, csv), relative_to=0, relative_resolution="milliseconds"
+    )
+
+    assert series.dtype == "int64"
+    assert series.index.tolist() == [0, 1500]
+
+
+def test_channel_to_dataframe_decimated_builds_bucket_frame() -> None:
+    timestamps = [Timestamp(seconds=1_700_000_000, nanos=5), Timestamp(seconds=1_700_000_001, nanos=999_999_999)]
+    buckets = [
+        scout_compute_api.NumericBucket(aggregations={}, min=0.0, max=2.0, mean=1.0, count=3, variance=0.5),
+        scout_compute_api.NumericBucket(aggregations={}, min=1.0, max=1.0, mean=1.0, count=1),
+    ]
+    channel = MagicMock()
+    channel._decimate_request.return_value = MagicMock(
+        numeric=None, bucketed_numeric=scout_compute_api.BucketedNumericPlot(timestamps=timestamps, buckets=buckets)
+    )
+
+    df = channel_to_dataframe_decimated(channel, 0, 1, buckets=2)
+
+    assert df.columns.tolist() == ["min", "max", "mean", "count", "variance"]
+    assert df["count"].tolist() == [3, 1]
+    assert df["variance"].iloc[0] == 0.5
+    assert pd.isna(df["variance"].iloc[1])
+    assert df.index.name == "timestamp"
+    assert df.index.asi8.tolist() == [1_700_000_000_000_000_005, 1_700_000_001_999_999_999]
+    assert str(df.index.dtype) == "datetime64[ns, UTC]"
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import gzip
+import io
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from nominal import ts
+from nominal.core.filetype import FileTypes
+from nominal.thirdparty.pandas import _pandas, upload_dataframe_to_dataset
+
+
+@pytest.fixture
+def uploads() -> tuple[MagicMock, list[dict[str, Any]]]:
+    """A dataset recording the contents and arguments of each upload."""
+    uploaded: list[dict[str, Any]] = []
+
+    def add_from_io(reader: io.BufferedReader, **kwargs: Any) -> MagicMock:
+        uploaded.append({"data": reader.read(), **kwargs})
+        return MagicMock()
+
+    dataset = MagicMock()
+    dataset.add_from_io.side_effect = add_from_io
+    return dataset, uploaded
+
+
+def test_upload_dataframe_to_dataset_as_csv_by_default(
+    uploads: tuple[MagicMock, list[dict[str, Any]]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # compress one row at a time, as separate gzip members
+    monkeypatch.setattr(_pandas, "_CSV_BLOCK_CELLS", 2)
+    dataset, uploaded = uploads
+    df = pd.DataFrame({"time": [1.0, 2.0, 3.0], "value": [3.0, 4.0, 5.0]})
+
+    upload_dataframe_to_dataset(dataset, df, "time", "epoch_seconds", wait_until_complete=False)
+
+    (upload,) = uploaded
+    assert upload["file_type"] == FileTypes.CSV_GZ
+    assert upload["timestamp_type"] == "epoch_seconds"
+    assert gzip.decompress(upload["data"]).decode() == df.to_csv()
+
+
+def test_upload_dataframe_to_dataset_as_parquet_in_row_groups(
+    uploads: tuple[MagicMock, list[dict[str, Any]]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_pandas, "_PARQUET_ROW_GROUP_SIZE", 2)
+    dataset, uploaded = uploads
+    times = pd.date_range("2024-01-01", periods=5, freq="s", tz="America/New_York", name="time")
+    df = pd.DataFrame(
+        {
+            "value": np.arange(5, dtype=np.float64),
+            "state": ["a", "b", None, "d", "e"],
+            "received": times.tz_convert("UTC"),
+        },
+        index=times,
+    )
+
+    upload_dataframe_to_dataset(
+        dataset, df, "time", ts.EPOCH_NANOSECONDS, wait_until_complete=False, file_format="parquet"
+    )
+
+    (upload,) = uploaded
+    assert upload["file_type"] == FileTypes.PARQUET
+    assert upload["timestamp_type"] == ts.EPOCH_NANOSECONDS
+    parquet = pl.read_parquet(io.BytesIO(upload["data"]))
+    assert parquet.columns == ["time", "value", "state", "received"]
+    assert parquet["time"].to_list() == times.as_unit("ns").asi8.tolist()
+    assert parquet["value"].to_list() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert parquet["state"].to_list() == ["a", "b", None, "d", "e"]
+    assert parquet["received"].dtype == pl.Datetime("ns", "UTC")
+    assert parquet["received"].dt.epoch("ns").to_list() == times.as_unit("ns").asi8.tolist()
+
+
+def test_upload_dataframe_to_dataset_as_parquet_rejects_other_types_for_datetimes(
+    uploads: tuple[MagicMock, list[dict[str, Any]]],
+) -> None:
+    dataset, uploaded = uploads
+    df = pd.DataFrame({"time": pd.date_range("2024-01-01", periods=2, freq="s"), "value": [3.0, 4.0]})
+
+    # datetimes are uploaded as integral nanoseconds, which would not parse as the requested type
+    with pytest.raises(ValueError, match="EPOCH_NANOSECONDS"):
+        upload_dataframe_to_dataset(dataset, df, "time", ts.ISO_8601, file_format="parquet")
+    assert uploaded == []
+
+
+def test_upload_dataframe_to_dataset_as_parquet_requires_recent_polars(
+    uploads: tuple[MagicMock, list[dict[str, Any]]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pl, "__version__", "1.26.1")
+    dataset, uploaded = uploads
+    df = pd.DataFrame({"time": [1.0, 2.0], "value": [3.0, 4.0]})
+
+    with pytest.raises(ImportError, match="polars>=1.27"):
+        upload_dataframe_to_dataset(dataset, df, "time", "epoch_seconds", file_format="parquet")
+    assert uploaded == []
+
+
+def test_parquet_source_applies_pushed_down_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The IO source projects, filters, and limits rows as polars asks, rather than always producing everything."""
+    monkeypatch.setattr(_pandas, "_PARQUET_ROW_GROUP_SIZE", 2)
+    sources: list[Any] = []
+
+    def register_io_source(io_source: Any, *, schema: Any) -> MagicMock:
+        sources.append(io_source)
+        return MagicMock()
+
+    monkeypatch.setattr("polars.io.plugins.register_io_source", register_io_source)
+    df = pd.DataFrame({"time": [1.0, 2.0, 3.0, 4.0, 5.0], "value": [3.0, 4.0, 5.0, 6.0, 7.0]})
+    _pandas._write_parquet(df, io.BytesIO(), "time")
+
+    (source,) = sources
+    batches = list(source(["value"], pl.col("value") > 3.5, 3, None))
+    assert pl.concat(batches).to_dict(as_series=False) == {"value": [4.0, 5.0, 6.0]}
+    assert all(batch.columns == ["value"] for batch in batches)
+    assert pl.concat(list(source(None, None, None, None))).height == 5
+
+
+def test_upload_dataframe_to_dataset_raises_write_errors(
+    uploads: tuple[MagicMock, list[dict[str, Any]]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(*_: Any) -> None:
+        raise RuntimeError("cannot convert")
+
+    monkeypatch.setattr(_pandas, "_write_parquet", fail)
+    dataset, uploaded = uploads
+    df = pd.DataFrame({"time": [1.0, 2.0], "value": [3.0, 4.0]})
+
+    with pytest.raises(RuntimeError, match="cannot convert"):
+        upload_dataframe_to_dataset(dataset, df, "time", "epoch_seconds", file_format="parquet")
+    # the failure is raised while the upload reads the file, so it is never completed or ingested
+    assert uploaded == []
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import datetime
+import pathlib
+from unittest.mock import MagicMock
+
+import polars as pl
+import pytest
+
+from nominal.core.channel import ChannelDataType
+from nominal.thirdparty.polars import polars_export_handler
+from nominal.thirdparty.polars.polars_export_cache import ExportCache
+from nominal.thirdparty.polars.polars_export_handler import PolarsExportHandler, _ExportJob, _TimeRange
+
+TS = polars_export_handler._INTERNAL_TS_COL
+
+
+class FakeExport:
+    """Exports one point per 10ns for each channel, recording the ranges requested."""
+
+    def __init__(self, channel_names: list[str]) -> None:
+        """Export the given channels."""
+        self.channel_names = channel_names
+        self.requested: list[tuple[int, int]] = []
+
+    def __call__(self, start: int, end: int) -> pl.DataFrame:
+        self.requested.append((start, end))
+        timestamps = [float(ts) for ts in range(start, end, 10)]
+        return pl.DataFrame({TS: timestamps, **{name: timestamps for name in self.channel_names}})
+
+
+def _load(cache: ExportCache, fetch: FakeExport, start: int, end: int) -> pl.DataFrame:
+    frames = cache.load(
+        datasource_rid="ri.ds",
+        channel_names=fetch.channel_names,
+        tags={"vehicle": "alpha"},
+        options="epoch_seconds",
+        start=start,
+        end=end,
+        time_column=TS,
+        fetch=fetch,
+    )
+    return polars_export_handler._merge_dfs(frames).select(TS, *fetch.channel_names)
+
+
+def test_cached_ranges_are_not_exported_again(tmp_path: pathlib.Path) -> None:
+    cache = ExportCache(tmp_path)
+    fetch = FakeExport(["a", "b"])
+
+    first = _load(cache, fetch, 100, 200)
+    assert _load(cache, fetch, 100, 200).equals(first)
+    assert fetch.requested == [(100, 200)]
+
+    # only the uncovered ends of a wider range are exported
+    wider = _load(cache, fetch, 0, 300)
+    assert fetch.requested == [(100, 200), (0, 100), (200, 300)]
+    assert wider[TS].to_list() == [float(ts) for ts in range(0, 300, 10)]
+
+    # the cache outlives the instance
+    fetch.requested.clear()
+    assert _load(ExportCache(tmp_path), fetch, 0, 300).equals(wider)
+    assert fetch.requested == []
+
+
+def test_channels_with_different_coverage_share_exports(tmp_path: pathlib.Path) -> None:
+    cache = ExportCache(tmp_path)
+    _load(cache, FakeExport(["a"]), 0, 100)
+
+    fetch = FakeExport(["a", "b"])
+    df = _load(cache, fetch, 50, 150)
+    # "a" is cached over [0, 100), which straddles the start of the request, so the whole range is exported
+    assert fetch.requested == [(50, 150)]
+    assert df[TS].to_list() == [float(ts) for ts in range(50, 150, 10)]
+    assert df["a"].to_list() == df["b"].to_list()
+
+
+def test_least_recently_used_files_are_evicted(tmp_path: pathlib.Path) -> None:
+    fetch = FakeExport(["a"])
+    _load(ExportCache(tmp_path), fetch, 0, 100)
+    _load(ExportCache(tmp_path), fetch, 100, 200)
+    max_bytes = ExportCache(tmp_path).size_bytes
+
+    cache = ExportCache(tmp_path, max_bytes=max_bytes)
+    # reading the first segment makes the second the least recently used
+    _load(cache, fetch, 0, 100)
+    _load(cache, fetch, 200, 300)
+    assert sorted(path.name for path in tmp_path.glob("*/*.parquet")) == ["0_100.parquet", "200_300.parquet"]
+    assert cache.size_bytes <= max_bytes
+
+    cache.clear()
+    assert cache.size_bytes == 0
+    assert list(tmp_path.glob("*/*.parquet")) == []
+
+
+def _job(channel_names: list[str], start: int, end: int, **kwargs: object) -> _ExportJob:
+    return _ExportJob(
+        datasource_rid="ri.ds",
+        channel_names=channel_names,
+        channel_types={name: ChannelDataType.DOUBLE for name in channel_names},
+        time_slice=_TimeRange(start, end),
+        tags={},
+        template=MagicMock(file_format="csv"),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+@pytest.fixture
+def fake_export_job(monkeypatch: pytest.MonkeyPatch) -> list[_ExportJob]:
+    requested: list[_ExportJob] = []
+
+    def export_job(job: _ExportJob, client: object) -> pl.DataFrame:
+        requested.append(job)
+        fetch = FakeExport([name for name in job.channel_names if name != "empty"])
+        return fetch(job.time_slice.start_time, job.time_slice.end_time)
+
+    monkeypatch.setattr(polars_export_handler, "_export_job", export_job)
+    return requested
+
+
+def test_handler_serves_historical_exports_from_cache(
+    tmp_path: pathlib.Path, mock_client: MagicMock, fake_export_job: list[_ExportJob]
+) -> None:
+    handler = PolarsExportHandler(client=mock_client, cache=ExportCache(tmp_path))
+    job = _job(["a", "empty"], 0, 100)
+
+    first = handler._run_export_job(job)
+    assert handler._run_export_job(job).equals(first)
+    assert len(fake_export_job) == 1
+    assert first.columns == [TS, "a", "empty"]
+    assert first.schema["empty"] == pl.Float64
+    assert first["empty"].null_count() == len(first)
+
+
+def test_handler_bypasses_cache_for_recent_or_decimated_exports(
+    tmp_path: pathlib.Path, mock_client: MagicMock, fake_export_job: list[_ExportJob]
+) -> None:
+    handler = PolarsExportHandler(client=mock_client, cache=ExportCache(tmp_path, min_age=datetime.timedelta(days=1)))
+    recent_end = int(datetime.datetime.now().timestamp() * 1e9)
+
+    for job in [_job(["a"], recent_end - 100, recent_end), _job(["a"], 0, 100, buckets=10)]:
+        handler._run_export_job(job)
+        handler._run_export_job(job)
+    assert len(fake_export_job) == 4
+    assert list(tmp_path.iterdir()) == []
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import gzip
+import io
+import threading
+import time
 from unittest.mock import MagicMock
 
+import polars as pl
 import pytest
 from nominal_api import api, scout_compute_api
 
 from nominal.core.channel import ChannelDataType
+from nominal.thirdparty.polars import polars_export_handler
 from nominal.thirdparty.polars.polars_export_handler import (
     PolarsExportHandler,
     _batch_channel_points_per_second,
@@ -371,7 +377,7 @@ def test_groups_include_zero_rate_channels(make_channel):
 
 
 def test_compute_export_jobs_excludes_zero_and_none_pps_channels(
-    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response, make_series_count_response
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
 ):
     """Channels whose rate estimate is 0.0 or None are excluded from export jobs.
 
@@ -383,9 +389,6 @@ def test_compute_export_jobs_excludes_zero_and_none_pps_channels(
         make_channel("none_rate", ChannelDataType.DOUBLE),
         make_channel("zero_rate", ChannelDataType.DOUBLE),
     ]
-    # Data-presence filter: all three channels pass — the cheap pre-filter doesn't catch
-    # every "no data" case, so the exclusion must be enforced after PPS compute too.
-    mock_clients.datasource.batch_get_series_count.return_value = make_series_count_response([1, 1, 1])
     # PPS estimation: "known" gets a positive rate, "none_rate" errors (None), "zero_rate"
     # succeeds with no buckets (0.0).
     mock_client._clients.compute.batch_compute_with_units.return_value = MagicMock(
@@ -404,7 +407,7 @@ def test_compute_export_jobs_excludes_zero_and_none_pps_channels(
 
 
 def test_compute_export_jobs_handles_cross_datasource_name_collision(
-    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response, make_series_count_response
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
 ):
     """Two channels sharing a name but different datasources both appear with correct attributes.
 
@@ -416,7 +419,6 @@ def test_compute_export_jobs_handles_cross_datasource_name_collision(
         make_channel("temp", ChannelDataType.DOUBLE, data_source="ds-a"),
         make_channel("temp", ChannelDataType.INT, data_source="ds-b"),
     ]
-    mock_clients.datasource.batch_get_series_count.return_value = make_series_count_response([1, 1])
     mock_client._clients.compute.batch_compute_with_units.return_value = MagicMock(
         results=[
             make_compute_result(success=make_numeric_response([50, 100])),
@@ -438,7 +440,7 @@ def test_compute_export_jobs_handles_cross_datasource_name_collision(
 
 
 def test_export_excludes_unsupported_channel_types(
-    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response, make_series_count_response
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
 ):
     """export() filters out LOG/UNKNOWN channels so only DOUBLE/INT/STRING reach the API pipeline."""
     channels = [
@@ -447,8 +449,7 @@ def test_export_excludes_unsupported_channel_types(
         make_channel("mystery", ChannelDataType.UNKNOWN),
     ]
     # Wire up just enough of the pipeline that it can reach (but not necessarily complete)
-    # the data-presence check — which is what we care about observing.
-    mock_clients.datasource.batch_get_series_count.return_value = make_series_count_response([1])
+    # the point rate estimation — which is what we care about observing.
     mock_client._clients.compute.batch_compute_with_units.return_value = MagicMock(
         results=[make_compute_result(success=make_numeric_response([50, 100]))]
     )
@@ -461,16 +462,47 @@ def test_export_excludes_unsupported_channel_types(
     with contextlib.suppress(Exception):
         list(handler.export(channels, start=0, end=TEN_SECONDS_NS))
 
-    # Only the DOUBLE channel reached the data-presence API — LOG/UNKNOWN were filtered upstream.
-    request = mock_clients.datasource.batch_get_series_count.call_args[0][1]
-    assert [req.channel for req in request.requests] == ["temp"]
+    # Only the DOUBLE channel reached the compute API — LOG/UNKNOWN were filtered upstream.
+    request = mock_client._clients.compute.batch_compute_with_units.call_args.kwargs["request"]
+    assert len(request.requests) == 1
+
+
+def test_compute_export_jobs_batches_rate_estimates_per_datasource_and_reuses_them(
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
+):
+    """Each compute request covers one datasource, and repeated planning over the same range reuses estimates."""
+    channels = [
+        make_channel("a", data_source="ds-a"),
+        make_channel("b", data_source="ds-b"),
+        make_channel("c", data_source="ds-a"),
+    ]
+    compute = mock_client._clients.compute.batch_compute_with_units
+    compute.side_effect = lambda auth_header, request: MagicMock(
+        results=[make_compute_result(success=make_numeric_response([50, 100])) for _ in request.requests]
+    )
+
+    handler = PolarsExportHandler(client=mock_client)
+    first = handler._compute_export_jobs(channels, _TimeRange(0, TEN_SECONDS_NS), timestamp_type="epoch_seconds")
+    assert sorted(len(call.kwargs["request"].requests) for call in compute.call_args_list) == [1, 2]
+    mock_clients.datasource.batch_get_series_count.assert_not_called()
+
+    again = handler._compute_export_jobs(channels, _TimeRange(0, TEN_SECONDS_NS), timestamp_type="epoch_seconds")
+    assert compute.call_count == 2
+    assert again == first
+
+    # a different range or set of tags is estimated afresh
+    handler._compute_export_jobs(channels, _TimeRange(0, TWENTY_SECONDS_NS), timestamp_type="epoch_seconds")
+    handler._compute_export_jobs(
+        channels, _TimeRange(0, TEN_SECONDS_NS), timestamp_type="epoch_seconds", tags={"vehicle": "alpha"}
+    )
+    assert compute.call_count == 6
 
 
 # -- large_channels sub-slice path --
 
 
 def test_compute_export_jobs_subdivides_large_channel_into_sub_slices(
-    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response, make_series_count_response
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
 ):
     """Channels exceeding the per-group rate budget are split into one job per sub-slice.
 
@@ -495,7 +527,6 @@ def test_compute_export_jobs_subdivides_large_channel_into_sub_slices(
     batch_duration = datetime.timedelta(seconds=10)
     channel = make_channel("firehose", ChannelDataType.DOUBLE)
 
-    mock_clients.datasource.batch_get_series_count.return_value = make_series_count_response([1])
     mock_client._clients.compute.batch_compute_with_units.return_value = MagicMock(
         results=[make_compute_result(success=make_numeric_response([1000, 1000]))]
     )
@@ -523,3 +554,250 @@ def test_compute_export_jobs_subdivides_large_channel_into_sub_slices(
     for a, b in zip(sub_ranges, sub_ranges[1:]):
         assert a.end_time == b.start_time
     assert all(r.duration_ns() < parent_slice.duration_ns() for r in sub_ranges)
+
+
+def test_compute_export_jobs_shares_request_templates_across_slices(
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
+):
+    """Requests for a channel group are resolved once; each slice's job only stamps its own time bounds."""
+    channels = [make_channel("a", ChannelDataType.DOUBLE), make_channel("b", ChannelDataType.STRING)]
+    mock_client._clients.compute.batch_compute_with_units.return_value = MagicMock(
+        results=[make_compute_result(success=make_numeric_response([50, 100])) for _ in channels]
+    )
+
+    handler = PolarsExportHandler(client=mock_client)
+    jobs = handler._compute_export_jobs(
+        channels,
+        _TimeRange(0, TEN_SECONDS_NS),
+        timestamp_type="epoch_seconds",
+        batch_duration=datetime.timedelta(seconds=2),
+    )
+
+    all_jobs = [job for job_list in jobs.values() for job in job_list]
+    assert len(jobs) == 5
+    assert len({id(job.template) for job in all_jobs}) == 1
+
+    requests = [job.export_request() for job in all_jobs]
+    assert {req.start_time.seconds for req in requests} == {0, 2, 4, 6, 8}
+    assert [ch.column_name for ch in requests[0].channels.time_domain.channels] == ["a", "b"]
+    mock_client.get_datasource.assert_not_called()
+    mock_clients.channel_metadata.batch_get_channel_metadata.assert_not_called()
+
+
+def test_arrow_export_reads_ipc_stream(
+    mock_client, mock_clients, make_channel, make_compute_result, make_numeric_response
+):
+    """With `file_format="arrow"`, jobs request Arrow and load the gzipped IPC stream without CSV parsing."""
+    channels = [make_channel("a", ChannelDataType.DOUBLE), make_channel("b", ChannelDataType.INT)]
+    mock_client._clients.compute.batch_compute_with_units.return_value = MagicMock(
+        results=[make_compute_result(success=make_numeric_response([50, 100])) for _ in channels]
+    )
+    handler = PolarsExportHandler(client=mock_client, file_format="arrow")
+    jobs = handler._compute_export_jobs(channels, _TimeRange(0, TEN_SECONDS_NS), timestamp_type="epoch_seconds")
+    (job,) = [job for job_list in jobs.values() for job in job_list]
+
+    # integer-valued doubles arrive as ints when every value in the export is whole
+    exported = pl.DataFrame({"timestamp": [2.0, 1.0], "a": [1, 2], "b": [3, None]})
+    payload = io.BytesIO()
+    exported.write_ipc_stream(payload)
+    mock_client._clients.dataexport.export_channel_data.return_value = io.BytesIO(gzip.compress(payload.getvalue()))
+
+    df = polars_export_handler._export_job(job, mock_client)
+
+    request = mock_client._clients.dataexport.export_channel_data.call_args[0][1]
+    assert request.format.arrow is not None
+    assert df.schema == pl.Schema({polars_export_handler._INTERNAL_TS_COL: pl.Float64, "a": pl.Float64, "b": pl.Int64})
+    assert df[polars_export_handler._INTERNAL_TS_COL].to_list() == [1.0, 2.0]
+
+
+# -- export_slices --
+
+
+def test_export_slices_yields_empty_slices_and_skips_failed_ones(mock_client, monkeypatch):
+    """Slices with no data are still reported, but a slice with a failed request is not reported at all."""
+    slices = [_TimeRange(0, 10), _TimeRange(10, 20), _TimeRange(20, 30)]
+    jobs = {
+        time_slice: [MagicMock(time_slice=time_slice, name=f"job-{i}-{j}") for j in range(2)]
+        for i, time_slice in enumerate(slices)
+    }
+
+    def fake_export_job(job, client):
+        if job.time_slice == slices[1] and job is jobs[slices[1]][0]:
+            raise RuntimeError("export failed")
+        if job.time_slice == slices[2]:
+            return pl.DataFrame()
+        column = "a" if job is jobs[job.time_slice][0] else "b"
+        return pl.DataFrame({polars_export_handler._INTERNAL_TS_COL: [1.0, 2.0], column: [1.0, 2.0]})
+
+    monkeypatch.setattr(polars_export_handler, "_export_job", fake_export_job)
+    monkeypatch.setattr(PolarsExportHandler, "_plan_export", lambda self, *args: (jobs, [], "timestamp"))
+
+    handler = PolarsExportHandler(client=mock_client)
+    results = list(handler.export_slices([], start=0, end=30))
+
+    assert [(start, end) for start, end, _ in results] == [(0, 10), (20, 30)]
+    assert set(results[0][2].columns) == {"timestamp", "a", "b"}
+    assert results[1][2].is_empty()
+    # export() keeps the partial slice and drops empty ones, as before
+    assert [set(df.columns) for df in handler.export([MagicMock()], start=0, end=30)] == [
+        {"timestamp", "a", "b"},
+        {"timestamp", "b"},
+    ]
+
+
+# -- download scheduling --
+
+
+def _slice_jobs(num_slices: int, jobs_per_slice: int) -> dict[_TimeRange, list[MagicMock]]:
+    return {
+        _TimeRange(i * 10, (i + 1) * 10): [
+            MagicMock(time_slice=_TimeRange(i * 10, (i + 1) * 10)) for _ in range(jobs_per_slice)
+        ]
+        for i in range(num_slices)
+    }
+
+
+def _slice_frame(job: MagicMock) -> pl.DataFrame:
+    start = float(job.time_slice.start_time)
+    return pl.DataFrame({polars_export_handler._INTERNAL_TS_COL: [start], f"ch{id(job)}": [start]})
+
+
+def test_slow_request_does_not_stall_later_slices(mock_client, monkeypatch):
+    """Workers keep pulling jobs from later slices while one request of an earlier slice is slow."""
+    jobs = _slice_jobs(num_slices=3, jobs_per_slice=2)
+    slow_job = jobs[_TimeRange(0, 10)][0]
+    release_slow_job = threading.Event()
+    started: list[int] = []
+
+    def fake_export_job(job, client):
+        started.append(job.time_slice.start_time)
+        if job is slow_job:
+            assert release_slow_job.wait(5)
+        elif len(started) == 6:
+            # every other job has started while the first slice is still downloading
+            release_slow_job.set()
+        return _slice_frame(job)
+
+    monkeypatch.setattr(polars_export_handler, "_export_job", fake_export_job)
+    handler = PolarsExportHandler(client=mock_client, num_workers=2, max_buffered_slices=3)
+    results = list(handler._export_dataframes(jobs, "timestamp", join_batches=True))
+
+    assert [time_slice.start_time for time_slice, _ in results] == [0, 10, 20]
+    assert [df["timestamp"].to_list() for _, df in results] == [[0.0], [10.0], [20.0]]
+    assert sorted(started) == [0, 0, 10, 10, 20, 20]
+
+
+def test_buffered_slices_are_bounded(mock_client, monkeypatch):
+    """No job starts more than `max_buffered_slices` slices ahead of the slice last yielded."""
+    jobs = _slice_jobs(num_slices=5, jobs_per_slice=2)
+    yielded = 0
+    furthest_ahead = 0
+    lock = threading.Lock()
+
+    def fake_export_job(job, client):
+        nonlocal furthest_ahead
+        with lock:
+            furthest_ahead = max(furthest_ahead, job.time_slice.start_time // 10 - yielded)
+        time.sleep(0.001)
+        return _slice_frame(job)
+
+    monkeypatch.setattr(polars_export_handler, "_export_job", fake_export_job)
+    handler = PolarsExportHandler(client=mock_client, num_workers=8, max_buffered_slices=2)
+    for _ in handler._export_dataframes(jobs, "timestamp", join_batches=True):
+        time.sleep(0.005)
+        with lock:
+            yielded += 1
+
+    # only the slice being waited on and the one after it are ever downloading
+    assert furthest_ahead == 1
+
+
+def test_slices_are_merged_off_the_consumer_thread(mock_client, monkeypatch):
+    jobs = _slice_jobs(num_slices=2, jobs_per_slice=2)
+    merge_threads: set[str] = set()
+    merge = polars_export_handler._merge_dfs
+
+    def recording_merge(dfs):
+        merge_threads.add(threading.current_thread().name)
+        return merge(dfs)
+
+    monkeypatch.setattr(polars_export_handler, "_export_job", lambda job, client: _slice_frame(job))
+    monkeypatch.setattr(polars_export_handler, "_merge_dfs", recording_merge)
+    handler = PolarsExportHandler(client=mock_client)
+    results = list(handler._export_dataframes(jobs, "timestamp", join_batches=True))
+
+    assert [set(df.columns) - {"timestamp"} for _, df in results] == [
+        {f"ch{id(job)}" for job in slice_jobs} for slice_jobs in jobs.values()
+    ]
+    assert len(merge_threads) == 1
+    assert next(iter(merge_threads)).startswith("nominal-export-merge")
+
+
+def test_invalid_max_buffered_slices(mock_client):
+    with pytest.raises(ValueError):
+        PolarsExportHandler(client=mock_client, max_buffered_slices=0)
+
+
+def test_planning_overlaps_downloads_with_explicit_batch_duration(mock_client, make_channel, monkeypatch):
+    """With a fixed batch duration, the first datasource's jobs download while later datasources are planned."""
+    channels = [make_channel("a", data_source="ds-a"), make_channel("b", data_source="ds-b")]
+    downloading = threading.Event()
+
+    def fake_rates(client, channels, start, end, tags):
+        if channels[0].data_source == "ds-b":
+            assert downloading.wait(5)
+        return {(ch.data_source, ch.name): 1.0 for ch in channels}
+
+    def fake_export_job(job, client):
+        downloading.set()
+        start = float(job.time_slice.start_time)
+        return pl.DataFrame({polars_export_handler._INTERNAL_TS_COL: [start], job.channel_names[0]: [start]})
+
+    monkeypatch.setattr(polars_export_handler, "_channel_points_per_second", fake_rates)
+    monkeypatch.setattr(polars_export_handler, "_export_job", fake_export_job)
+    handler = PolarsExportHandler(client=mock_client)
+    results = list(
+        handler.export_slices(channels, start=0, end=TEN_SECONDS_NS, batch_duration=datetime.timedelta(seconds=5))
+    )
+
+    assert [(start, end) for start, end, _ in results] == [
+        (0, TEN_SECONDS_NS // 2),
+        (TEN_SECONDS_NS // 2, TEN_SECONDS_NS),
+    ]
+    assert all(set(df.columns) == {"timestamp", "a", "b"} for _, _, df in results)
+
+
+def test_datasources_are_planned_concurrently_up_to_num_workers(mock_client, make_channel, monkeypatch):
+    """Each datasource is planned on its own thread, with at most `num_workers` planned at once."""
+    channels = [make_channel(f"ch{idx}", data_source=f"ds-{idx}") for idx in range(4)]
+    # planning one datasource at a time would leave each waiting here for a partner that never arrives
+    pairs = threading.Barrier(2, timeout=5)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def fake_rates(client, channels, start, end, tags):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        pairs.wait()
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return {(ch.data_source, ch.name): 1.0 for ch in channels}
+
+    def fake_export_job(job, client):
+        start = float(job.time_slice.start_time)
+        return pl.DataFrame({polars_export_handler._INTERNAL_TS_COL: [start], job.channel_names[0]: [start]})
+
+    monkeypatch.setattr(polars_export_handler, "_channel_points_per_second", fake_rates)
+    monkeypatch.setattr(polars_export_handler, "_export_job", fake_export_job)
+    handler = PolarsExportHandler(client=mock_client, num_workers=2)
+    results = list(
+        handler.export_slices(channels, start=0, end=TEN_SECONDS_NS, batch_duration=datetime.timedelta(seconds=5))
+    )
+
+    assert all(set(df.columns) == {"timestamp", "ch0", "ch1", "ch2", "ch3"} for _, _, df in results)
+    assert len(results) == 2
+    assert max_running == 2
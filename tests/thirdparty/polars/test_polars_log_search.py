@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import polars as pl
+from nominal_api import scout_compute_api
+
+from nominal.thirdparty.polars.polars_log_search import search_logs_to_dataframe
+
+
+def test_search_logs_to_dataframe_builds_columns() -> None:
+    channel = MagicMock()
+    channel._search_log_pages.return_value = iter(
+        [
+            (
+                [1, 2],
+                [
+                    scout_compute_api.LogValue(args={"a": "1"}, id="1", message="one"),
+                    scout_compute_api.LogValue(args={}, id="2", message="two"),
+                ],
+            ),
+            ([3], [scout_compute_api.LogValue(args={"b": "x", "c": "y"}, id="3", message="three")]),
+        ]
+    )
+
+    df = search_logs_to_dataframe(channel, start=0, end=10, parallelism=2)
+
+    assert df.schema == pl.Schema(
+        {
+            "timestamp": pl.Datetime("ns", "UTC"),
+            "message": pl.String,
+            "args": pl.List(pl.Struct({"key": pl.String, "value": pl.String})),
+        }
+    )
+    assert df["timestamp"].dt.epoch("ns").to_list() == [1, 2, 3]
+    assert df["message"].to_list() == ["one", "two", "three"]
+    assert df["args"].to_list() == [
+        [{"key": "a", "value": "1"}],
+        [],
+        [{"key": "b", "value": "x"}, {"key": "c", "value": "y"}],
+    ]
+    assert channel._search_log_pages.call_args.kwargs["parallelism"] == 2
+
+
+def test_search_logs_to_dataframe_empty() -> None:
+    channel = MagicMock()
+    channel._search_log_pages.return_value = iter([])
+    df = search_logs_to_dataframe(channel)
+    assert df.height == 0
+    assert df.schema["timestamp"] == pl.Datetime("ns", "UTC")